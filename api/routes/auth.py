@@ -1,31 +1,30 @@
+import hashlib
+import time
+
+import anyio
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from db.session import SessionLocal
+from db.deps import get_db
 from models.user import User
 from schemas.auth import UserCreate, Token
-from auth.security import hash_password, verify_password
+from auth.security import hash_password, verify_password, needs_rehash
 from auth.oauth2 import oauth2_scheme
 from auth.jwt_handler import create_access_token, decode_access_token
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+# token digest -> (exp timestamp, user dict) for /auth/me
+_current_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
 
 @router.post("/signup")
-def signup(user: UserCreate, db: Session = Depends(get_db)):
+async def signup(user: UserCreate, db: AsyncSession = Depends(get_db)):
     try:
-        existing_user = db.query(User).filter(User.member_name == user.username).first()
-        if existing_user:
-            raise HTTPException(status_code=400, detail="User already exists")
-
-        hashed_pwd = hash_password(user.password)
+        hashed_pwd = await anyio.to_thread.run_sync(hash_password, user.password)
         
         new_user = User(
             member_name=user.username,
@@ -33,33 +32,54 @@ def signup(user: UserCreate, db: Session = Depends(get_db)):
             password=hashed_pwd
         )
         db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
+        try:
+            await db.commit()
+        except IntegrityError:
+            # Unique index on member_name rejects duplicates in one round-trip
+            await db.rollback()
+            raise HTTPException(status_code=400, detail="User already exists")
         
         return {"message": "User created successfully"}
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @router.post("/token", response_model=Token)
-def login(
+async def login(
     form: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     try:
-        user = db.query(User).filter(User.member_name == form.username).first()
+        stmt = select(
+            User.member_id, User.password, User.member_name, User.designation
+        ).where(User.member_name == form.username)
+        row = (await db.execute(stmt)).first()
 
-        if not user or not verify_password(form.password, str(user.password)):
+        # Always pay for one verify so missing users aren't a timing oracle
+        password_ok = await anyio.to_thread.run_sync(
+            verify_password, form.password, row.password if row else None
+        )
+        if not row or not password_ok:
             raise HTTPException(status_code=401, detail="Invalid credentials")
 
-        token = create_access_token({"sub": user.member_name})
+        member_id, password, member_name, designation = row
+
+        # Lazily migrate legacy bcrypt (or outdated Argon2) hashes
+        if needs_rehash(password):
+            new_hash = await anyio.to_thread.run_sync(hash_password, form.password)
+            await db.execute(
+                update(User).where(User.member_id == member_id).values(password=new_hash)
+            )
+            await db.commit()
+
+        token = create_access_token({"sub": member_name})
         return {
             "access_token": token,
             "token_type": "bearer",
-            "member_name": user.member_name,
-            "designation": user.designation
+            "member_name": member_name,
+            "designation": designation
         }
     except HTTPException:
         raise
@@ -67,9 +87,15 @@ def login(
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @router.get("/me")
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)):
     """Protected endpoint to get current user info - demonstrates OAuth2 in Swagger UI"""
     
+    # Key by digest so raw tokens are never kept in memory
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _current_user_cache.get(cache_key)
+    if cached and cached[0] > time.time():
+        return cached[1]
+    
     payload = decode_access_token(token)
     if not payload:
         raise HTTPException(status_code=401, detail="Invalid token")
@@ -78,12 +104,17 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     if not username:
         raise HTTPException(status_code=401, detail="Invalid token")
     
-    user = db.query(User).filter(User.member_name == username).first()
-    if not user:
+    stmt = select(User.member_id, User.member_name, User.designation).where(
+        User.member_name == username
+    )
+    row = (await db.execute(stmt)).first()
+    if not row:
         raise HTTPException(status_code=404, detail="User not found")
     
-    return {
-        "member_id": user.member_id,
-        "member_name": user.member_name,
-        "designation": user.designation
+    user_data = {
+        "member_id": row.member_id,
+        "member_name": row.member_name,
+        "designation": row.designation
     }
+    _current_user_cache[cache_key] = (payload.get("exp", 0), user_data)
+    return user_data
@@ -2,21 +2,53 @@
 FastAPI routes for SRS (Software Requirements Specification) document processing.
 Handles file upload and orchestrates the SRS processing pipeline.
 """
+import os
+import tempfile
 from typing import Optional
 
 from fastapi import APIRouter, File, UploadFile, HTTPException, Form
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
 
+from app.config import settings
 from app.srs_pipeline import process_srs_document
 from app.logger import get_logger
 
 logger = get_logger(__name__)
 
+# .docx files are zip archives and start with the local file header magic
+DOCX_MAGIC = b"PK\x03\x04"
+MAX_UPLOAD_BYTES = settings.srs_max_upload_mb * 1024 * 1024
+
 router = APIRouter(prefix="/srs", tags=["SRS Processing"])
 
+# Static payload for /srs/status, built once at import
+_STATUS_RESPONSE = {
+    "status": "ready",
+    "supported_formats": [".docx"],
+    "section_mappings": {
+        "Introduction": "Product Overview",
+        "Scope": "System Scope",
+        "User Types": "Personas",
+        "Functional Requirements": "Feature Pages",
+        "Non-functional": "NFR",
+        "UI": "UI/UX",
+        "API": "API Docs",
+        "Workflows": "Diagrams",
+    },
+    "team_members": [
+        "Nikhil J Prasad",
+        "S Govind Krishnan",
+        "Kailas S S",
+        "Mukundan V S",
+    ],
+}
+
 
 class SRSProcessingResponse(BaseModel):
     """Response model for SRS processing."""
+    model_config = ConfigDict(validate_assignment=False, frozen=True)
+    
     success: bool
     document_title: Optional[str] = None
     project_name: Optional[str] = None
@@ -30,7 +62,11 @@ class SRSProcessingResponse(BaseModel):
     processing_time_ms: float = 0
 
 
-@router.post("/upload", response_model=SRSProcessingResponse)
+@router.post(
+    "/upload",
+    response_model=SRSProcessingResponse,
+    response_model_exclude_none=True
+)
 async def upload_srs_document(
     file: UploadFile = File(..., description="Word document (.docx) containing the SRS"),
     project_name: Optional[str] = Form(None, description="Optional project name override")
@@ -76,35 +112,78 @@ async def upload_srs_document(
             detail="Invalid file type. Please upload a Word document (.docx)"
         )
     
-    # Read file content
+    # Reject oversized uploads before touching the body
+    declared_size = file.size or int(file.headers.get("content-length") or 0)
+    if declared_size > MAX_UPLOAD_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large. Maximum size is {settings.srs_max_upload_mb} MB"
+        )
+    
+    # Sniff the zip magic so non-.docx payloads are rejected cheaply
     try:
-        content = await file.read()
-        logger.info(f"📦 File size: {len(content)} bytes")
+        header = await file.read(4)
+        await file.seek(0)
     except Exception as e:
         logger.error(f"Failed to read file: {e}")
         raise HTTPException(status_code=400, detail=f"Failed to read file: {e}")
     
-    if len(content) == 0:
+    if not header:
         raise HTTPException(status_code=400, detail="File is empty")
     
-    # Process the document through the pipeline
-    try:
-        result = await process_srs_document(
-            file_content=content,
-            filename=file.filename,
-            project_name=project_name
+    if header != DOCX_MAGIC:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid file type. Please upload a Word document (.docx)"
         )
+    
+    # Stream the upload to a temporary file in 1 MiB chunks
+    tmp_path: Optional[str] = None
+    try:
+        try:
+            file_size = 0
+            with tempfile.NamedTemporaryFile(suffix=".docx", delete=False) as tmp:
+                tmp_path = tmp.name
+                while chunk := await file.read(1 << 20):
+                    file_size += len(chunk)
+                    if file_size > MAX_UPLOAD_BYTES:
+                        raise HTTPException(
+                            status_code=413,
+                            detail=f"File too large. Maximum size is {settings.srs_max_upload_mb} MB"
+                        )
+                    tmp.write(chunk)
+            logger.info(f"📦 File size: {file_size} bytes")
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to read file: {e}")
+            raise HTTPException(status_code=400, detail=f"Failed to read file: {e}")
         
-        logger.info(f"✅ SRS processing complete: {result.get('success')}")
-        
-        return SRSProcessingResponse(**result)
-        
-    except Exception as e:
-        logger.error(f"SRS processing failed: {e}")
-        raise HTTPException(status_code=500, detail=f"Processing failed: {e}")
+        # Process the document through the pipeline
+        try:
+            result = await process_srs_document(
+                file_path=tmp_path,
+                filename=file.filename,
+                project_name=project_name
+            )
+            
+            logger.info(f"✅ SRS processing complete: {result.get('success')}")
+            
+            # Pipeline output is trusted, so skip re-validating it
+            return SRSProcessingResponse.model_construct(**result)
+            
+        except Exception as e:
+            logger.error(f"SRS processing failed: {e}")
+            raise HTTPException(status_code=500, detail=f"Processing failed: {e}")
+    finally:
+        if tmp_path:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
 
 
-@router.get("/status")
+@router.get("/status", response_class=ORJSONResponse)
 async def get_srs_status():
     """
     Get the status of the SRS processing service.
@@ -112,23 +191,4 @@ async def get_srs_status():
     Returns:
         Service status and configuration info
     """
-    return {
-        "status": "ready",
-        "supported_formats": [".docx"],
-        "section_mappings": {
-            "Introduction": "Product Overview",
-            "Scope": "System Scope",
-            "User Types": "Personas",
-            "Functional Requirements": "Feature Pages",
-            "Non-functional": "NFR",
-            "UI": "UI/UX",
-            "API": "API Docs",
-            "Workflows": "Diagrams",
-        },
-        "team_members": [
-            "Nikhil J Prasad",
-            "S Govind Krishnan",
-            "Kailas S S",
-            "Mukundan V S",
-        ],
-    }
+    return _STATUS_RESPONSE
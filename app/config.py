@@ -2,10 +2,9 @@
 Configuration module for environment variables.
 """
 import os
-from functools import lru_cache
 from typing import Optional
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
 
@@ -22,6 +21,29 @@ class Settings(BaseSettings):
     postgres_db: str = Field(default="meet_processor")
     postgres_host: str = Field(default="localhost")
     postgres_port: int = Field(default=5432)
+    # Connection pool sizing: pool_size connections are kept open, up to
+    # max_overflow more are opened under load, and a checkout waits at most
+    # pool_timeout seconds for a free connection
+    database_pool_size: int = Field(
+        default=20,
+        description="Number of persistent connections kept in the pool"
+    )
+    database_max_overflow: int = Field(
+        default=30,
+        description="Extra connections allowed beyond the pool size under load"
+    )
+    database_pool_timeout: int = Field(
+        default=30,
+        description="Seconds to wait for a pooled connection before erroring"
+    )
+    database_pool_recycle: int = Field(
+        default=1800,
+        description="Seconds after which pooled connections are recycled (pre-empts server idle timeouts)"
+    )
+    database_pool_use_lifo: bool = Field(
+        default=True,
+        description="Reuse the most recently returned connection first so idle extras can age out"
+    )
     
     # Recording Transcription Settings
     recordings_dir: str = Field(
@@ -53,6 +75,45 @@ class Settings(BaseSettings):
     # LLM Configuration (Groq)
     groq_api_key: str = Field(default="")
     groq_model: str = Field(default="llama-3.1-8b-instant")
+    groq_model_fast: str = Field(
+        default="llama-3.1-8b-instant",
+        description="Model for lightweight calls (meeting title, project name)"
+    )
+    llm_max_retries: int = Field(
+        default=4,
+        description="Attempts per LLM call on rate limits, connection and 5xx errors"
+    )
+    llm_fast_path_enabled: bool = Field(
+        default=False,
+        description="Answer title/summary/project for very short transcripts without the LLM"
+    )
+    llm_use_for_ner: bool = Field(
+        default=True,
+        description="Use the LLM for title/project extraction; when false, a local "
+                    "spaCy pass is tried first and the LLM only covers its misses"
+    )
+    use_batch_api_for_background: bool = Field(
+        default=True,
+        description="Send background bulk analyses through Groq's Batch API"
+    )
+    groq_batch_wait_minutes: int = Field(
+        default=30,
+        description="Minutes to wait on a Groq batch before using the synchronous API"
+    )
+    groq_rpm: int = Field(
+        default=0,
+        description="Groq requests-per-minute quota enforced client-side; 0 (default) "
+                    "disables it. Set to your account's limit, e.g. 30 on the free tier"
+    )
+    groq_tpm: int = Field(
+        default=0,
+        description="Groq tokens-per-minute quota enforced client-side; 0 (default) "
+                    "disables it. Set to your account's limit, e.g. 6000 on the free tier"
+    )
+    groq_max_concurrency: int = Field(
+        default=8,
+        description="Maximum concurrent Groq requests for batch analysis"
+    )
     
     # Confluence Configuration
     confluence_base_url: str = Field(
@@ -65,6 +126,30 @@ class Settings(BaseSettings):
         default="MEET",
         description="Confluence space key for meeting pages"
     )
+    confluence_requests_per_minute: int = Field(
+        default=120,
+        description="Client-side cap on Confluence API requests per minute"
+    )
+    
+    # SRS Upload Settings
+    srs_max_upload_mb: int = Field(
+        default=25,
+        description="Maximum accepted size of an uploaded SRS document in MB"
+    )
+    
+    # Password Hashing (Argon2id)
+    argon2_memory_kib: int = Field(
+        default=47104,
+        description="Argon2id memory cost in KiB (recommended: 47104, i.e. 46 MiB)"
+    )
+    argon2_time_cost: int = Field(
+        default=2,
+        description="Argon2id iterations (recommended: 2 with 46 MiB memory)"
+    )
+    argon2_parallelism: int = Field(
+        default=1,
+        description="Argon2id lanes (recommended: 1)"
+    )
     
     # Polling Configuration
     recordings_poll_interval: int = Field(
@@ -77,21 +162,13 @@ class Settings(BaseSettings):
     debug: bool = Field(default=True)
     log_level: str = Field(default="INFO")
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
-        extra = "ignore"
-
-
-@lru_cache()
-def get_settings() -> Settings:
-    """
-    Get cached settings instance.
-    Uses lru_cache to ensure settings are loaded only once.
-    """
-    return Settings()
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+    )
 
 
-# Convenience function for direct access
-settings = get_settings()
+# Settings are loaded once at import time; import `settings` directly
+settings = Settings()
@@ -5,38 +5,115 @@ Uses Confluence REST API v1.
 Base URL should be https://<site>.atlassian.net/wiki (with /wiki).
 If /wiki is not present, it is automatically appended.
 """
+import functools
 import re
-from typing import Optional, Dict, Any, List
+import threading
+import time
+from html import escape
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
 
 import requests
-from bs4 import BeautifulSoup
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_not_exception_type
+from cachetools import TTLCache
+from jinja2 import Environment
+from requests.adapters import HTTPAdapter
+from tenacity import (
+    Retrying,
+    retry,
+    retry_if_not_exception_type,
+    retry_if_result,
+    stop_after_attempt,
+    wait_exponential,
+)
 
+from app import json_utils
 from app.config import settings
 from app.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Cheap extraction of the title and text from HTML error pages
+_TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]+>')
 
-def _safe_confluence_request(method: str, url: str, **kwargs) -> Dict[str, Any]:
+# Page bodies for create/update, filled with pre-encoded JSON values so the
+# (possibly multi-MB) HTML is copied once instead of being wrapped in dicts
+_CREATE_PAGE_TMPL = (
+    b'{"type":"page","title":%s,"space":{"key":%s},'
+    b'"body":{"storage":{"value":%s,"representation":"storage"}}}'
+)
+_UPDATE_PAGE_TMPL = (
+    b'{"type":"page","title":%s,"space":{"key":%s},"version":{"number":%d},'
+    b'"body":{"storage":{"value":%s,"representation":"storage"}}}'
+)
+
+
+class _RateLimiter:
+    """
+    Thread-safe token bucket limiting requests per minute.
+    
+    Holds up to `rpm` tokens, refilled at rpm/60 tokens per second; acquire()
+    blocks until a token is available.
+    """
+    
+    def __init__(self, rpm: int):
+        self.capacity = float(max(rpm, 1))
+        self.rate = self.capacity / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Take one token, sleeping until one has been refilled if necessary."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+def _retry_after_seconds(resp: requests.Response) -> Optional[float]:
+    """Parse a numeric Retry-After header, if present."""
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
+
+def _safe_confluence_request(
+    method: str,
+    url: str,
+    session: Optional[requests.Session] = None,
+    **kwargs
+) -> Dict[str, Any]:
     """
     Make a safe Confluence request that handles HTML responses gracefully.
     
     Never raises exceptions on HTML responses - returns a fallback dict instead.
-    Also handles JSON error responses with statusCode field.
+    Also handles JSON error responses with statusCode field. Fallback dicts
+    include "retry_after" (seconds) when the server sent Retry-After. A 304 Not Modified
+    returns {"not_modified": True}, and a JSON object response carrying an ETag
+    has it copied into its "_etag" key.
     
     Args:
         method: HTTP method (GET, POST, PUT, DELETE)
         url: Full URL to request
+        session: Optional session to send the request on (reuses pooled connections)
         **kwargs: Additional arguments for requests.request
         
     Returns:
         JSON dict if successful, or fallback dict with error info
     """
     try:
-        resp = requests.request(method, url, **kwargs)
+        resp = (session or requests).request(method, url, **kwargs)
     except requests.exceptions.RequestException as e:
-        logger.error(f"Confluence request failed: {e}")
+        logger.error("Confluence request failed: %s", e)
         return {
             "fallback": True,
             "status_code": 0,
@@ -44,56 +121,72 @@ def _safe_confluence_request(method: str, url: str, **kwargs) -> Dict[str, Any]:
             "html_snippet": str(e)[:300],
         }
     
+    if resp.status_code == 304:
+        return {"not_modified": True, "status_code": 304}
+    
     content_type = resp.headers.get("Content-Type", "")
     
     # JSON case - try to parse
     if "application/json" in content_type:
         try:
-            data = resp.json()
+            data = json_utils.loads(resp.content)
             
-            # Check for JSON error responses with statusCode field (Confluence error format)
-            if isinstance(data, dict) and data.get("statusCode"):
+            # Classify errors by the HTTP status; Confluence's JSON error format
+            # also carries a statusCode field, used when the status is not an error
+            status_code = resp.status_code
+            if status_code < 400 and isinstance(data, dict) and data.get("statusCode"):
                 status_code = int(data.get("statusCode", 0))
-                message = data.get("message", "Unknown error")
+            if status_code >= 400:
+                message = data.get("message", "Unknown error") if isinstance(data, dict) else "Unknown error"
                 
                 if status_code == 403:
-                    logger.warning(f"Confluence 403 permission denied: {message}")
+                    logger.warning("Confluence 403 permission denied: %s", message)
                     return {
                         "fallback": True,
                         "status_code": 403,
                         "html_title": "Permission Denied",
                         "html_snippet": message,
                     }
-                elif status_code >= 400:
-                    logger.warning(f"Confluence error {status_code}: {message}")
+                else:
+                    logger.warning("Confluence error %s: %s", status_code, message)
                     return {
                         "fallback": True,
                         "status_code": status_code,
                         "html_title": f"Error {status_code}",
                         "html_snippet": message,
+                        "retry_after": _retry_after_seconds(resp),
                     }
             
+            etag = resp.headers.get("ETag")
+            if etag and isinstance(data, dict):
+                data["_etag"] = etag
+            
             return data
         except Exception as e:
-            logger.warning(f"Failed to parse JSON response: {e}")
+            logger.warning("Failed to parse JSON response: %s", e)
     
-    # HTML fallback - extract useful info with BeautifulSoup
+    # HTML fallback - extract title and a text snippet
     html = resp.text or ""
-    try:
-        soup = BeautifulSoup(html, "html.parser")
-        title = soup.title.string.strip() if soup.title and soup.title.string else "No title"
-        snippet = soup.get_text(" ", strip=True)[:300]
-    except Exception:
-        title = "Parse Error"
-        snippet = html[:300] if html else "No response body"
+    if not html:
+        title = "No title"
+        snippet = "No response body"
+    elif content_type.startswith("text/plain"):
+        title = "No title"
+        snippet = " ".join(html.split())[:300]
+    else:
+        title_match = _TITLE_RE.search(html)
+        title = " ".join(title_match.group(1).split()) if title_match else ""
+        title = title or "No title"
+        snippet = " ".join(_TAG_RE.sub(" ", html).split())[:300]
     
-    logger.warning(f"Confluence HTML response ({resp.status_code}): {title}")
+    logger.warning("Confluence HTML response (%s): %s", resp.status_code, title)
     
     return {
         "fallback": True,
         "status_code": resp.status_code,
         "html_title": title,
         "html_snippet": snippet,
+        "retry_after": _retry_after_seconds(resp),
     }
 
 
@@ -110,6 +203,18 @@ class ConfluenceClient:
     # API path prefix for Confluence REST API v1 calls (after /wiki)
     API_PREFIX = "/rest/api"
     
+    # Seconds that title -> page ID and page version lookups stay cached
+    CACHE_TTL = 30.0
+    # Seconds a stale page version is kept for ETag revalidation, and how
+    # many entries each cache holds
+    PAGE_META_STALE_TTL = 600.0
+    CACHE_SIZE = 1024
+    
+    # Attempts per request when Confluence answers 429 Too Many Requests
+    RATE_LIMIT_ATTEMPTS = 3
+    # Longest Retry-After honoured, so a huge value can't park a worker thread
+    MAX_RETRY_AFTER = 60.0
+    
     def __init__(self):
         """Initialize the Confluence client with configuration."""
         # Normalize base URL: ensure it ends with /wiki
@@ -121,12 +226,39 @@ class ConfluenceClient:
         self.email = settings.confluence_email
         self.api_token = settings.confluence_api_token
         self.space_key = settings.confluence_space_key
+        self._space_key_json = json_utils.dumps(self.space_key)
         
         # Auth tuple for basic auth (email, api_token)
         self.auth = (self.email, self.api_token) if self.email and self.api_token else None
         self._space_verified: bool = False
         
-        logger.info(f"Confluence client initialized for: {self.base_url} (space: {self.space_key})")
+        # (space_key, title) -> page_id, expiring after CACHE_TTL
+        self._title_cache: TTLCache = TTLCache(maxsize=self.CACHE_SIZE, ttl=self.CACHE_TTL)
+        # page_id -> (version, title, cached_at, etag); entries older than
+        # CACHE_TTL are kept until PAGE_META_STALE_TTL so their ETag can be
+        # revalidated with a conditional GET
+        self._page_meta_cache: TTLCache = TTLCache(
+            maxsize=self.CACHE_SIZE, ttl=self.PAGE_META_STALE_TTL
+        )
+        # TTLCache is not thread-safe; pages are written from a thread pool
+        self._cache_lock = threading.Lock()
+        
+        # Persistent session so repeated calls reuse the same TLS connection
+        self._session = requests.Session()
+        self._session.auth = self.auth
+        self._session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=0)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        
+        # Proactive throttle so bursts don't run into the tenant rate limit
+        self._limiter = _RateLimiter(settings.confluence_requests_per_minute)
+        
+        logger.info(
+            "Confluence client initialized for: %s (space: %s)",
+            self.base_url,
+            self.space_key
+        )
     
     @property
     def is_configured(self) -> bool:
@@ -164,7 +296,9 @@ class ConfluenceClient:
         endpoint: str,
         params: Optional[Dict] = None,
         json_data: Optional[Dict] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        headers: Optional[Dict[str, str]] = None,
+        body: Optional[bytes] = None
     ) -> Dict[str, Any]:
         """
         Make an authenticated request to the Confluence API using the safe wrapper.
@@ -177,6 +311,8 @@ class ConfluenceClient:
             params: Optional query parameters
             json_data: Optional JSON body for POST/PUT
             timeout: Request timeout in seconds
+            headers: Optional extra headers merged over the session defaults
+            body: Optional pre-serialized JSON body (takes precedence over json_data)
             
         Returns:
             JSON dict if successful, or fallback dict with HTML info
@@ -191,15 +327,59 @@ class ConfluenceClient:
             }
         
         url = self._api_url(endpoint)
-        return _safe_confluence_request(
-            method=method.upper(),
-            url=url,
-            params=params,
-            json=json_data,
-            headers=self.headers,
-            auth=self.auth,
-            timeout=timeout
+        
+        # Serialize bodies ourselves rather than through requests' json encoder
+        if body is None and json_data is not None:
+            body = json_utils.dumps(json_data)
+        if body is not None:
+            headers = {**(headers or {}), "Content-Type": "application/json"}
+        
+        def _send() -> Dict[str, Any]:
+            self._limiter.acquire()
+            return _safe_confluence_request(
+                method=method.upper(),
+                url=url,
+                session=self._session,
+                params=params,
+                data=body,
+                headers=headers,
+                timeout=timeout
+            )
+        
+        # On 429, wait as long as Retry-After asks (or back off exponentially)
+        retryer = Retrying(
+            stop=stop_after_attempt(self.RATE_LIMIT_ATTEMPTS),
+            retry=retry_if_result(lambda data: data.get("status_code") == 429),
+            wait=self._rate_limit_wait,
+            retry_error_callback=lambda retry_state: retry_state.outcome.result(),
+            reraise=True,
         )
+        return retryer(_send)
+    
+    @classmethod
+    def _rate_limit_wait(cls, retry_state) -> float:
+        """Seconds to wait before retrying a rate-limited request."""
+        retry_after = retry_state.outcome.result().get("retry_after")
+        if retry_after is not None:
+            retry_after = min(retry_after, cls.MAX_RETRY_AFTER)
+            logger.warning("Confluence rate limited; retrying in %.1fs", retry_after)
+            return retry_after
+        return min(2 ** retry_state.attempt_number, 10)
+    
+    def warmup(self) -> None:
+        """
+        Open a connection and verify access to the configured space.
+        
+        Intended to run in the background at startup so the first
+        create_page doesn't absorb the round trip.
+        """
+        if not self.is_configured:
+            return
+        self._verify_space_access()
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
     
     def _verify_space_access(self) -> bool:
         """
@@ -215,20 +395,17 @@ class ConfluenceClient:
         if self._space_verified:
             return True
         
-        url = self._api_url(f"/space/{self.space_key}")
-        data = _safe_confluence_request(
-            "GET", url,
-            headers=self.headers,
-            auth=self.auth,
-            timeout=30
-        )
+        data = self._safe_request("GET", f"/space/{self.space_key}", timeout=30)
         
         if data.get("fallback"):
-            logger.warning(f"Skipping space verification due to HTML response: {data.get('html_title')}")
+            logger.warning(
+                "Skipping space verification due to HTML response: %s",
+                data.get('html_title')
+            )
             return False
         
         space_name = data.get("name", self.space_key)
-        logger.info(f"Verified access to Confluence space: {space_name} ({self.space_key})")
+        logger.info("Verified access to Confluence space: %s (%s)", space_name, self.space_key)
         self._space_verified = True
         return True
     
@@ -251,7 +428,12 @@ class ConfluenceClient:
             logger.warning("Confluence client not configured")
             return None
         
-        url = self._api_url("/content")
+        cache_key = (self.space_key, title)
+        with self._cache_lock:
+            cached = self._title_cache.get(cache_key)
+        if cached:
+            return cached
+        
         params = {
             "spaceKey": self.space_key,
             "title": title,
@@ -259,25 +441,26 @@ class ConfluenceClient:
             "limit": 1
         }
         
-        data = _safe_confluence_request(
-            "GET", url,
-            params=params,
-            headers=self.headers,
-            auth=self.auth,
-            timeout=30
-        )
+        data = self._safe_request("GET", "/content", params=params, timeout=30)
         
         if data.get("fallback"):
-            logger.warning(f"Skipping find_page_by_title due to HTML response: {data.get('html_title')}")
+            logger.warning(
+                "Skipping find_page_by_title due to HTML response: %s",
+                data.get('html_title')
+            )
+            with self._cache_lock:
+                self._title_cache.pop(cache_key, None)
             return None
         
         results = data.get("results", [])
         if results:
             page_id = results[0].get("id")
-            logger.info(f"Found existing page '{title}' with ID: {page_id}")
+            with self._cache_lock:
+                self._title_cache[cache_key] = page_id
+            logger.info("Found existing page '%s' with ID: %s", title, page_id)
             return page_id
         
-        logger.debug(f"No existing page found with title: {title}")
+        logger.debug("No existing page found with title: %s", title)
         return None
     
     def _get_page_version(self, page_id: str) -> int:
@@ -290,24 +473,43 @@ class ConfluenceClient:
         Returns:
             Current page version number (defaults to 1 on errors)
         """
-        url = self._api_url(f"/content/{page_id}")
+        with self._cache_lock:
+            cached = self._page_meta_cache.get(page_id)
+        if cached and time.monotonic() - cached[2] < self.CACHE_TTL:
+            return cached[0]
+        
         params = {"expand": "version"}
         
-        data = _safe_confluence_request(
-            "GET", url,
-            params=params,
-            headers=self.headers,
-            auth=self.auth,
-            timeout=30
+        # Revalidate a stale entry instead of refetching the whole page
+        headers = {"If-None-Match": cached[3]} if cached and cached[3] else None
+        
+        data = self._safe_request(
+            "GET", f"/content/{page_id}", params=params, timeout=30, headers=headers
         )
         
-        if data.get("fallback"):
-            logger.warning(f"Failed to get page version for {page_id}, defaulting to 1")
+        if data.get("not_modified") and cached:
+            self._cache_page_meta(page_id, cached[0], cached[1], cached[3])
+            return cached[0]
+        
+        if data.get("fallback") or data.get("not_modified"):
+            logger.warning("Failed to get page version for %s, defaulting to 1", page_id)
+            self._forget_page_meta(page_id)
             return 1
         
         version = data.get("version", {}).get("number", 1)
+        self._cache_page_meta(page_id, version, data.get("title", ""), data.get("_etag"))
         return version
     
+    def _cache_page_meta(self, page_id: str, version: int, title: str, etag: Optional[str]) -> None:
+        """Record a page's current version, title and ETag as fresh."""
+        with self._cache_lock:
+            self._page_meta_cache[page_id] = (version, title, time.monotonic(), etag)
+    
+    def _forget_page_meta(self, page_id: str) -> None:
+        """Drop a page's cached version, e.g. after a failed write."""
+        with self._cache_lock:
+            self._page_meta_cache.pop(page_id, None)
+    
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
@@ -328,45 +530,27 @@ class ConfluenceClient:
             logger.warning("Confluence client not configured")
             return None
         
-        # Verify space access first
+        # Verify space access first (cached once warmup or an earlier call succeeds)
         if not self._verify_space_access():
             logger.warning("Skipping page creation - space access not verified")
             return None
         
-        url = self._api_url("/content")
-        
-        payload = {
-            "type": "page",
-            "title": title,
-            "space": {
-                "key": self.space_key
-            },
-            "body": {
-                "storage": {
-                    "value": html,
-                    "representation": "storage"
-                }
-            }
-        }
-        
-        data = _safe_confluence_request(
-            "POST", url,
-            json=payload,
-            headers=self.headers,
-            auth=self.auth,
-            timeout=60
+        payload = _CREATE_PAGE_TMPL % (
+            json_utils.dumps(title), self._space_key_json, json_utils.dumps(html)
         )
         
+        data = self._safe_request("POST", "/content", body=payload, timeout=60)
+        
         # Check for failed or fallback response
         if not data or data.get("fallback"):
-            logger.error(f"Confluence create_page failed or returned fallback: {data}")
+            logger.error("Confluence create_page failed or returned fallback: %s", data)
             return None
         
         # Extract page ID from root level (Confluence returns "id" as string at root)
         page_id = data.get("id")
         
         if not page_id:
-            logger.error(f"Confluence response missing 'id' field. Full response: {data}")
+            logger.error("Confluence response missing 'id' field. Full response: %s", data)
             return None
         
         # Get page URL from response or construct it
@@ -376,8 +560,12 @@ class ConfluenceClient:
         else:
             page_url = f"{self.base_url}/spaces/{self.space_key}/pages/{page_id}"
         
-        logger.info(f"Created Confluence page: {title} (ID: {page_id})")
-        logger.info(f"Confluence page URL: {page_url}")
+        with self._cache_lock:
+            self._title_cache[(self.space_key, title)] = page_id
+        self._cache_page_meta(page_id, data.get("version", {}).get("number", 1), title, data.get("_etag"))
+        
+        logger.info("Created Confluence page: %s (ID: %s)", title, page_id)
+        logger.info("Confluence page URL: %s", page_url)
         
         return {
             "page_id": page_id,
@@ -409,59 +597,42 @@ class ConfluenceClient:
         # Get current page info (need title if not provided)
         current_version = self._get_page_version(page_id)
         
-        # If no title provided, fetch current title
+        # If no title provided, use the one cached by _get_page_version or fetch it
         if not title:
-            url = self._api_url(f"/content/{page_id}")
-            data = _safe_confluence_request(
-                "GET", url,
-                headers=self.headers,
-                auth=self.auth,
-                timeout=30
-            )
+            with self._cache_lock:
+                cached = self._page_meta_cache.get(page_id)
+            title = cached[1] if cached else None
+        if not title:
+            data = self._safe_request("GET", f"/content/{page_id}", timeout=30)
             if not data or data.get("fallback"):
                 title = "Untitled"
             else:
                 title = data.get("title", "Untitled")
         
-        url = self._api_url(f"/content/{page_id}")
-        
-        payload = {
-            "type": "page",
-            "title": title,
-            "space": {
-                "key": self.space_key
-            },
-            "version": {
-                "number": current_version + 1
-            },
-            "body": {
-                "storage": {
-                    "value": html,
-                    "representation": "storage"
-                }
-            }
-        }
-        
-        data = _safe_confluence_request(
-            "PUT", url,
-            json=payload,
-            headers=self.headers,
-            auth=self.auth,
-            timeout=60
+        payload = _UPDATE_PAGE_TMPL % (
+            json_utils.dumps(title),
+            self._space_key_json,
+            current_version + 1,
+            json_utils.dumps(html),
         )
         
+        data = self._safe_request("PUT", f"/content/{page_id}", body=payload, timeout=60)
+        
         # Check for failed or fallback response
         if not data or data.get("fallback"):
-            logger.error(f"Confluence update_page failed or returned fallback: {data}")
+            logger.error("Confluence update_page failed or returned fallback: %s", data)
+            # Version may be stale (e.g. 409 conflict); refetch next time
+            self._forget_page_meta(page_id)
             return None
         
         # Verify the response contains expected data
         updated_page_id = data.get("id")
         if not updated_page_id:
-            logger.error(f"Confluence update response missing 'id' field. Full response: {data}")
+            logger.error("Confluence update response missing 'id' field. Full response: %s", data)
             return None
         
         page_title = data.get("title", title)
+        self._cache_page_meta(page_id, current_version + 1, page_title, data.get("_etag"))
         
         # Get page URL from response or construct it
         page_url = data.get("_links", {}).get("webui", "")
@@ -470,7 +641,12 @@ class ConfluenceClient:
         else:
             page_url = f"{self.base_url}/spaces/{self.space_key}/pages/{page_id}"
         
-        logger.info(f"Updated Confluence page: {page_title} (ID: {page_id}, version: {current_version + 1})")
+        logger.info(
+            "Updated Confluence page: %s (ID: %s, version: %s)",
+            page_title,
+            page_id,
+            current_version + 1
+        )
         
         return {
             "page_id": page_id,
@@ -496,22 +672,15 @@ class ConfluenceClient:
         # Use CQL to search for pages containing the query
         cql = f'space = "{self.space_key}" AND type = page AND text ~ "{query}"'
         
-        url = self._api_url("/content/search")
         params = {
             "cql": cql,
             "limit": max_results
         }
         
-        data = _safe_confluence_request(
-            "GET", url,
-            params=params,
-            headers=self.headers,
-            auth=self.auth,
-            timeout=30
-        )
+        data = self._safe_request("GET", "/content/search", params=params, timeout=30)
         
         if data.get("fallback"):
-            logger.warning(f"Page search failed: {data.get('html_title')}")
+            logger.warning("Page search failed: %s", data.get('html_title'))
             return []
         
         results = []
@@ -526,7 +695,7 @@ class ConfluenceClient:
                 "url": page_url
             })
         
-        logger.debug(f"Page search for '{query}' found {len(results)} results")
+        logger.debug("Page search for '%s' found %s results", query, len(results))
         return results
     
     def find_project_page(self, project_name: str) -> Optional[Dict[str, Any]]:
@@ -570,10 +739,14 @@ class ConfluenceClient:
             
             # Check if project name is prominently in the title
             if project_lower in title:
-                logger.info(f"Found existing project page: '{result.get('title')}' (ID: {result.get('id')})")
+                logger.info(
+                    "Found existing project page: '%s' (ID: %s)",
+                    result.get('title'),
+                    result.get('id')
+                )
                 return result
         
-        logger.debug(f"No existing page found for project: {project_name}")
+        logger.debug("No existing page found for project: %s", project_name)
         return None
     
     def create_or_update_project_page(
@@ -653,12 +826,38 @@ class ConfluenceClient:
                 result["action"] = "created"
         
         return result
+    
+    def create_or_update_pages(
+        self,
+        items: List[Tuple[str, str]],
+        max_workers: int = 8
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Create or update several pages concurrently over the shared session.
+        
+        Args:
+            items: List of (title, html) pairs
+            max_workers: Maximum number of pages published at once
+            
+        Returns:
+            Results of create_or_update_page, in the same order as items
+        """
+        if not items:
+            return []
+        
+        def _upsert(item: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+            try:
+                return self.create_or_update_page(*item)
+            except Exception as e:
+                logger.error("Failed to publish Confluence page '%s': %s", item[0], e)
+                return None
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(_upsert, items))
 
 
 # Singleton pattern for client reuse
-_confluence_client: Optional[ConfluenceClient] = None
-
-
+@functools.cache
 def get_confluence_client() -> ConfluenceClient:
     """
     Get or create the Confluence client singleton.
@@ -666,10 +865,68 @@ def get_confluence_client() -> ConfluenceClient:
     Returns:
         ConfluenceClient instance
     """
-    global _confluence_client
-    if _confluence_client is None:
-        _confluence_client = ConfluenceClient()
-    return _confluence_client
+    return ConfluenceClient()
+
+
+def close_confluence_client() -> None:
+    """Close the Confluence client singleton's session, if one was created."""
+    if get_confluence_client.cache_info().currsize:
+        get_confluence_client().close()
+        get_confluence_client.cache_clear()
+
+
+# Meeting page layout, compiled once at import. Autoescaping replaces the
+# per-field _escape_html calls; finalize renders None as an empty string.
+_MEETING_TMPL = Environment(
+    autoescape=True,
+    trim_blocks=True,
+    lstrip_blocks=True,
+    finalize=lambda value: "" if value is None else value,
+).from_string(
+    """<h1>{{ title }}</h1>
+<p><strong>Date:</strong> {{ meeting_date }}</p>
+<hr/>
+<h2>Summary</h2>
+<p>{{ summary }}</p>
+{% if key_points %}
+<h2>Key Points</h2>
+<ul>
+{% for point in key_points %}
+<li>{{ point }}</li>
+{% endfor %}
+</ul>
+{% endif %}
+{% if decisions %}
+<h2>Decisions</h2>
+<ul>
+{% for decision in decisions %}
+<li>{{ decision }}</li>
+{% endfor %}
+</ul>
+{% endif %}
+{% if action_items %}
+<h2>Action Items</h2>
+<ul>
+{% for item in action_items %}
+{% set jira_key = item.get("jira_key", "") %}
+{% if jira_key and jira_base_url %}
+<li><a href="{{ jira_base_url }}/browse/{{ jira_key }}">{{ jira_key }}</a> — {{ item.get("description", "") }} ({{ item.get("assignee", "Unassigned") }})</li>
+{% else %}
+<li>{{ item.get("description", "") }} ({{ item.get("assignee", "Unassigned") }})</li>
+{% endif %}
+{% endfor %}
+</ul>
+{% endif %}
+{% if transcript %}
+<h2>Transcript</h2>
+<ac:structured-macro ac:name="expand"><ac:parameter ac:name="title">Click to expand full transcript</ac:parameter><ac:rich-text-body>
+{% for para in paragraphs %}
+<p>{{ para }}</p>
+{% endfor %}
+</ac:rich-text-body></ac:structured-macro>
+{% endif %}
+"""
+)
 
 
 def build_meeting_page_html(
@@ -698,84 +955,40 @@ def build_meeting_page_html(
     Returns:
         HTML string formatted for Confluence storage format
     """
-    html_parts = []
-    
-    # Title and date
-    html_parts.append(f"<h1>{_escape_html(title)}</h1>")
-    html_parts.append(f"<p><strong>Date:</strong> {_escape_html(meeting_date)}</p>")
-    html_parts.append("<hr/>")
-    
-    # Summary section
-    html_parts.append("<h2>Summary</h2>")
-    html_parts.append(f"<p>{_escape_html(summary)}</p>")
-    
-    # Key Points section
-    if key_points:
-        html_parts.append("<h2>Key Points</h2>")
-        html_parts.append("<ul>")
-        for point in key_points:
-            html_parts.append(f"<li>{_escape_html(point)}</li>")
-        html_parts.append("</ul>")
-    
-    # Decisions section
-    if decisions:
-        html_parts.append("<h2>Decisions</h2>")
-        html_parts.append("<ul>")
-        for decision in decisions:
-            html_parts.append(f"<li>{_escape_html(decision)}</li>")
-        html_parts.append("</ul>")
-    
-    # Action Items section with Jira links
-    if action_items:
-        html_parts.append("<h2>Action Items</h2>")
-        html_parts.append("<ul>")
-        for item in action_items:
-            jira_key = item.get("jira_key", "")
-            description = item.get("description", "")
-            assignee = item.get("assignee", "Unassigned")
-            
-            if jira_key and jira_base_url:
-                jira_url = f"{jira_base_url}/browse/{jira_key}"
-                html_parts.append(
-                    f'<li><a href="{jira_url}">{_escape_html(jira_key)}</a> — '
-                    f'{_escape_html(description)} ({_escape_html(assignee)})</li>'
-                )
-            else:
-                html_parts.append(
-                    f"<li>{_escape_html(description)} ({_escape_html(assignee)})</li>"
-                )
-        html_parts.append("</ul>")
-    
-    # Transcript section (collapsible)
-    if transcript:
-        html_parts.append("<h2>Transcript</h2>")
-        html_parts.append(
-            '<ac:structured-macro ac:name="expand">'
-            '<ac:parameter ac:name="title">Click to expand full transcript</ac:parameter>'
-            '<ac:rich-text-body>'
-        )
-        # Format transcript with paragraph breaks
-        transcript_paragraphs = transcript.split('\n\n')
-        for para in transcript_paragraphs:
-            if para.strip():
-                html_parts.append(f"<p>{_escape_html(para.strip())}</p>")
-        html_parts.append('</ac:rich-text-body></ac:structured-macro>')
-    
-    return "\n".join(html_parts)
+    paragraphs = [p.strip() for p in transcript.split('\n\n')] if transcript else []
+    return _MEETING_TMPL.render(
+        title=title,
+        meeting_date=meeting_date,
+        summary=summary,
+        key_points=key_points,
+        decisions=decisions,
+        action_items=action_items,
+        transcript=transcript,
+        paragraphs=[p for p in paragraphs if p],
+        jira_base_url=jira_base_url,
+    ).rstrip("\n")
 
 
 def _escape_html(text: str) -> str:
     """Escape HTML special characters."""
     if not text:
         return ""
-    return (
-        text
-        .replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&#39;")
-    )
+    return escape(text)
+
+
+def _action_item_html(item: Dict[str, str], jira_base_url: Optional[str]) -> str:
+    """Render one action item as a list entry, linking its Jira key if possible."""
+    jira_key = item.get("jira_key", "")
+    description = _escape_html(item.get("description", ""))
+    assignee = _escape_html(item.get("assignee", "Unassigned"))
+    
+    if jira_key and jira_base_url:
+        jira_url = f"{jira_base_url}/browse/{jira_key}"
+        return (
+            f'<li><a href="{jira_url}">{_escape_html(jira_key)}</a> — '
+            f'{description} ({assignee})</li>'
+        )
+    return f"<li>{description} ({assignee})</li>"
 
 
 def build_simple_meeting_page(
@@ -798,39 +1011,21 @@ def build_simple_meeting_page(
     Returns:
         HTML string
     """
-    html_parts = []
-    
-    # Header
-    html_parts.append(f"<h1>Meeting {_escape_html(meeting_date)}</h1>")
-    
-    # Summary section
-    html_parts.append("<h2>Summary</h2>")
-    html_parts.append(f"<p>{_escape_html(summary)}</p>")
+    html_parts = [
+        f"<h1>Meeting {_escape_html(meeting_date)}</h1>",
+        "<h2>Summary</h2>",
+        f"<p>{_escape_html(summary)}</p>",
+    ]
     
     # Action Items section
     if action_items:
         html_parts.append("<h2>Action Items</h2>")
         html_parts.append("<ul>")
-        for item in action_items:
-            jira_key = item.get("jira_key", "")
-            description = item.get("description", "")
-            assignee = item.get("assignee", "Unassigned")
-            
-            if jira_key and jira_base_url:
-                jira_url = f"{jira_base_url}/browse/{jira_key}"
-                html_parts.append(
-                    f'<li><a href="{jira_url}">{_escape_html(jira_key)}</a> — '
-                    f'{_escape_html(description)} ({_escape_html(assignee)})</li>'
-                )
-            else:
-                html_parts.append(
-                    f"<li>{_escape_html(description)} ({_escape_html(assignee)})</li>"
-                )
+        html_parts += [_action_item_html(item, jira_base_url) for item in action_items]
         html_parts.append("</ul>")
     
     # Transcript section
     if transcript:
-        html_parts.append("<h2>Transcript</h2>")
-        html_parts.append(f"<p>{_escape_html(transcript)}</p>")
+        html_parts.extend(("<h2>Transcript</h2>", f"<p>{_escape_html(transcript)}</p>"))
     
     return "\n".join(html_parts)
@@ -3,34 +3,70 @@ Date parsing utilities for handling natural language dates.
 Converts expressions like "tomorrow", "next Friday", "in 3 days" to ISO format.
 """
 import re
+from functools import lru_cache
 from datetime import date, datetime, timedelta
 from typing import Optional
 import logging  # Keep standard logging for module-level logger
 
 logger = logging.getLogger(__name__)
 
-# Try to import dateparser for natural language parsing
-try:
-    import dateparser
-    DATEPARSER_AVAILABLE = True
-except ImportError:
-    dateparser = None  # type: ignore
-    DATEPARSER_AVAILABLE = False
-    logger.warning("dateparser not installed - natural language dates will use fallback parsing")
-
-
-# Common date patterns for fallback parsing
-RELATIVE_DATE_PATTERNS = {
-    r'^today$': lambda: date.today(),
-    r'^tomorrow$': lambda: date.today() + timedelta(days=1),
-    r'^yesterday$': lambda: date.today() - timedelta(days=1),
-    r'^next\s+week$': lambda: date.today() + timedelta(weeks=1),
-    r'^in\s+(\d+)\s+days?$': lambda m: date.today() + timedelta(days=int(m.group(1))),
-    r'^in\s+(\d+)\s+weeks?$': lambda m: date.today() + timedelta(weeks=int(m.group(1))),
-    r'^(\d+)\s+days?\s+from\s+now$': lambda m: date.today() + timedelta(days=int(m.group(1))),
-    r'^end\s+of\s+week$': lambda: _get_end_of_week(),
-    r'^end\s+of\s+month$': lambda: _get_end_of_month(),
-}
+# dateparser is imported on first use: loading its locale data is slow and
+# most inputs never need it. None = not tried yet, False = unavailable.
+_dateparser = None
+
+
+def _get_dateparser():
+    """Import dateparser on first call; returns the module or None."""
+    global _dateparser
+    if _dateparser is None:
+        try:
+            import dateparser
+            _dateparser = dateparser
+        except ImportError:
+            _dateparser = False
+            logger.warning("dateparser not installed - natural language dates will use fallback parsing")
+    return _dateparser or None
+
+
+# Common date patterns for fallback parsing (compiled once at import).
+# Each function takes the match and the reference "today" date.
+RELATIVE_DATE_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), date_func)
+    for pattern, date_func in (
+        (r'^today$', lambda m, today: today),
+        (r'^tomorrow$', lambda m, today: today + timedelta(days=1)),
+        (r'^yesterday$', lambda m, today: today - timedelta(days=1)),
+        (r'^next\s+week$', lambda m, today: today + timedelta(weeks=1)),
+        (r'^in\s+(\d+)\s+days?$', lambda m, today: today + timedelta(days=int(m.group(1)))),
+        (r'^in\s+(\d+)\s+weeks?$', lambda m, today: today + timedelta(weeks=int(m.group(1)))),
+        (r'^(\d+)\s+days?\s+from\s+now$', lambda m, today: today + timedelta(days=int(m.group(1)))),
+        (r'^end\s+of\s+week$', lambda m, today: _get_end_of_week(today)),
+        (r'^end\s+of\s+month$', lambda m, today: _get_end_of_month(today)),
+    )
+]
+
+_ISO_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# Literal day names -> offset in days from today
+_LITERAL_MAP = {'today': 0, 'tomorrow': 1, 'yesterday': -1}
+
+# Numeric formats matched by regex instead of strptime (no exception per miss).
+# Each entry maps the match groups to candidate (year, month, day) tuples,
+# tried in order, mirroring the old '%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y',
+# '%d-%m-%Y' precedence.
+_NUMERIC_DATE_FORMATS = [
+    (re.compile(r'^(\d{4})-(\d{1,2})-(\d{1,2})$'), lambda y, m, d: ((y, m, d),)),
+    (re.compile(r'^(\d{1,2})/(\d{1,2})/(\d{4})$'), lambda a, b, y: ((y, b, a), (y, a, b))),
+    (re.compile(r'^(\d{1,2})-(\d{1,2})-(\d{4})$'), lambda d, m, y: ((y, m, d),)),
+]
+
+# Month-name formats still go through strptime
+_MONTH_NAME_FORMATS = [
+    '%B %d, %Y',
+    '%b %d, %Y',
+    '%d %B %Y',
+    '%d %b %Y',
+]
 
 # Day of week patterns
 WEEKDAY_NAMES = {
@@ -43,19 +79,23 @@ WEEKDAY_NAMES = {
     'sunday': 6, 'sun': 6
 }
 
+# Whole-word weekday match, longest names first so "thursday" beats "thu"
+_WEEKDAY_RE = re.compile(
+    r'\b(' + '|'.join(sorted(WEEKDAY_NAMES, key=len, reverse=True)) + r')\b',
+    re.IGNORECASE
+)
+
 
-def _get_end_of_week() -> date:
+def _get_end_of_week(today: date) -> date:
     """Get the date of the coming Sunday."""
-    today = date.today()
     days_until_sunday = (6 - today.weekday()) % 7
     if days_until_sunday == 0:
         days_until_sunday = 7  # If today is Sunday, get next Sunday
     return today + timedelta(days=days_until_sunday)
 
 
-def _get_end_of_month() -> date:
+def _get_end_of_month(today: date) -> date:
     """Get the last day of the current month."""
-    today = date.today()
     if today.month == 12:
         next_month = date(today.year + 1, 1, 1)
     else:
@@ -63,44 +103,43 @@ def _get_end_of_month() -> date:
     return next_month - timedelta(days=1)
 
 
-def _get_next_weekday(weekday: int) -> date:
+def _get_next_weekday(weekday: int, today: date) -> date:
     """Get the next occurrence of a specific weekday (0=Monday, 6=Sunday)."""
-    today = date.today()
     days_ahead = weekday - today.weekday()
     if days_ahead <= 0:  # Target day already happened this week
         days_ahead += 7
     return today + timedelta(days=days_ahead)
 
 
-def _fallback_parse_date(text: str) -> Optional[date]:
+def _fallback_parse_date(text: str, today: Optional[date] = None) -> Optional[date]:
     """
     Fallback date parsing without dateparser library.
     Handles common natural language patterns.
     
     Args:
         text: Natural language date string
+        today: Reference date (defaults to date.today())
         
     Returns:
         Parsed date or None
     """
     text_lower = text.lower().strip()
+    if today is None:
+        today = date.today()
     
     # Try relative patterns first
-    for pattern, date_func in RELATIVE_DATE_PATTERNS.items():
-        match = re.match(pattern, text_lower, re.IGNORECASE)
+    for pattern, date_func in RELATIVE_DATE_PATTERNS:
+        match = pattern.match(text_lower)
         if match:
             try:
-                if match.groups():
-                    return date_func(match)
-                else:
-                    return date_func()
+                return date_func(match, today)
             except Exception:
                 continue
     
     # Try weekday names (e.g., "Friday", "next Monday")
-    for day_name, weekday in WEEKDAY_NAMES.items():
-        if day_name in text_lower:
-            return _get_next_weekday(weekday)
+    match = _WEEKDAY_RE.search(text_lower)
+    if match:
+        return _get_next_weekday(WEEKDAY_NAMES[match.group(1).lower()], today)
     
     return None
 
@@ -125,27 +164,37 @@ def parse_due_date(text: str) -> Optional[date]:
     
     text = str(text).strip()
     
-    # Try ISO format first (YYYY-MM-DD)
-    iso_pattern = r'^\d{4}-\d{2}-\d{2}$'
-    if re.match(iso_pattern, text):
+    # Try ISO format first (YYYY-MM-DD) - the common case for LLM output
+    if _ISO_RE.match(text):
         try:
             return date.fromisoformat(text)
         except ValueError:
             pass
     
-    # Try other common date formats
-    date_formats = [
-        '%Y-%m-%d',
-        '%d/%m/%Y',
-        '%m/%d/%Y',
-        '%d-%m-%Y',
-        '%B %d, %Y',
-        '%b %d, %Y',
-        '%d %B %Y',
-        '%d %b %Y',
-    ]
-    
-    for fmt in date_formats:
+    # Results depend on today's date, so it is part of the cache key
+    return _parse_due_date_cached(text, date.today().toordinal())
+
+
+@lru_cache(maxsize=1024)
+def _parse_due_date_cached(text: str, today_ordinal: int) -> Optional[date]:
+    """Parse a non-ISO due date; memoized per (text, day)."""
+    offset = _LITERAL_MAP.get(text.lower())
+    if offset is not None:
+        return date.fromordinal(today_ordinal + offset)
+    
+    # Try numeric formats via regex dispatch
+    for pattern, candidates in _NUMERIC_DATE_FORMATS:
+        match = pattern.match(text)
+        if match:
+            for year, month, day in candidates(*map(int, match.groups())):
+                try:
+                    return date(year, month, day)
+                except ValueError:
+                    continue
+            break
+    
+    # Try month-name formats
+    for fmt in _MONTH_NAME_FORMATS:
         try:
             parsed = datetime.strptime(text, fmt)
             return parsed.date()
@@ -153,7 +202,8 @@ def parse_due_date(text: str) -> Optional[date]:
             continue
     
     # Try natural language parsing with dateparser (if available)
-    if DATEPARSER_AVAILABLE and dateparser:
+    dateparser = _get_dateparser()
+    if dateparser:
         try:
             parsed = dateparser.parse(
                 text,
@@ -164,18 +214,18 @@ def parse_due_date(text: str) -> Optional[date]:
             )
             if parsed:
                 result = parsed.date()
-                logger.debug(f"Parsed '{text}' -> {result.isoformat()}")
+                logger.debug("Parsed '%s' -> %s", text, result)
                 return result
         except Exception as e:
-            logger.debug(f"dateparser failed for '{text}': {e}")
+            logger.debug("dateparser failed for '%s': %s", text, e)
     
     # Fallback to manual parsing
-    fallback_result = _fallback_parse_date(text)
+    fallback_result = _fallback_parse_date(text, date.fromordinal(today_ordinal))
     if fallback_result:
-        logger.debug(f"Fallback parsed '{text}' -> {fallback_result.isoformat()}")
+        logger.debug("Fallback parsed '%s' -> %s", text, fallback_result)
         return fallback_result
     
-    logger.warning(f"Could not parse date: '{text}'")
+    logger.warning("Could not parse date: '%s'", text)
     return None
 
 
@@ -204,4 +254,10 @@ def get_default_deadline(days_from_now: int = 7) -> date:
     Returns:
         Date object for the default deadline
     """
-    return date.today() + timedelta(days=days_from_now)
+    return _default_deadline(days_from_now, date.today().toordinal())
+
+
+@lru_cache(maxsize=16)
+def _default_deadline(days_from_now: int, today_ordinal: int) -> date:
+    """Default deadline memoized per (offset, day)."""
+    return date.fromordinal(today_ordinal + days_from_now)
@@ -5,7 +5,7 @@ from contextlib import contextmanager
 from typing import Generator
 
 from sqlalchemy import create_engine, event, text
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import scoped_session, sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 
 from app.config import settings
@@ -17,9 +17,12 @@ logger = get_logger(__name__)
 engine = create_engine(
     settings.database_url,
     poolclass=QueuePool,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=settings.database_pool_size,
+    max_overflow=settings.database_max_overflow,
+    pool_timeout=settings.database_pool_timeout,
     pool_pre_ping=True,  # Enable connection health checks
+    pool_recycle=settings.database_pool_recycle,
+    pool_use_lifo=settings.database_pool_use_lifo,
     echo=settings.debug,  # Log SQL queries in debug mode
 )
 
@@ -30,6 +33,10 @@ SessionLocal = sessionmaker(
     bind=engine,
 )
 
+# Thread-local registry over SessionLocal for background workers; each
+# thread gets one Session at a time via ScopedSession()
+ScopedSession = scoped_session(SessionLocal)
+
 
 def get_db() -> Generator[Session, None, None]:
     """
@@ -48,17 +55,25 @@ def get_db_session() -> Generator[Session, None, None]:
     """
     Context manager for database sessions.
     Use this for non-FastAPI contexts (e.g., background tasks).
+    The session comes from the thread-local ScopedSession registry, so
+    these blocks must not be nested within one thread.
+    
+    Raises:
+        RuntimeError: If called inside another get_db_session block on
+            the same thread, whose session the inner block would close
     """
-    db = SessionLocal()
+    if ScopedSession.registry.has():
+        raise RuntimeError("get_db_session blocks cannot be nested within one thread")
+    db = ScopedSession()
     try:
         yield db
         db.commit()
     except Exception as e:
         db.rollback()
-        logger.error(f"Database session error: {e}")
+        logger.error("Database session error: %s", e)
         raise
     finally:
-        db.close()
+        ScopedSession.remove()
 
 
 def init_db() -> None:
@@ -82,18 +97,20 @@ def check_db_connection() -> bool:
             conn.execute(text("SELECT 1"))
         return True
     except Exception as e:
-        logger.error(f"Database connection check failed: {e}")
+        logger.error("Database connection check failed: %s", e)
         return False
 
 
-# Event listeners for connection management
-@event.listens_for(engine, "connect")
-def on_connect(dbapi_conn, connection_record):
-    """Log new database connections."""
-    logger.debug("New database connection established")
-
+# Event listeners for connection management. Only registered at DEBUG level
+# so normal runs don't pay a Python call on every pool checkout. The level
+# comes from settings because logging isn't configured yet at import time.
+if settings.log_level.upper() == "DEBUG":
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_conn, connection_record):
+        """Log new database connections."""
+        logger.debug("New database connection established")
 
-@event.listens_for(engine, "checkout")
-def on_checkout(dbapi_conn, connection_record, connection_proxy):
-    """Log connection checkouts from pool."""
-    logger.debug("Database connection checked out from pool")
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_conn, connection_record, connection_proxy):
+        """Log connection checkouts from pool."""
+        logger.debug("Database connection checked out from pool")
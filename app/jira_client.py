@@ -1,17 +1,25 @@
 """
 Jira Cloud API client for creating issues and managing tasks.
 """
+import base64
+import copy
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Any, Tuple
-from functools import lru_cache
-from difflib import SequenceMatcher
+from functools import cache, lru_cache
 
 import requests
-from requests.auth import HTTPBasicAuth
+from cachetools import TTLCache
+from rapidfuzz import fuzz, process, utils
+from requests.adapters import HTTPAdapter
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from app import json_utils
 from app.config import settings
 from app.logger import get_logger
+from app.member_matching import NAME_ALIASES
 
 logger = get_logger(__name__)
 
@@ -23,6 +31,41 @@ TEAM_MEMBERS = [
     "Mukundan V S"
 ]
 
+# Per-member (original, lowercased, name parts), computed once so matching
+# does no string work on the constant side
+_TEAM_TABLE = tuple((m, m.lower(), tuple(m.lower().split())) for m in TEAM_MEMBERS)
+_TEAM_FIRST = {parts[0]: m for m, _, parts in _TEAM_TABLE}
+# Original name -> preprocessed form for rapidfuzz
+_TEAM_CHOICES = {m: utils.default_process(m) for m in TEAM_MEMBERS}
+# (member, name part) -> part, for scoring a misspelt single name ("nikil")
+_TEAM_PART_CHOICES = {
+    (m, part): part for m, _, parts in _TEAM_TABLE for part in parts if len(part) > 1
+}
+# Known nicknames and initials ("njp", "kyla") -> member
+_TEAM_ALIASES = {
+    alias.lower(): m for m, aliases in NAME_ALIASES.items() if m in TEAM_MEMBERS for alias in aliases
+}
+
+# Jira due dates must be YYYY-MM-DD; \Z (unlike $) rejects a trailing newline
+_DUE_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}\Z')
+
+
+def _adf_doc(text: str) -> Dict[str, Any]:
+    """
+    Wrap plain text in a single-paragraph Atlassian Document Format body.
+    
+    Args:
+        text: Paragraph text
+        
+    Returns:
+        ADF document dict
+    """
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [{"type": "paragraph", "content": [{"type": "text", "text": text}]}],
+    }
+
 
 def find_closest_team_member(name: str) -> Optional[str]:
     """
@@ -34,50 +77,88 @@ def find_closest_team_member(name: str) -> Optional[str]:
     Returns:
         Closest team member name or None if no good match
     """
-    if not name or name.lower() in ['unassigned', 'none', 'null']:
+    if not name:
+        return None
+    
+    # Normalize so "Nikhil" and " nikhil " share a cache slot
+    return _match_team_member(name.strip().lower())
+
+
+@lru_cache(maxsize=512)
+def _match_team_member(name: str) -> Optional[str]:
+    """Fuzzy-match a normalized (stripped, lowercased) name; memoized."""
+    if not name or name in ['unassigned', 'none', 'null']:
         return None
     
-    name_lower = name.lower()
-    best_match = None
-    best_ratio = 0.0
+    # Most inputs are an exact first or full name; skip fuzzy scoring for those
+    member = _TEAM_FIRST.get(name)
+    if member:
+        return member
+    for member, member_lower, member_parts in _TEAM_TABLE:
+        if name == member_lower or name in member_parts:
+            return member
+        if len(name) >= 3 and name in member_lower:
+            return member
+    member = _TEAM_ALIASES.get(name)
+    if member:
+        return member
     
-    for member in TEAM_MEMBERS:
-        # Check if any part of the name matches
-        member_parts = member.lower().split()
-        name_parts = name_lower.split()
-        
-        # Direct substring match
-        if name_lower in member.lower() or any(part in member.lower() for part in name_parts):
-            ratio = 0.8
-        else:
-            ratio = SequenceMatcher(None, name_lower, member.lower()).ratio()
-        
-        # Also check individual parts
-        for part in name_parts:
-            for member_part in member_parts:
-                part_ratio = SequenceMatcher(None, part, member_part).ratio()
-                if part_ratio > ratio:
-                    ratio = part_ratio
-        
-        if ratio > best_ratio:
-            best_ratio = ratio
-            best_match = member
+    # token_set_ratio scores shared name parts and the leftovers separately,
+    # so reordered or partial names score high while unrelated short names
+    # stay low (WRatio's partial scoring matched those at 50-70%); require
+    # at least 60% similarity
+    result = process.extractOne(
+        utils.default_process(name),
+        _TEAM_CHOICES,
+        scorer=fuzz.token_set_ratio,
+        processor=None,
+        score_cutoff=60,
+    )
+    
+    if result is None:
+        # A misspelt first or last name scores low against the full name;
+        # score it against each name part instead
+        part_result = process.extractOne(
+            name, _TEAM_PART_CHOICES, scorer=fuzz.ratio, processor=None, score_cutoff=70
+        )
+        if part_result is not None:
+            _, score, (member, _) = part_result
+            result = (_TEAM_CHOICES[member], score, member)
     
-    # Require at least 50% match
-    if best_ratio >= 0.5:
-        logger.info(f"Matched '{name}' to team member '{best_match}' (similarity: {best_ratio:.2f})")
+    if result is not None:
+        _, score, best_match = result
+        logger.info(
+            "Matched '%s' to team member '%s' (similarity: %.2f)",
+            name,
+            best_match,
+            score / 100
+        )
         return best_match
     
-    logger.warning(f"No team member match found for '{name}'")
+    logger.warning("No team member match found for '%s'", name)
     return None
 
 
+def clear_team_member_cache() -> None:
+    """Forget memoized team member matches, e.g. after TEAM_MEMBERS changes."""
+    _match_team_member.cache_clear()
+
+
 class JiraClient:
     """
     Client for interacting with Jira Cloud REST API v3.
     Handles issue creation, duplicate detection, and user management.
     """
     
+    # Seconds before the project's issue types are fetched again
+    ISSUE_TYPES_TTL = 300.0
+    # Seconds a fetched issue is served from cache, and how many are kept
+    ISSUE_CACHE_TTL = 30.0
+    ISSUE_CACHE_SIZE = 256
+    # Seconds a display name with no Jira user is remembered, and how many are kept
+    USER_MISS_TTL = 600.0
+    USER_MISS_CACHE_SIZE = 1024
+    
     def __init__(self):
         """Initialize the Jira client with configuration."""
         self.server = settings.jira_server.rstrip('/')
@@ -85,24 +166,54 @@ class JiraClient:
         self.api_token = settings.jira_api_token
         self.project_key = settings.jira_project_key
         
-        self._auth = HTTPBasicAuth(self.email, self.api_token) if self.email and self.api_token else None
-        self._user_cache: Dict[str, str] = {}  # Cache for display name -> account ID mapping
-        self._issue_types_cache: Optional[List[str]] = None  # Cache for valid issue types
+        # Computed once; checked or used on every API call
+        self._configured = bool(self.server and self.email and self.api_token and self.project_key)
+        self._base_url = f"{self.server}/rest/api/3"
+        self._headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json"
+        }
         
-        logger.info(f"Jira client initialized for server: {self.server}")
+        # Basic auth header encoded once instead of by requests' auth hook per call
+        self._auth_header: Optional[str] = None
+        if self.email and self.api_token:
+            credentials = f"{self.email}:{self.api_token}".encode()
+            self._auth_header = "Basic " + base64.b64encode(credentials).decode()
+        # display name -> account ID
+        self._user_cache: Dict[str, str] = {}
+        # display names with no Jira user; they expire so a user added later is found
+        self._user_misses: TTLCache = TTLCache(maxsize=self.USER_MISS_CACHE_SIZE, ttl=self.USER_MISS_TTL)
+        self._user_misses_lock = threading.Lock()
+        # display name -> Event set when the in-flight lookup for it finishes
+        self._inflight: Dict[str, threading.Event] = {}
+        self._inflight_lock = threading.Lock()
+        # (issue types, fetched_at) for the project, refreshed after ISSUE_TYPES_TTL
+        self._issue_types_cache: Optional[Tuple[List[str], float]] = None
+        # preferred.lower() -> resolved issue type; reset whenever types are refetched
+        self._valid_type_cache: Dict[str, str] = {}
+        # issue key -> (issue, fetched_at), oldest first
+        self._issue_cache: Dict[str, Tuple[Dict[str, Any], float]] = {}
+        
+        # Persistent session so calls reuse keep-alive connections
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        if self._auth_header:
+            self._session.headers["Authorization"] = self._auth_header
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        
+        logger.info("Jira client initialized for server: %s", self.server)
     
     @property
     def is_configured(self) -> bool:
         """Check if the client is properly configured."""
-        return bool(self.server and self.email and self.api_token and self.project_key)
+        return self._configured
     
     @property
     def headers(self) -> Dict[str, str]:
         """Get standard headers for API requests."""
-        return {
-            "Accept": "application/json",
-            "Content-Type": "application/json"
-        }
+        return self._headers
     
     def get_project_issue_types(self) -> List[str]:
         """
@@ -112,26 +223,27 @@ class JiraClient:
             List of valid issue type names
         """
         if self._issue_types_cache is not None:
-            return self._issue_types_cache
+            issue_types, fetched_at = self._issue_types_cache
+            if time.monotonic() - fetched_at < self.ISSUE_TYPES_TTL:
+                return issue_types
         
         try:
-            url = f"{self.server}/rest/api/3/project/{self.project_key}"
-            response = requests.get(
+            url = f"{self._base_url}/project/{self.project_key}"
+            response = self._session.get(
                 url,
-                headers=self.headers,
-                auth=self._auth,
                 timeout=30
             )
             response.raise_for_status()
-            project_data = response.json()
+            project_data = json_utils.loads(response.content)
             
             issue_types = [it["name"] for it in project_data.get("issueTypes", [])]
-            self._issue_types_cache = issue_types
-            logger.info(f"Available issue types for {self.project_key}: {issue_types}")
+            self._issue_types_cache = (issue_types, time.monotonic())
+            self._valid_type_cache.clear()
+            logger.info("Available issue types for %s: %s", self.project_key, issue_types)
             return issue_types
             
         except Exception as e:
-            logger.error(f"Error getting project issue types: {e}")
+            logger.error("Error getting project issue types: %s", e)
             return []
     
     def get_valid_issue_type(self, preferred: str = "Task") -> str:
@@ -149,6 +261,17 @@ class JiraClient:
         if not issue_types:
             return preferred  # Return preferred and let API fail with better error
         
+        preferred_lower = preferred.lower()
+        resolved = self._valid_type_cache.get(preferred_lower)
+        if resolved:
+            return resolved
+        
+        resolved = self._resolve_issue_type(preferred, issue_types)
+        self._valid_type_cache[preferred_lower] = resolved
+        return resolved
+    
+    def _resolve_issue_type(self, preferred: str, issue_types: List[str]) -> str:
+        """Pick the preferred issue type if available, else a fallback."""
         # Check if preferred type exists
         for it in issue_types:
             if it.lower() == preferred.lower():
@@ -159,11 +282,11 @@ class JiraClient:
         for fb in fallbacks:
             for it in issue_types:
                 if it.lower() == fb.lower():
-                    logger.info(f"Using fallback issue type: {it} ('{preferred}' not available)")
+                    logger.info("Using fallback issue type: %s ('%s' not available)", it, preferred)
                     return it
         
         # Use first available
-        logger.info(f"Using first available issue type: {issue_types[0]}")
+        logger.info("Using first available issue type: %s", issue_types[0])
         return issue_types[0]
 
     @retry(
@@ -183,31 +306,30 @@ class JiraClient:
         if not self.is_configured:
             raise RuntimeError("Jira client not configured")
         
-        url = f"{self.server}/rest/api/3/user/search"
+        url = self._base_url + "/user/search"
         params = {"query": query, "maxResults": 10}
         
         try:
-            response = requests.get(
+            response = self._session.get(
                 url,
                 params=params,
-                headers=self.headers,
-                auth=self._auth,
                 timeout=30
             )
             response.raise_for_status()
-            users = response.json()
+            users = json_utils.loads(response.content)
             
-            logger.debug(f"Found {len(users)} users matching '{query}'")
+            logger.debug("Found %s users matching '%s'", len(users), query)
             return users
             
         except requests.RequestException as e:
-            logger.error(f"Error searching users: {e}")
+            logger.error("Error searching users: %s", e)
             raise
     
     def get_account_id_by_name(self, display_name: str) -> Optional[str]:
         """
         Get Jira account ID by display name.
-        Uses cache to minimize API calls.
+        Uses cache to minimize API calls; names with no match are cached for
+        USER_MISS_TTL seconds.
         
         Args:
             display_name: User's display name
@@ -216,9 +338,50 @@ class JiraClient:
             Account ID or None if not found
         """
         # Check cache first
-        if display_name in self._user_cache:
-            return self._user_cache[display_name]
+        hit, account_id = self._cached_account_id(display_name)
+        if hit:
+            return account_id
+        
+        # Single-flight: only one thread searches per name, others wait for it
+        with self._inflight_lock:
+            hit, account_id = self._cached_account_id(display_name)
+            if hit:
+                return account_id
+            event = self._inflight.get(display_name)
+            is_leader = event is None
+            if is_leader:
+                event = threading.Event()
+                self._inflight[display_name] = event
+        
+        if not is_leader:
+            event.wait(timeout=60)
+            return self._cached_account_id(display_name)[1]
         
+        try:
+            return self._lookup_account_id(display_name)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(display_name, None)
+            event.set()
+    
+    def _cached_account_id(self, display_name: str) -> Tuple[bool, Optional[str]]:
+        """(hit, account ID) from the user caches; a remembered miss is a hit with None."""
+        account_id = self._user_cache.get(display_name)
+        if account_id is not None:
+            return True, account_id
+        with self._user_misses_lock:
+            return display_name in self._user_misses, None
+    
+    def _remember_account_id(self, display_name: str, account_id: Optional[str]) -> None:
+        """Cache a lookup result; an empty result is remembered as a miss."""
+        if account_id:
+            self._user_cache[display_name] = account_id
+        else:
+            with self._user_misses_lock:
+                self._user_misses[display_name] = True
+    
+    def _lookup_account_id(self, display_name: str) -> Optional[str]:
+        """Search Jira for a display name and cache the resulting account ID."""
         try:
             users = self.search_users(display_name)
             
@@ -226,23 +389,26 @@ class JiraClient:
             for user in users:
                 if user.get('displayName', '').lower() == display_name.lower():
                     account_id = user.get('accountId')
-                    if account_id:
-                        self._user_cache[display_name] = account_id
+                    self._remember_account_id(display_name, account_id)
                     return account_id
             
             # Fall back to first result if available
             if users:
                 account_id = users[0].get('accountId')
-                if account_id:
-                    self._user_cache[display_name] = account_id
-                logger.info(f"Using approximate match for '{display_name}': {users[0].get('displayName')}")
+                self._remember_account_id(display_name, account_id)
+                logger.info(
+                    "Using approximate match for '%s': %s",
+                    display_name,
+                    users[0].get('displayName')
+                )
                 return account_id
             
-            logger.warning(f"No user found for display name: {display_name}")
+            logger.warning("No user found for display name: %s", display_name)
+            self._remember_account_id(display_name, None)
             return None
             
         except Exception as e:
-            logger.error(f"Error getting account ID for '{display_name}': {e}")
+            logger.error("Error getting account ID for '%s': %s", display_name, e)
             return None
     
     # Stopwords to filter out when extracting keywords for duplicate search
@@ -314,7 +480,7 @@ class JiraClient:
         if not self.is_configured:
             raise RuntimeError("Jira client not configured")
         
-        url = f"{self.server}/rest/api/3/search"
+        url = self._base_url + "/search"
         
         # POST body for Jira Cloud search API
         payload = {
@@ -324,11 +490,9 @@ class JiraClient:
         }
         
         try:
-            response = requests.post(
+            response = self._session.post(
                 url,
-                json=payload,
-                headers=self.headers,
-                auth=self._auth,
+                data=json_utils.dumps(payload),
                 timeout=30
             )
             
@@ -336,7 +500,7 @@ class JiraClient:
             if response.status_code == 400:
                 error_data = response.json() if response.text else {}
                 error_msg = error_data.get("errorMessages", ["Invalid JQL query"])[0]
-                logger.warning(f"JQL syntax error: {error_msg}")
+                logger.warning("JQL syntax error: %s", error_msg)
                 return []
             
             if response.status_code == 403:
@@ -348,20 +512,20 @@ class JiraClient:
                 return []
             
             response.raise_for_status()
-            data = response.json()
+            data = json_utils.loads(response.content)
             
             issues = data.get("issues", [])
-            logger.debug(f"JQL search returned {len(issues)} results for: {jql[:80]}...")
+            logger.debug("JQL search returned %s results for: %s...", len(issues), jql[:80])
             return issues
             
         except requests.exceptions.Timeout:
             logger.error("Jira search timed out")
             return []
         except requests.exceptions.ConnectionError as e:
-            logger.error(f"Jira connection error: {e}")
+            logger.error("Jira connection error: %s", e)
             return []
         except requests.RequestException as e:
-            logger.error(f"Error searching issues: {e}")
+            logger.error("Error searching issues: %s", e)
             return []
     
     def find_similar_issue(
@@ -398,11 +562,11 @@ class JiraClient:
             text_search = " OR ".join([f'summary ~ "{kw}"' for kw in keywords])
             jql_parts.append(f"({text_search})")
         else:
-            logger.warning(f"No keywords extracted from summary: {summary[:50]}...")
+            logger.warning("No keywords extracted from summary: %s...", summary[:50])
             return None, 0.0
         
         jql = " AND ".join(jql_parts)
-        logger.debug(f"Duplicate search JQL: {jql}")
+        logger.debug("Duplicate search JQL: %s", jql)
         
         try:
             issues = self.search_issues(jql, max_results=10)
@@ -418,8 +582,10 @@ class JiraClient:
             for issue in issues:
                 existing_summary = issue.get("fields", {}).get("summary", "").lower()
                 
-                # Calculate similarity using SequenceMatcher
-                similarity = SequenceMatcher(None, summary_lower, existing_summary).ratio()
+                # Normalized Indel similarity, 2 * LCS / total length. Never
+                # below difflib's SequenceMatcher.ratio (which scores greedy
+                # matching blocks), and equal to it for typical reworded summaries
+                similarity = fuzz.ratio(summary_lower, existing_summary) / 100.0
                 
                 # Boost score if assignee matches
                 if assignee_name:
@@ -435,13 +601,13 @@ class JiraClient:
             
             if best_score >= similarity_threshold:
                 issue_key = best_match.get("key") if best_match else "Unknown"
-                logger.info(f"Found similar issue: {issue_key} (similarity: {best_score:.2%})")
+                logger.info("Found similar issue: %s (similarity: %.2f%%)", issue_key, best_score * 100)
                 return best_match, best_score
             
             return None, best_score
             
         except Exception as e:
-            logger.error(f"Error finding similar issue: {e}")
+            logger.error("Error finding similar issue: %s", e)
             return None, 0.0
     
     def check_for_duplicate(
@@ -464,7 +630,12 @@ class JiraClient:
         if similar_issue:
             issue_key = similar_issue.get("key")
             existing_summary = similar_issue.get("fields", {}).get("summary", "")
-            logger.info(f"Potential duplicate found: {issue_key} - '{existing_summary}' (similarity: {score:.0%})")
+            logger.info(
+                "Potential duplicate found: %s - '%s' (similarity: %.0f%%)",
+                issue_key,
+                existing_summary,
+                score * 100
+            )
             return issue_key
         
         return None
@@ -503,7 +674,7 @@ class JiraClient:
         if not self.is_configured:
             raise RuntimeError("Jira client not configured")
         
-        url = f"{self.server}/rest/api/3/issue"
+        url = self._base_url + "/issue"
         
         # Get valid issue type
         valid_issue_type = self.get_valid_issue_type(issue_type)
@@ -517,21 +688,7 @@ class JiraClient:
         
         # Add description in ADF format
         if description:
-            fields["description"] = {
-                "type": "doc",
-                "version": 1,
-                "content": [
-                    {
-                        "type": "paragraph",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": description
-                            }
-                        ]
-                    }
-                ]
-            }
+            fields["description"] = _adf_doc(description)
         
         # Add assignee if provided
         if assignee_name:
@@ -539,15 +696,18 @@ class JiraClient:
             if account_id:
                 fields["assignee"] = {"accountId": account_id}
             else:
-                logger.warning(f"Could not find assignee '{assignee_name}', creating unassigned issue")
+                logger.warning(
+                    "Could not find assignee '%s', creating unassigned issue",
+                    assignee_name
+                )
         
         # Add due date (validate format first)
         if due_date:
             # Validate YYYY-MM-DD format
-            if re.match(r'^\d{4}-\d{2}-\d{2}$', str(due_date)):
+            if _DUE_DATE_RE.match(due_date if isinstance(due_date, str) else str(due_date)):
                 fields["duedate"] = due_date
             else:
-                logger.warning(f"Invalid due_date format '{due_date}', skipping")
+                logger.warning("Invalid due_date format '%s', skipping", due_date)
         
         # Add labels
         if labels:
@@ -564,23 +724,21 @@ class JiraClient:
         payload = {"fields": fields}
         
         try:
-            response = requests.post(
+            response = self._session.post(
                 url,
-                json=payload,
-                headers=self.headers,
-                auth=self._auth,
+                data=json_utils.dumps(payload),
                 timeout=30
             )
             response.raise_for_status()
-            issue = response.json()
+            issue = json_utils.loads(response.content)
             
-            logger.info(f"Created Jira issue: {issue.get('key')}")
+            logger.info("Created Jira issue: %s", issue.get('key'))
             return issue
             
         except requests.RequestException as e:
-            logger.error(f"Error creating Jira issue: {e}")
+            logger.error("Error creating Jira issue: %s", e)
             if hasattr(e, 'response') and e.response is not None:
-                logger.error(f"Response: {e.response.text}")
+                logger.error("Response: %s", e.response.text)
             raise
     
     def create_issues_from_tasks(
@@ -600,7 +758,7 @@ class JiraClient:
         """
         created_keys = []
         
-        for task in tasks:
+        def _one(task: Dict[str, Any]) -> Optional[str]:
             title = task.get('title', 'Untitled Task')
             assignee = task.get('assignee')
             due_date = task.get('due_date')
@@ -624,13 +782,24 @@ class JiraClient:
                     due_date=due_date,
                     labels=["meeting-action-item"]
                 )
-                created_keys.append(issue.get('key'))
+                return issue.get('key')
                 
             except Exception as e:
-                logger.error(f"Failed to create issue for task '{title}': {e}")
-                continue
-        
-        logger.info(f"Created {len(created_keys)} Jira issues")
+                logger.error("Failed to create issue for task '%s': %s", title, e)
+                return None
+        
+        # Issue creation is I/O bound; run a few at once over the shared session
+        if tasks:
+            with ThreadPoolExecutor(max_workers=min(5, len(tasks))) as executor:
+                # Resolve each distinct assignee once up front, in parallel;
+                # create_issue then hits the user cache instead of searching
+                # per task
+                if self.is_configured:
+                    assignees = {t['assignee'] for t in tasks if t.get('assignee')}
+                    list(executor.map(self.get_account_id_by_name, assignees))
+                created_keys = [key for key in executor.map(_one, tasks) if key]
+        
+        logger.info("Created %s Jira issues", len(created_keys))
         return created_keys
     
     @retry(
@@ -645,25 +814,34 @@ class JiraClient:
             issue_key: Issue key (e.g., PROJ-123)
             
         Returns:
-            Issue details
+            Issue details, as a copy the caller may modify
         """
         if not self.is_configured:
             raise RuntimeError("Jira client not configured")
         
-        url = f"{self.server}/rest/api/3/issue/{issue_key}"
+        cached = self._issue_cache.get(issue_key)
+        if cached is not None and time.monotonic() - cached[1] < self.ISSUE_CACHE_TTL:
+            return copy.deepcopy(cached[0])
+        
+        url = f"{self._base_url}/issue/{issue_key}"
         
         try:
-            response = requests.get(
+            response = self._session.get(
                 url,
-                headers=self.headers,
-                auth=self._auth,
                 timeout=30
             )
             response.raise_for_status()
-            return response.json()
+            issue = json_utils.loads(response.content)
+            
+            # Re-insert so the key moves to the end, then drop the oldest entry
+            self._issue_cache.pop(issue_key, None)
+            self._issue_cache[issue_key] = (issue, time.monotonic())
+            if len(self._issue_cache) > self.ISSUE_CACHE_SIZE:
+                self._issue_cache.pop(next(iter(self._issue_cache)), None)
+            return copy.deepcopy(issue)
             
         except requests.RequestException as e:
-            logger.error(f"Error getting issue {issue_key}: {e}")
+            logger.error("Error getting issue %s: %s", issue_key, e)
             raise
     
     def test_connection(self) -> bool:
@@ -676,32 +854,48 @@ class JiraClient:
         if not self.is_configured:
             return False
         
-        url = f"{self.server}/rest/api/3/myself"
+        url = self._base_url + "/myself"
         
         try:
-            response = requests.get(
+            response = self._session.get(
                 url,
-                headers=self.headers,
-                auth=self._auth,
                 timeout=30
             )
             response.raise_for_status()
-            user = response.json()
-            logger.info(f"Jira connection successful. Authenticated as: {user.get('displayName')}")
+            user = json_utils.loads(response.content)
+            logger.info("Jira connection successful. Authenticated as: %s", user.get('displayName'))
             return True
             
         except Exception as e:
-            logger.error(f"Jira connection test failed: {e}")
+            logger.error("Jira connection test failed: %s", e)
             return False
+    
+    def warmup(self) -> None:
+        """
+        Open a connection and prefetch project metadata.
+        
+        Intended to run in the background at startup so the first
+        create_issue doesn't absorb these round trips.
+        """
+        if not self.is_configured:
+            return
+        self.test_connection()
+        self.get_project_issue_types()
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
 
 
 # Singleton instance
-_jira_client: Optional[JiraClient] = None
-
-
+@cache
 def get_jira_client() -> JiraClient:
     """Get or create the singleton Jira client instance."""
-    global _jira_client
-    if _jira_client is None:
-        _jira_client = JiraClient()
-    return _jira_client
+    return JiraClient()
+
+
+def close_jira_client() -> None:
+    """Close the Jira client singleton's session, if one was created."""
+    if get_jira_client.cache_info().currsize:
+        get_jira_client().close()
+        get_jira_client.cache_clear()
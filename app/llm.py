@@ -1,29 +1,439 @@
 """
 LLM interface using Groq API for meeting summarization and task extraction.
 """
-import json
-from typing import Optional, List, Dict, Any
+import asyncio
+import copy
+import hashlib
+import re
+import threading
+import time
+from collections import Counter
+from typing import Optional, List, Dict, Any, AsyncIterator, Awaitable, Callable, Iterator, Tuple, Union
 
 # Try to import langchain_groq, but allow fallback if not installed
 try:
     from langchain_groq import ChatGroq
     from langchain_core.messages import HumanMessage, SystemMessage
     from pydantic import SecretStr
+    from groq import APIConnectionError, InternalServerError, RateLimitError
+    import httpx
     LANGCHAIN_AVAILABLE = True
 except ImportError:
     ChatGroq = None  # type: ignore
     HumanMessage = None  # type: ignore
     SystemMessage = None  # type: ignore
     SecretStr = None  # type: ignore
+    APIConnectionError = InternalServerError = RateLimitError = None  # type: ignore
+    httpx = None  # type: ignore
     LANGCHAIN_AVAILABLE = False
 
-from tenacity import retry, stop_after_attempt, wait_exponential
+# Optional: ijson lets streamed task JSON be parsed as it arrives
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    ijson = None  # type: ignore
+    IJSON_AVAILABLE = False
+
+# HTTP/2 for the Groq connection needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+from cachetools import LRUCache
+from tenacity import (
+    AsyncRetrying,
+    Retrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
+from app import json_utils
 from app.config import settings
 from app.logger import get_logger
 
 logger = get_logger(__name__)
 
+__all__ = ["LLMClient", "get_llm_client", "get_llm_client_async"]
+
+# Transient Groq errors worth retrying; auth, bad requests and JSON errors are not
+_RETRYABLE_ERRORS: tuple = (
+    (RateLimitError, APIConnectionError, InternalServerError) if LANGCHAIN_AVAILABLE else ()
+)
+
+
+# System prompts are module constants so repeated calls of one type send
+# an identical prefix
+TITLE_SYSTEM_PROMPT = """Extract a concise, descriptive meeting title from the transcript.
+
+RULES:
+1. Identify the main project, topic, or theme of the meeting
+2. If a project name is mentioned, include it (e.g., "Project Alpha Sprint Planning")
+3. If no specific project, use the main topic discussed
+4. Keep title under 60 characters
+5. Format: "[Project/Topic] - [Meeting Type]" or just "[Main Topic]"
+6. Examples: "Project Phoenix - Weekly Sync", "API Integration Review", "Q4 Budget Planning"
+7. Return ONLY the title, no explanation"""
+
+PROJECT_SYSTEM_PROMPT = """Extract the project or product name from the meeting discussion.
+
+RULES:
+1. Look for explicit project names (e.g., "Project Alpha", "Phoenix App", "Customer Portal")
+2. Look for product names being discussed
+3. If multiple projects mentioned, return the main one being discussed
+4. Return ONLY the project/product name, nothing else
+5. If no clear project name, return "NONE"
+6. Do NOT make up a project name
+7. Examples of valid outputs: "Project Alpha", "E-Commerce Platform", "Mobile App v2", "NONE" """
+
+SUMMARIZE_SYSTEM_PROMPT = """Summarize the meeting in 1-2 sentences. Be direct and concise."""
+
+TASKS_SYSTEM_PROMPT = """Extract the tasks/action items as JSON: {"tasks": [{"title": "task description", "assignee": "person name or Unassigned", "due_date": "YYYY-MM-DD or null"}]}"""
+
+_ANALYZE_FIELD_RULES = """meeting_title:
+- Concise and descriptive, under 60 characters
+- Include the project name if one is mentioned (e.g., "Project Phoenix - Weekly Sync")
+- Otherwise use the main topic discussed (e.g., "API Integration Review")
+
+project_name:
+- The explicit project or product name being discussed; the main one if several
+- "NONE" if no clear project name is mentioned; do NOT make one up
+
+summary:
+- 1-2 sentences, direct and concise
+
+tasks:
+- Every action item; look for words like: will, should, needs to, assigned to, responsible for
+- If no clear assignee, use "Unassigned"
+- If no due date mentioned, use null
+- If no tasks found, use an empty list
+
+Respond with JSON only."""
+
+ANALYZE_SYSTEM_PROMPT = """Analyze the meeting transcript and return a single JSON object with exactly these keys:
+{"meeting_title": "...", "project_name": "...", "summary": "...", "tasks": [{"title": "task description", "assignee": "person name", "due_date": "YYYY-MM-DD"}]}
+
+""" + _ANALYZE_FIELD_RULES
+
+BATCH_ANALYZE_SYSTEM_PROMPT = """Analyze each numbered meeting transcript separately and return a single JSON object:
+{"results": [{"id": 1, "meeting_title": "...", "project_name": "...", "summary": "...", "tasks": [{"title": "task description", "assignee": "person name", "due_date": "YYYY-MM-DD"}]}]}
+with one entry per transcript, "id" being its number.
+
+""" + _ANALYZE_FIELD_RULES
+
+SUMMARY_TASKS_SYSTEM_PROMPT = """Summarize the meeting and extract its tasks/action items. Return a single JSON object:
+{"summary": "1-2 direct, concise sentences", "tasks": [{"title": "task description", "assignee": "person name or Unassigned", "due_date": "YYYY-MM-DD or null"}]}"""
+
+# SystemMessage objects for the static prompts, built once and looked up by
+# prompt text in LLMClient._messages
+_SYSTEM_MESSAGES: Dict[str, Any] = {
+    prompt: SystemMessage(content=prompt)  # type: ignore[misc]
+    for prompt in (
+        TITLE_SYSTEM_PROMPT,
+        PROJECT_SYSTEM_PROMPT,
+        SUMMARIZE_SYSTEM_PROMPT,
+        TASKS_SYSTEM_PROMPT,
+        ANALYZE_SYSTEM_PROMPT,
+        BATCH_ANALYZE_SYSTEM_PROMPT,
+        SUMMARY_TASKS_SYSTEM_PROMPT,
+    )
+} if LANGCHAIN_AVAILABLE else {}
+
+# Groq's OpenAI-compatible REST base, used directly for the Batch API
+GROQ_API_BASE = "https://api.groq.com/openai/v1"
+
+# Output ceilings per call type so a rambling reply can't stretch latency;
+# title/project also stop at the first blank line, before any explanation
+TITLE_LIMITS: Dict[str, Any] = {"max_tokens": 32, "stop": ["\n\n"]}
+PROJECT_LIMITS: Dict[str, Any] = {"max_tokens": 16, "stop": ["\n\n"]}
+SUMMARY_LIMITS: Dict[str, Any] = {"max_tokens": 128}
+TASKS_LIMITS: Dict[str, Any] = {"max_tokens": 512}
+ANALYZE_LIMITS: Dict[str, Any] = {"max_tokens": 768}
+SUMMARY_TASKS_LIMITS: Dict[str, Any] = {"max_tokens": 640}
+
+# Transcripts under this many words can skip the LLM for title, summary and
+# project when settings.llm_fast_path_enabled is on
+FAST_PATH_MAX_WORDS = 40
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+# JSON object inside a markdown fence (```json ... ``` or plain ```), for
+# replies that weren't produced in JSON mode
+# Marks an exhausted stream when peeking at its first chunk
+_STREAM_END = object()
+_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.IGNORECASE | re.DOTALL)
+# Keyword is case-insensitive; the name must be capitalized words
+_PROJECT_NAME_RE = re.compile(r"\b((?i:project|product))\s+([A-Z][\w-]*(?:\s+[A-Z][\w-]*)*)")
+
+# Entity labels that name a project or product in spaCy's English models
+_PROJECT_ENTITY_LABELS = {"PRODUCT", "ORG", "WORK_OF_ART"}
+
+# spaCy pipeline, loaded on first use; False once loading has failed
+_nlp = None
+
+
+def _get_nlp():
+    """Load spaCy's en_core_web_sm on first call; returns the pipeline or None."""
+    global _nlp
+    if _nlp is None:
+        try:
+            import spacy
+            _nlp = spacy.load("en_core_web_sm")
+        except (ImportError, OSError) as e:
+            _nlp = False
+            logger.warning("spaCy model unavailable, using the LLM for title/project: %s", e)
+    return _nlp or None
+
+
+def _most_common_project(doc) -> Optional[str]:
+    """Most frequent product/organization entity in a spaCy doc, or None."""
+    counts = Counter(
+        ent.text.strip() for ent in doc.ents if ent.label_ in _PROJECT_ENTITY_LABELS
+    )
+    return counts.most_common(1)[0][0] if counts else None
+
+
+def _ner_project(transcript: str) -> Optional[str]:
+    """Project/product name from a local NER pass, or None."""
+    nlp = _get_nlp()
+    if nlp is None:
+        return None
+    return _most_common_project(nlp(transcript[:1500]))
+
+
+def _ner_title(transcript: str) -> Optional[str]:
+    """Title from the most frequent noun chunk, prefixed by any project, or None."""
+    nlp = _get_nlp()
+    if nlp is None:
+        return None
+    doc = nlp(transcript[:2000])
+    # Noun chunks without their articles ("the release plan" -> "release plan")
+    counts = Counter(
+        " ".join(token.text for token in chunk if token.pos_ != "DET").lower()
+        for chunk in doc.noun_chunks
+        if chunk.root.pos_ not in ("PRON", "PROPN") and len(chunk.text) > 3
+    )
+    if not counts:
+        return None
+    topic = counts.most_common(1)[0][0].title()
+    project = _most_common_project(doc)
+    return f"{project} - {topic}" if project else topic
+
+# tiktoken encoding used to budget prompt tokens, loaded on first use;
+# False once loading has failed
+_encoding = None
+
+
+def _get_encoding():
+    """Load the cl100k_base tiktoken encoding on first call; returns it or None."""
+    global _encoding
+    if _encoding is None:
+        try:
+            import tiktoken
+            _encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            _encoding = False
+            logger.warning("tiktoken unavailable, budgeting prompts by characters: %s", e)
+    return _encoding or None
+
+
+def _head_tokens(text: str, max_tokens: int) -> str:
+    """
+    Return the leading part of text that fits in max_tokens tokens.
+    cl100k_base is close enough to Llama's tokenizer for budgeting. Without
+    tiktoken, about 4 characters per token is assumed.
+    
+    Args:
+        text: Text to truncate
+        max_tokens: Token budget
+        
+    Returns:
+        The longest token-aligned prefix within the budget
+    """
+    # Every token covers at least one character, so short text always fits
+    if len(text) <= max_tokens:
+        return text
+    encoding = _get_encoding()
+    if encoding is None:
+        return text[:max_tokens * 4]
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
+
+
+def _count_tokens(text: str) -> int:
+    """Approximate token count of text, for quota budgeting."""
+    encoding = _get_encoding()
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def _transcript_block(transcript: str) -> str:
+    """
+    Opening of every per-transcript user prompt, with any call-specific cue
+    after it.
+    
+    Each call type has its own system prompt in front of this block, and
+    title/project extraction pass a truncated transcript, so prompts are
+    only prefix-identical across repeated calls of the same type (which is
+    also what keeps the response cache key stable).
+    """
+    return f"TRANSCRIPT:\n{transcript}"
+
+
+class _TaskStream:
+    """
+    Incremental parser for a streamed {"tasks": [...]} reply.
+    
+    feed() takes each text chunk and returns the task objects completed by
+    it. Groq's JSON mode can't stream, so the reply may carry a markdown
+    fence; text before the first "{" is not fed to the parser. Without
+    ijson, or once the text stops being clean JSON, feed() only buffers
+    and the caller parses text() at the end.
+    """
+    
+    def __init__(self):
+        # items_coro appends each finished task object to _items
+        self._items = ijson.sendable_list() if IJSON_AVAILABLE else []
+        self._parser = ijson.items_coro(self._items, "tasks.item") if IJSON_AVAILABLE else None
+        self._buffer: List[str] = []
+        self._started = False
+    
+    def feed(self, text: str) -> List[Any]:
+        """Add a chunk of reply text; return any tasks it completed."""
+        self._buffer.append(text)
+        if self._parser is None:
+            return []
+        if not self._started:
+            joined = "".join(self._buffer)
+            brace = joined.find("{")
+            if brace < 0:
+                return []
+            self._started = True
+            text = joined[brace:]
+        try:
+            self._parser.send(text.encode("utf-8"))
+        except Exception as e:
+            logger.debug("Streamed tasks not parseable incrementally: %s", e)
+            self._parser = None
+            return []
+        done = list(self._items)
+        del self._items[:]
+        return done
+    
+    def text(self) -> str:
+        """The full reply received so far."""
+        return "".join(self._buffer)
+
+
+class _QuotaBucket:
+    """
+    Thread-safe token bucket for a per-minute quota (requests or tokens).
+    
+    Holds up to `per_minute` units, refilled continuously. reserve() takes
+    units immediately and returns how long the caller must wait before
+    using them, so sync and async callers can sleep their own way. A quota
+    of 0 disables limiting.
+    """
+    
+    def __init__(self, per_minute: int):
+        self.capacity = float(max(per_minute, 0))
+        self.rate = self.capacity / 60.0
+        self._units = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self, amount: float = 1.0) -> float:
+        """Take amount units (capped at capacity); return seconds to wait."""
+        if not self.capacity:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._units = min(self.capacity, self._units + (now - self._updated) * self.rate)
+            self._updated = now
+            self._units -= min(amount, self.capacity)
+            return -self._units / self.rate if self._units < 0 else 0.0
+
+
+def _retry_after_seconds(error: BaseException) -> Optional[float]:
+    """Parse a numeric Retry-After header from a Groq API error, if present."""
+    response = getattr(error, "response", None)
+    value = response.headers.get("retry-after") if response is not None else None
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
+
+# Event loop that owns the pooled async Groq connections. A connection
+# belongs to the loop that opened it, so every async request runs here: sync
+# wrappers block on it via _run, and async callers on any other loop (e.g.
+# FastAPI's) await it via _on_io_loop / _aiter_on_io_loop
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _io_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background loop, starting its thread on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="llm-event-loop", daemon=True).start()
+    return _loop
+
+
+def _run(coro: Any) -> Any:
+    """Run a coroutine on the shared background loop and block for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _io_loop()).result()
+
+
+async def _on_io_loop(coro: Any) -> Any:
+    """Await a coroutine on the shared background loop from any event loop."""
+    loop = _io_loop()
+    if asyncio.get_running_loop() is loop:
+        return await coro
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+
+async def _aiter_on_io_loop(iterator: AsyncIterator[Any]) -> AsyncIterator[Any]:
+    """Consume an async iterator on the shared background loop, relaying its items."""
+    loop = _io_loop()
+    caller = asyncio.get_running_loop()
+    if caller is loop:
+        async for item in iterator:
+            yield item
+        return
+    
+    items: asyncio.Queue = asyncio.Queue()
+    end = object()
+    
+    async def pump() -> None:
+        try:
+            async for item in iterator:
+                caller.call_soon_threadsafe(items.put_nowait, (item, None))
+        except Exception as e:
+            caller.call_soon_threadsafe(items.put_nowait, (end, e))
+        else:
+            caller.call_soon_threadsafe(items.put_nowait, (end, None))
+    
+    pumping = asyncio.run_coroutine_threadsafe(pump(), loop)
+    try:
+        while True:
+            item, error = await items.get()
+            if item is end:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        pumping.cancel()
+
 
 class LLMClient:
     """
@@ -31,24 +441,76 @@ class LLMClient:
     Handles meeting summarization, title extraction, and task extraction.
     """
     
+    # Number of meeting analyses kept, keyed by transcript digest
+    ANALYSIS_CACHE_SIZE = 256
+    # Number of raw model responses kept, keyed by prompt digest
+    RESPONSE_CACHE_SIZE = 512
+    # Seconds between status checks of queued Groq batches
+    BATCH_POLL_INTERVAL = 30.0
+    
     def __init__(self):
         """Initialize the LLM client with Groq."""
         self.model_name = settings.groq_model
+        self.fast_model_name = settings.groq_model_fast
         self.api_key = settings.groq_api_key
         self._llm = None
+        # Smaller model for classification-style calls (title, project name)
+        self._llm_fast = None
+        # Same model bound to Groq's JSON mode, for calls that must return JSON
+        self._json_llm = None
+        # time.monotonic() before which no call is dispatched, set from Retry-After
+        self._cooldown_until = 0.0
+        # Client-side Groq quotas, so requests wait here instead of drawing 429s
+        self._rpm_bucket = _QuotaBucket(settings.groq_rpm)
+        self._tpm_bucket = _QuotaBucket(settings.groq_tpm)
+        # blake2b(transcript) -> analyze_meeting result; callers get deep copies
+        self._analysis_cache: LRUCache = LRUCache(maxsize=self.ANALYSIS_CACHE_SIZE)
+        self._analysis_lock = threading.Lock()
+        # blake2b(prompts + call options) -> response text, so reprocessing a
+        # transcript skips the network for every call type
+        self._response_cache: LRUCache = LRUCache(maxsize=self.RESPONSE_CACHE_SIZE)
+        self._response_lock = threading.Lock()
+        # Groq batch ID -> (transcripts, submitted at) for background analyses
+        self._batches: Dict[str, Tuple[List[str], float]] = {}
+        self._batches_checked_at = 0.0
+        self._batch_lock = threading.Lock()
+        # Long-lived HTTP clients so TCP/TLS connections to Groq stay warm
+        self._http_client = None
+        self._http_async_client = None
         
         if not LANGCHAIN_AVAILABLE:
             logger.warning("langchain-groq not installed. LLM features disabled.")
             return
         
         if self.api_key:
+            # Room for bulk analyses to keep every in-flight request on a warm connection
+            limits = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+            self._http_client = httpx.Client(http2=HTTP2_AVAILABLE, limits=limits)
+            self._http_async_client = httpx.AsyncClient(http2=HTTP2_AVAILABLE, limits=limits)
             self._llm = ChatGroq(  # type: ignore[misc]
                 model=self.model_name,
                 temperature=0.2,
                 api_key=SecretStr(self.api_key),  # type: ignore[misc]
-                max_retries=3
+                max_retries=0,  # retries are handled by _call_with_retry
+                http_client=self._http_client,
+                http_async_client=self._http_async_client
+            )
+            self._json_llm = self._llm.bind(response_format={"type": "json_object"})
+            self._llm_fast = self._llm
+            if self.fast_model_name and self.fast_model_name != self.model_name:
+                self._llm_fast = ChatGroq(  # type: ignore[misc]
+                    model=self.fast_model_name,
+                    temperature=0.2,
+                    api_key=SecretStr(self.api_key),  # type: ignore[misc]
+                    max_retries=0,
+                    http_client=self._http_client,
+                    http_async_client=self._http_async_client
+                )
+            logger.info(
+                "LLM client initialized with model: %s (fast: %s)",
+                self.model_name,
+                self.fast_model_name or self.model_name
             )
-            logger.info(f"LLM client initialized with model: {self.model_name}")
         else:
             logger.warning("Groq API key not configured")
     
@@ -57,10 +519,310 @@ class LLMClient:
         """Check if the LLM is properly configured."""
         return self._llm is not None
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10)
-    )
+    def _messages(self, system_prompt: str, user_prompt: str) -> list:
+        """Build the system/user message pair sent to the model."""
+        system_message = _SYSTEM_MESSAGES.get(system_prompt)
+        if system_message is None:
+            system_message = SystemMessage(content=system_prompt)  # type: ignore[misc]
+        return [system_message, HumanMessage(content=user_prompt)]  # type: ignore[misc]
+    
+    @staticmethod
+    def _is_short(transcript: str) -> bool:
+        """Whether the heuristic fast path applies to this transcript."""
+        return settings.llm_fast_path_enabled and len(transcript.split()) < FAST_PATH_MAX_WORDS
+    
+    @staticmethod
+    def _fast_title(transcript: str) -> Optional[str]:
+        """Title from the first sentence of a short transcript, else None."""
+        if not LLMClient._is_short(transcript) or not transcript.strip():
+            return None
+        first = _SENTENCE_END_RE.split(transcript.strip(), maxsplit=1)[0].rstrip(".!?")
+        return LLMClient._clean_title(first if len(first) <= 60 else first[:57] + "...")
+    
+    @staticmethod
+    def _fast_summary(transcript: str) -> Optional[str]:
+        """A short transcript of at most 200 chars is its own summary, else None."""
+        text = transcript.strip()
+        if not LLMClient._is_short(transcript) or not text or len(text) > 200:
+            return None
+        logger.info("Generated meeting summary (%d chars)", len(text))
+        return text
+    
+    @staticmethod
+    def _fast_project(transcript: str) -> Optional[str]:
+        """An explicit "Project X" name in a short transcript, else None."""
+        if not LLMClient._is_short(transcript):
+            return None
+        match = _PROJECT_NAME_RE.search(transcript)
+        if not match:
+            return None
+        keyword, name = match.groups()
+        project = f"Project {name}" if keyword.lower() == "project" else name
+        logger.info("Extracted project name: %s", project)
+        return project
+    
+    def _retrying_kwargs(self) -> Dict[str, Any]:
+        """Shared tenacity policy: transient errors only, jittered backoff."""
+        return {
+            "retry": retry_if_exception_type(_RETRYABLE_ERRORS),
+            "wait": wait_exponential_jitter(initial=1, max=10),
+            "stop": stop_after_attempt(settings.llm_max_retries),
+            "reraise": True,
+        }
+    
+    def _dispatch_delay(self, messages: list, limits: Optional[Dict[str, Any]]) -> float:
+        """
+        Reserve quota for one request and return how long to wait before sending.
+        The token cost is the prompt size plus the max_tokens ceiling.
+        """
+        tokens = sum(_count_tokens(str(getattr(m, "content", m))) for m in messages)
+        tokens += (limits or {}).get("max_tokens", 0)
+        return max(
+            self._cooldown_until - time.monotonic(),
+            self._rpm_bucket.reserve(),
+            self._tpm_bucket.reserve(tokens)
+        )
+    
+    def _note_rate_limit(self, error: BaseException) -> None:
+        """Hold off every call until the server's Retry-After has passed."""
+        delay = _retry_after_seconds(error)
+        if delay:
+            self._cooldown_until = max(self._cooldown_until, time.monotonic() + delay)
+            logger.warning("Groq rate limited; pausing LLM calls for %.1fs", delay)
+    
+    def _select_llm(
+        self, json_mode: bool, fast: bool, limits: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """Pick the model binding for a call, applying any output limits."""
+        if fast:
+            llm = self._llm_fast
+        else:
+            llm = self._json_llm if json_mode else self._llm
+        return llm.bind(**limits) if limits else llm  # type: ignore
+    
+    def _call_with_retry(
+        self,
+        messages: list,
+        json_mode: bool = False,
+        fast: bool = False,
+        limits: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        Invoke the model, retrying rate limits, connection errors and 5xx.
+        
+        Args:
+            messages: Chat messages to send
+            json_mode: Use the JSON-mode binding of the model
+            fast: Use the fast model instead
+            limits: Per-call generation limits such as max_tokens and stop
+            
+        Returns:
+            The model response
+        """
+        llm = self._select_llm(json_mode, fast, limits)
+        for attempt in Retrying(**self._retrying_kwargs()):
+            with attempt:
+                delay = self._dispatch_delay(messages, limits)
+                if delay > 0:
+                    time.sleep(delay)
+                try:
+                    return llm.invoke(messages)  # type: ignore
+                except _RETRYABLE_ERRORS as e:
+                    self._note_rate_limit(e)
+                    raise
+    
+    async def _acall_with_retry(
+        self,
+        messages: list,
+        json_mode: bool = False,
+        fast: bool = False,
+        limits: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        Async variant of _call_with_retry using ChatGroq.ainvoke. The request
+        runs on the shared background loop, whichever loop awaits it.
+        """
+        return await _on_io_loop(self._acall_on_io_loop(messages, json_mode, fast, limits))
+    
+    async def _acall_on_io_loop(
+        self,
+        messages: list,
+        json_mode: bool,
+        fast: bool,
+        limits: Optional[Dict[str, Any]]
+    ) -> Any:
+        """Body of _acall_with_retry; must run on the shared background loop."""
+        llm = self._select_llm(json_mode, fast, limits)
+        async for attempt in AsyncRetrying(**self._retrying_kwargs()):
+            with attempt:
+                delay = self._dispatch_delay(messages, limits)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                try:
+                    return await llm.ainvoke(messages)  # type: ignore
+                except _RETRYABLE_ERRORS as e:
+                    self._note_rate_limit(e)
+                    raise
+    
+    def _stream_with_retry(self, messages: list, limits: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+        """
+        Stream a reply under the same quota and retry policy as
+        _call_with_retry. Opening the stream and reading its first chunk are
+        retried; an error after that is raised, since chunks were already
+        handed out. Streams skip the response cache and JSON mode, which
+        Groq can't stream.
+        """
+        llm = self._select_llm(False, False, limits)
+        for attempt in Retrying(**self._retrying_kwargs()):
+            with attempt:
+                delay = self._dispatch_delay(messages, limits)
+                if delay > 0:
+                    time.sleep(delay)
+                try:
+                    chunks = iter(llm.stream(messages))  # type: ignore
+                    first = next(chunks, _STREAM_END)
+                except _RETRYABLE_ERRORS as e:
+                    self._note_rate_limit(e)
+                    raise
+        if first is _STREAM_END:
+            return
+        yield first
+        try:
+            yield from chunks
+        except _RETRYABLE_ERRORS as e:
+            self._note_rate_limit(e)
+            raise
+    
+    def _astream_with_retry(
+        self, messages: list, limits: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Any]:
+        """
+        Async variant of _stream_with_retry. The stream runs on the shared
+        background loop, whichever loop consumes it.
+        """
+        return _aiter_on_io_loop(self._astream_on_io_loop(messages, limits))
+    
+    async def _astream_on_io_loop(
+        self, messages: list, limits: Optional[Dict[str, Any]]
+    ) -> AsyncIterator[Any]:
+        """Body of _astream_with_retry; must run on the shared background loop."""
+        llm = self._select_llm(False, False, limits)
+        async for attempt in AsyncRetrying(**self._retrying_kwargs()):
+            with attempt:
+                delay = self._dispatch_delay(messages, limits)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                try:
+                    chunks = llm.astream(messages).__aiter__()  # type: ignore
+                    first = await anext(chunks, _STREAM_END)
+                except _RETRYABLE_ERRORS as e:
+                    self._note_rate_limit(e)
+                    raise
+        if first is _STREAM_END:
+            return
+        yield first
+        try:
+            async for chunk in chunks:
+                yield chunk
+        except _RETRYABLE_ERRORS as e:
+            self._note_rate_limit(e)
+            raise
+    
+    def _invoke(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        json_mode: bool = False,
+        fast: bool = False,
+        limits: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Invoke the model and return the response content as text.
+        With fast=True the fast model is tried first, falling back once to
+        the main model if it fails. Identical requests are answered from
+        the response cache.
+        """
+        key = self._response_key(system_prompt, user_prompt, json_mode, fast, limits)
+        cached = self._get_cached_response(key)
+        if cached is not None:
+            return cached
+        
+        messages = self._messages(system_prompt, user_prompt)
+        if fast and self._llm_fast is not self._llm:
+            try:
+                response = self._call_with_retry(messages, fast=True, limits=limits)
+            except Exception as e:
+                logger.warning("Fast model %s failed, using %s: %s", self.fast_model_name, self.model_name, e)
+                response = self._call_with_retry(messages, limits=limits)
+        else:
+            response = self._call_with_retry(messages, json_mode, limits=limits)
+        return self._store_response(key, self._response_text(response))
+    
+    async def _ainvoke(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        json_mode: bool = False,
+        fast: bool = False,
+        limits: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Async variant of _invoke."""
+        key = self._response_key(system_prompt, user_prompt, json_mode, fast, limits)
+        cached = self._get_cached_response(key)
+        if cached is not None:
+            return cached
+        
+        messages = self._messages(system_prompt, user_prompt)
+        if fast and self._llm_fast is not self._llm:
+            try:
+                response = await self._acall_with_retry(messages, fast=True, limits=limits)
+            except Exception as e:
+                logger.warning("Fast model %s failed, using %s: %s", self.fast_model_name, self.model_name, e)
+                response = await self._acall_with_retry(messages, limits=limits)
+        else:
+            response = await self._acall_with_retry(messages, json_mode, limits=limits)
+        return self._store_response(key, self._response_text(response))
+    
+    @staticmethod
+    def _response_text(message: Any) -> str:
+        """
+        Text of a model response or stream chunk. Content is almost always
+        a plain str; anything else (e.g. a list of content parts) is str()'d.
+        Not stripped, since stream chunks need their whitespace.
+        """
+        content = message.content
+        return content if type(content) is str else str(content)
+    
+    @staticmethod
+    def _response_key(
+        system_prompt: str,
+        user_prompt: str,
+        json_mode: bool,
+        fast: bool,
+        limits: Optional[Dict[str, Any]]
+    ) -> str:
+        """Response cache key: a blake2b digest of the prompts and call options."""
+        digest = hashlib.blake2b(digest_size=16)
+        options = (json_mode, fast, sorted((limits or {}).items()))
+        for part in (system_prompt, user_prompt, repr(options)):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+    
+    def _get_cached_response(self, key: str) -> Optional[str]:
+        """Return the cached response text for key, if any."""
+        with self._response_lock:
+            cached = self._response_cache.get(key)
+        if cached is not None:
+            logger.debug("LLM response served from cache")
+        return cached
+    
+    def _store_response(self, key: str, content: str) -> str:
+        """Cache a response text and hand it back."""
+        with self._response_lock:
+            self._response_cache[key] = content
+        return content
+    
     def extract_meeting_title(self, transcript: str) -> str:
         """
         Extract a meaningful meeting title from the transcript.
@@ -75,49 +837,65 @@ class LLMClient:
         if not self.is_configured:
             raise RuntimeError("LLM client not configured")
         
-        system_prompt = """Extract a concise, descriptive meeting title from the transcript.
-
-RULES:
-1. Identify the main project, topic, or theme of the meeting
-2. If a project name is mentioned, include it (e.g., "Project Alpha Sprint Planning")
-3. If no specific project, use the main topic discussed
-4. Keep title under 60 characters
-5. Format: "[Project/Topic] - [Meeting Type]" or just "[Main Topic]"
-6. Examples: "Project Phoenix - Weekly Sync", "API Integration Review", "Q4 Budget Planning"
-7. Return ONLY the title, no explanation"""
-
-        user_prompt = f"""Extract a meeting title from this transcript:
-
-{transcript[:2000]}
-
-Meeting Title:"""
-
+        fast = self._fast_title(transcript)
+        if fast is not None:
+            return fast
+        
+        if not settings.llm_use_for_ner:
+            local = _ner_title(transcript)
+            if local is not None:
+                return self._clean_title(local[:60])
+        
         try:
-            messages = [
-                SystemMessage(content=system_prompt),  # type: ignore[misc]
-                HumanMessage(content=user_prompt)  # type: ignore[misc]
-            ]
-            
-            response = self._llm.invoke(messages)  # type: ignore
-            content = response.content
-            title = content if isinstance(content, str) else str(content)
-            title = title.strip().strip('"\'')
-            
-            # Ensure reasonable length
-            if len(title) > 80:
-                title = title[:77] + "..."
-            
-            logger.info(f"Extracted meeting title: {title}")
-            return title
-            
+            return self._clean_title(
+                self._invoke(*self._title_prompts(transcript), fast=True, limits=TITLE_LIMITS)
+            )
         except Exception as e:
-            logger.error(f"Error extracting meeting title: {e}")
+            logger.error("Error extracting meeting title: %s", e)
             return "Team Meeting"
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10)
-    )
+    async def aextract_meeting_title(self, transcript: str) -> str:
+        """Async variant of extract_meeting_title."""
+        if not self.is_configured:
+            raise RuntimeError("LLM client not configured")
+        
+        fast = self._fast_title(transcript)
+        if fast is not None:
+            return fast
+        
+        if not settings.llm_use_for_ner:
+            local = _ner_title(transcript)
+            if local is not None:
+                return self._clean_title(local[:60])
+        
+        try:
+            return self._clean_title(
+                await self._ainvoke(*self._title_prompts(transcript), fast=True, limits=TITLE_LIMITS)
+            )
+        except Exception as e:
+            logger.error("Error extracting meeting title: %s", e)
+            return "Team Meeting"
+    
+    @staticmethod
+    def _title_prompts(transcript: str) -> Tuple[str, str]:
+        """Build the (system, user) prompts for title extraction."""
+        user_prompt = f"""{_transcript_block(_head_tokens(transcript, 512))}
+
+Meeting Title:"""
+        return TITLE_SYSTEM_PROMPT, user_prompt
+    
+    @staticmethod
+    def _clean_title(text: str) -> str:
+        """Strip quotes from a model-generated title and cap its length."""
+        title = text.strip().strip('"\'')
+        
+        # Ensure reasonable length
+        if len(title) > 80:
+            title = title[:77] + "..."
+        
+        logger.info("Extracted meeting title: %s", title)
+        return title
+    
     def extract_project_name(self, transcript: str, summary: Optional[str] = None) -> Optional[str]:
         """
         Extract the project or product name from the meeting transcript.
@@ -133,53 +911,72 @@ Meeting Title:"""
         if not self.is_configured:
             raise RuntimeError("LLM client not configured")
         
-        context = transcript[:1500]
+        fast = self._fast_project(transcript)
+        if fast is not None:
+            return fast
+        
+        if not settings.llm_use_for_ner:
+            local = _ner_project(transcript)
+            if local is not None:
+                return self._clean_project(local)
+        
+        try:
+            return self._clean_project(
+                self._invoke(*self._project_prompts(transcript, summary), fast=True, limits=PROJECT_LIMITS)
+            )
+        except Exception as e:
+            logger.error("Error extracting project name: %s", e)
+            return None
+    
+    async def aextract_project_name(self, transcript: str, summary: Optional[str] = None) -> Optional[str]:
+        """Async variant of extract_project_name."""
+        if not self.is_configured:
+            raise RuntimeError("LLM client not configured")
+        
+        fast = self._fast_project(transcript)
+        if fast is not None:
+            return fast
+        
+        if not settings.llm_use_for_ner:
+            local = _ner_project(transcript)
+            if local is not None:
+                return self._clean_project(local)
+        
+        try:
+            return self._clean_project(
+                await self._ainvoke(
+                    *self._project_prompts(transcript, summary), fast=True, limits=PROJECT_LIMITS
+                )
+            )
+        except Exception as e:
+            logger.error("Error extracting project name: %s", e)
+            return None
+    
+    @staticmethod
+    def _project_prompts(transcript: str, summary: Optional[str]) -> Tuple[str, str]:
+        """Build the (system, user) prompts for project name extraction."""
         if summary:
-            context = f"Summary: {summary}\n\nTranscript: {transcript[:1000]}"
+            context = f"{_transcript_block(_head_tokens(transcript, 256))}\n\nSUMMARY: {summary}"
+        else:
+            context = _transcript_block(_head_tokens(transcript, 400))
         
-        system_prompt = """Extract the project or product name from the meeting discussion.
-
-RULES:
-1. Look for explicit project names (e.g., "Project Alpha", "Phoenix App", "Customer Portal")
-2. Look for product names being discussed
-3. If multiple projects mentioned, return the main one being discussed
-4. Return ONLY the project/product name, nothing else
-5. If no clear project name, return "NONE"
-6. Do NOT make up a project name
-7. Examples of valid outputs: "Project Alpha", "E-Commerce Platform", "Mobile App v2", "NONE" """
-
-        user_prompt = f"""What project or product is being discussed in this meeting?
-
-{context}
+        user_prompt = f"""{context}
 
 Project Name:"""
-
-        try:
-            messages = [
-                SystemMessage(content=system_prompt),  # type: ignore[misc]
-                HumanMessage(content=user_prompt)  # type: ignore[misc]
-            ]
-            
-            response = self._llm.invoke(messages)  # type: ignore
-            content = response.content
-            project = content if isinstance(content, str) else str(content)
-            project = project.strip().strip('"\'')
-            
-            if project.upper() in ["NONE", "N/A", "NOT FOUND", "UNKNOWN", ""]:
-                logger.info("No specific project name identified in transcript")
-                return None
-            
-            logger.info(f"Extracted project name: {project}")
-            return project
-            
-        except Exception as e:
-            logger.error(f"Error extracting project name: {e}")
+        return PROJECT_SYSTEM_PROMPT, user_prompt
+    
+    @staticmethod
+    def _clean_project(text: str) -> Optional[str]:
+        """Normalize a model-generated project name, mapping "NONE" to None."""
+        project = text.strip().strip('"\'')
+        
+        if project.upper() in ["NONE", "N/A", "NOT FOUND", "UNKNOWN", ""]:
+            logger.info("No specific project name identified in transcript")
             return None
+        
+        logger.info("Extracted project name: %s", project)
+        return project
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10)
-    )
     def summarize_meeting(self, transcript: str, max_length: int = 1000) -> str:
         """
         Generate a brief summary of the meeting transcript.
@@ -187,7 +984,7 @@ Project Name:"""
         
         Args:
             transcript: Meeting transcript (typically 2-4 sentences for prototype)
-            max_length: Maximum length of transcript to process
+            max_length: Upper bound on the summary length, in characters
             
         Returns:
             Meeting summary text
@@ -195,32 +992,50 @@ Project Name:"""
         if not self.is_configured:
             raise RuntimeError("LLM client not configured")
         
-        system_prompt = """Summarize the meeting in 1-2 sentences. Be direct and concise."""
-
-        user_prompt = f"""Transcript:\n{transcript}\n\nSummary:"""
-
+        fast = self._fast_summary(transcript)
+        if fast is not None:
+            return fast
+        
         try:
-            messages = [
-                SystemMessage(content=system_prompt),  # type: ignore[misc]
-                HumanMessage(content=user_prompt)  # type: ignore[misc]
-            ]
-            
-            response = self._llm.invoke(messages)  # type: ignore
-            content = response.content
-            summary = content if isinstance(content, str) else str(content)
-            summary = summary.strip()
+            summary = self._invoke(*self._summary_prompts(transcript, max_length), limits=SUMMARY_LIMITS).strip()
+            logger.info("Generated meeting summary (%d chars)", len(summary))
+            return summary
             
-            logger.info(f"Generated meeting summary ({len(summary)} chars)")
+        except Exception as e:
+            logger.error("Error generating meeting summary: %s", e)
+            raise
+    
+    async def asummarize_meeting(self, transcript: str, max_length: int = 1000) -> str:
+        """Async variant of summarize_meeting."""
+        if not self.is_configured:
+            raise RuntimeError("LLM client not configured")
+        
+        fast = self._fast_summary(transcript)
+        if fast is not None:
+            return fast
+        
+        try:
+            summary = (
+                await self._ainvoke(*self._summary_prompts(transcript, max_length), limits=SUMMARY_LIMITS)
+            ).strip()
+            logger.info("Generated meeting summary (%d chars)", len(summary))
             return summary
             
         except Exception as e:
-            logger.error(f"Error generating meeting summary: {e}")
+            logger.error("Error generating meeting summary: %s", e)
             raise
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10)
-    )
+    @staticmethod
+    def _summary_prompts(transcript: str, max_length: int = 1000) -> Tuple[str, str]:
+        """
+        Build the (system, user) prompts for meeting summarization.
+        
+        The transcript comes first and the per-call instruction last, so
+        repeated calls over the same transcript share a cacheable prefix.
+        """
+        user_prompt = f"""{_transcript_block(transcript)}\n\n---\nSummary ({max_length} chars max):"""
+        return SUMMARIZE_SYSTEM_PROMPT, user_prompt
+    
     def extract_tasks(self, transcript: str, summary: Optional[str] = None) -> Dict[str, Any]:
         """
         Extract action items/tasks from the meeting transcript.
@@ -236,162 +1051,714 @@ Project Name:"""
         if not self.is_configured:
             raise RuntimeError("LLM client not configured")
         
-        system_prompt = """You are a JSON extraction assistant. Your ONLY job is to extract tasks and return valid JSON.
-
-RULES:
-1. Output ONLY valid JSON - no explanations, no markdown, no text before or after
-2. Every response must start with { and end with }
-3. Use this exact format: {"tasks": [{"title": "task description", "assignee": "person name", "due_date": "YYYY-MM-DD"}]}
-4. If no clear assignee, use "Unassigned"
-5. If no due date mentioned, use null
-6. If no tasks found, return: {"tasks": []}
-7. Look for action words like: will, should, needs to, assigned to, responsible for"""
-
-        user_prompt = f"""Extract all tasks/action items from this transcript and return ONLY JSON:
-
-{transcript}
-
-Respond with JSON only:"""
-
         try:
-            messages = [
-                SystemMessage(content=system_prompt),  # type: ignore[misc]
-                HumanMessage(content=user_prompt)  # type: ignore[misc]
-            ]
+            return self._finish_tasks(
+                self._invoke(*self._task_prompts(transcript), json_mode=True, limits=TASKS_LIMITS)
+            )
+        except Exception as e:
+            logger.error("Error extracting tasks: %s", e)
+            raise
+    
+    async def aextract_tasks(self, transcript: str, summary: Optional[str] = None) -> Dict[str, Any]:
+        """Async variant of extract_tasks."""
+        if not self.is_configured:
+            raise RuntimeError("LLM client not configured")
+        
+        try:
+            return self._finish_tasks(
+                await self._ainvoke(*self._task_prompts(transcript), json_mode=True, limits=TASKS_LIMITS)
+            )
+        except Exception as e:
+            logger.error("Error extracting tasks: %s", e)
+            raise
+    
+    def iter_extract_tasks(self, transcript: str) -> Iterator[Dict[str, Any]]:
+        """
+        Stream validated tasks as the model generates them.
+        Each task is yielded as soon as its JSON object is complete, so
+        callers (e.g. Jira issue creation) can start before the reply ends.
+        Without ijson, or if the streamed text isn't clean JSON, the tasks
+        are parsed from the full reply and yielded at the end instead.
+        A rate limit before the first chunk is retried like any call; one
+        mid-stream is raised, as tasks may already have been yielded.
+        
+        Args:
+            transcript: Meeting transcript
             
-            response = self._llm.invoke(messages)  # type: ignore
-            content = response.content
-            response_text = content if isinstance(content, str) else str(content)
-            response_text = response_text.strip()
+        Yields:
+            Task dictionaries in the extract_tasks format
+        """
+        if not self.is_configured:
+            raise RuntimeError("LLM client not configured")
+        
+        messages = self._messages(*self._task_prompts(transcript))
+        stream = _TaskStream()
+        yielded = 0
+        for chunk in self._stream_with_retry(messages, TASKS_LIMITS):
+            for task in stream.feed(self._response_text(chunk)):
+                yielded += 1
+                yield self._validate_task(task)
+        
+        # Anything the incremental parser didn't deliver comes from the full reply
+        tasks = self._parse_json_response(stream.text()).get("tasks") or []
+        for task in tasks[yielded:]:
+            yielded += 1
+            yield self._validate_task(task)
+        logger.info("Streamed %s tasks from meeting", yielded)
+    
+    async def aextract_tasks_stream(self, transcript: str) -> AsyncIterator[Dict[str, Any]]:
+        """Async variant of iter_extract_tasks, e.g. for a StreamingResponse."""
+        if not self.is_configured:
+            raise RuntimeError("LLM client not configured")
+        
+        messages = self._messages(*self._task_prompts(transcript))
+        stream = _TaskStream()
+        yielded = 0
+        async for chunk in self._astream_with_retry(messages, TASKS_LIMITS):
+            for task in stream.feed(self._response_text(chunk)):
+                yielded += 1
+                yield self._validate_task(task)
+        
+        # Anything the incremental parser didn't deliver comes from the full reply
+        tasks = self._parse_json_response(stream.text()).get("tasks") or []
+        for task in tasks[yielded:]:
+            yielded += 1
+            yield self._validate_task(task)
+        logger.info("Streamed %s tasks from meeting", yielded)
+    
+    @staticmethod
+    def _task_prompts(transcript: str) -> Tuple[str, str]:
+        """Build the (system, user) prompts for task extraction."""
+        return TASKS_SYSTEM_PROMPT, _transcript_block(transcript)
+    
+    def _finish_tasks(self, response_text: str) -> Dict[str, Any]:
+        """
+        Parse and validate the task extraction response.
+        
+        Args:
+            response_text: Raw LLM response text
             
-            # Log raw response for debugging
-            logger.debug(f"Raw LLM response: {response_text[:500]}")
+        Returns:
+            Dictionary with the validated tasks list
+        """
+        # Log raw response for debugging
+        logger.debug("Raw LLM response: %.500s", response_text)
+        
+        return self._validate_tasks(self._parse_json_response(response_text))
+    
+    def _validate_tasks(self, tasks_data: Any) -> Dict[str, Any]:
+        """
+        Normalize parsed task data into the {"tasks": [...]} format.
+        
+        Args:
+            tasks_data: Parsed JSON holding a "tasks" list
             
-            # Parse JSON from response
-            tasks_data = self._parse_json_response(response_text)
+        Returns:
+            Dictionary with the validated tasks list
+        """
+        if not isinstance(tasks_data, dict):
+            tasks_data = {"tasks": []}
+        
+        # Validate each task
+        validated_tasks = [self._validate_task(task) for task in tasks_data.get("tasks") or []]
+        
+        result = {"tasks": validated_tasks}
+        logger.info("Extracted %d tasks from meeting", len(validated_tasks))
+        return result
+    
+    @staticmethod
+    def _validate_task(task: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize one task to title/assignee/due_date with defaults."""
+        return {
+            "title": task.get("title", "Untitled Task"),
+            "assignee": task.get("assignee") or "Unassigned",
+            "due_date": task.get("due_date")  # Can be None
+        }
+    
+    def _parse_json_response(self, response_text: str) -> Dict[str, Any]:
+        """
+        Parse a JSON LLM response, unwrapping a markdown code fence if present.
+        
+        Args:
+            response_text: Raw LLM response text
             
-            # If still empty, try regex extraction from transcript
-            if not tasks_data.get("tasks") and transcript:
-                tasks_data = self._extract_tasks_fallback(transcript)
+        Returns:
+            Parsed JSON dictionary, or {"tasks": []} if it can't be parsed
+        """
+        match = _FENCE_RE.search(response_text or "")
+        candidate = match.group(1) if match else (response_text or "").strip()
+        try:
+            return json_utils.loads(candidate)
+        except ValueError as e:
+            # Last resort: the outermost {...} in the text
+            start, end = candidate.find("{"), candidate.rfind("}") + 1
+            if 0 <= start < end:
+                try:
+                    return json_utils.loads(candidate[start:end])
+                except ValueError:
+                    pass
+            logger.warning("Failed to parse JSON response: %s", e)
+            return {"tasks": []}
+    
+    def summarize_and_extract_tasks(
+        self, transcript: str
+    ) -> Tuple[Union[str, BaseException], Union[Dict[str, Any], BaseException]]:
+        """
+        Summarize a meeting and extract its tasks.
+        
+        Both come from one JSON-mode call when that works; otherwise the
+        separate summary and task calls are run concurrently.
+        
+        Args:
+            transcript: Full meeting transcript
+            
+        Returns:
+            (summary, tasks) where either item is the raised exception if
+            that call failed, so callers can fall back per field
+        """
+        return _run(self.asummarize_and_extract_tasks(transcript))
+    
+    async def asummarize_and_extract_tasks(
+        self, transcript: str
+    ) -> Tuple[Union[str, BaseException], Union[Dict[str, Any], BaseException]]:
+        """Async variant of summarize_and_extract_tasks."""
+        if self.is_configured:
+            try:
+                return self._finish_summary_tasks(
+                    await self._ainvoke(
+                        *self._summary_tasks_prompts(transcript),
+                        json_mode=True, limits=SUMMARY_TASKS_LIMITS
+                    )
+                )
+            except _RETRYABLE_ERRORS as e:
+                # Retries are already spent; separate calls would hit the same outage
+                return e, e
+            except Exception as e:
+                logger.warning("Combined summary/tasks call failed, using separate calls: %s", e)
+        
+        summary, tasks = await asyncio.gather(
+            self.asummarize_meeting(transcript),
+            self.aextract_tasks(transcript),
+            return_exceptions=True,
+        )
+        return summary, tasks
+    
+    @staticmethod
+    def _summary_tasks_prompts(transcript: str) -> Tuple[str, str]:
+        """Build the (system, user) prompts for the combined summary/tasks call."""
+        return SUMMARY_TASKS_SYSTEM_PROMPT, _transcript_block(transcript)
+    
+    def _finish_summary_tasks(self, response_text: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        Split a combined summary/tasks response into (summary, tasks).
+        
+        Raises:
+            ValueError: If the response is not the expected JSON object
+        """
+        data = self._parse_json_response(response_text)
+        if not isinstance(data, dict) or not data.get("summary"):
+            raise ValueError("Combined summary/tasks response is missing the summary")
+        
+        summary = str(data["summary"]).strip()
+        logger.info("Generated meeting summary (%d chars)", len(summary))
+        return summary, self._validate_tasks(data)
+    
+    def extract_all(self, transcript: str) -> Dict[str, Any]:
+        """
+        Extract title, project, summary, and tasks in a single JSON-mode call.
+        
+        Args:
+            transcript: Full meeting transcript
             
-            # Validate structure
-            if "tasks" not in tasks_data:
-                tasks_data = {"tasks": []}
+        Returns:
+            Dictionary with meeting_title, project_name, summary, and tasks
             
-            # Validate each task
-            validated_tasks = []
-            for task in tasks_data.get("tasks", []):
-                validated_task = {
-                    "title": task.get("title", "Untitled Task"),
-                    "assignee": task.get("assignee") or "Unassigned",
-                    "due_date": task.get("due_date")  # Can be None
-                }
-                validated_tasks.append(validated_task)
+        Raises:
+            ValueError: If the response is not the expected JSON object
+        """
+        if not self.is_configured:
+            raise RuntimeError("LLM client not configured")
+        
+        return self._finish_all(
+            self._invoke(*self._all_prompts(transcript), json_mode=True, limits=ANALYZE_LIMITS)
+        )
+    
+    async def aextract_all(self, transcript: str) -> Dict[str, Any]:
+        """Async variant of extract_all."""
+        if not self.is_configured:
+            raise RuntimeError("LLM client not configured")
+        
+        return self._finish_all(
+            await self._ainvoke(*self._all_prompts(transcript), json_mode=True, limits=ANALYZE_LIMITS)
+        )
+    
+    @staticmethod
+    def _all_prompts(transcript: str) -> Tuple[str, str]:
+        """Build the (system, user) prompts for the combined extraction."""
+        return ANALYZE_SYSTEM_PROMPT, _transcript_block(transcript)
+    
+    def _finish_all(self, response_text: str) -> Dict[str, Any]:
+        """
+        Map the combined extraction response onto the analyze_meeting result.
+        
+        Args:
+            response_text: Raw LLM response text
             
-            result = {"tasks": validated_tasks}
-            logger.info(f"Extracted {len(validated_tasks)} tasks from meeting")
-            return result
+        Returns:
+            Dictionary with meeting_title, project_name, summary, and tasks
+        """
+        return self._analysis_from_data(self._parse_json_response(response_text))
+    
+    def _analysis_from_data(self, data: Any) -> Dict[str, Any]:
+        """
+        Validate one parsed combined-extraction object into an analysis result.
+        
+        Raises:
+            ValueError: If the object has no summary
+        """
+        if not isinstance(data, dict) or not data.get("summary"):
+            raise ValueError("Combined extraction response is missing the summary")
+        
+        summary = str(data["summary"]).strip()
+        logger.info("Generated meeting summary (%d chars)", len(summary))
+        
+        return {
+            "meeting_title": self._clean_title(str(data.get("meeting_title") or "Team Meeting")),
+            "project_name": self._clean_project(str(data.get("project_name") or "NONE")),
+            "summary": summary,
+            "tasks": self._validate_tasks(data)["tasks"]
+        }
+    
+    def analyze_meeting(self, transcript: str) -> Dict[str, Any]:
+        """
+        Perform complete meeting analysis: title, summary, project, and tasks.
+        Uses one combined extract_all call, falling back to the separate
+        per-field calls if that response can't be used.
+        
+        Args:
+            transcript: Full meeting transcript
             
+        Returns:
+            Dictionary with meeting_title, project_name, summary, and tasks
+        """
+        key = self._analysis_key(transcript)
+        cached = self._get_cached_analysis(key)
+        if cached is not None:
+            return cached
+        
+        try:
+            result = self.extract_all(transcript)
+        except _RETRYABLE_ERRORS:
+            # Retries are already spent; separate calls would hit the same outage
+            raise
         except Exception as e:
-            logger.error(f"Error extracting tasks: {e}")
+            logger.warning("Combined meeting analysis failed, using separate calls: %s", e)
+            result = _run(self._aanalyze_separately(transcript))
+        return self._store_analysis(key, result)
+    
+    async def aanalyze_meeting(self, transcript: str) -> Dict[str, Any]:
+        """Async variant of analyze_meeting."""
+        key = self._analysis_key(transcript)
+        cached = self._get_cached_analysis(key)
+        if cached is not None:
+            return cached
+        
+        try:
+            result = await self.aextract_all(transcript)
+        except _RETRYABLE_ERRORS:
+            # Retries are already spent; separate calls would hit the same outage
             raise
+        except Exception as e:
+            logger.warning("Combined meeting analysis failed, using separate calls: %s", e)
+            result = await self._aanalyze_separately(transcript)
+        return self._store_analysis(key, result)
     
-    def _parse_json_response(self, response_text: str) -> Dict[str, Any]:
+    async def abatch_analyze(self, transcripts: List[str]) -> List[Dict[str, Any]]:
         """
-        Parse JSON from LLM response, handling markdown code blocks.
+        Analyze many meetings concurrently.
+        At most settings.groq_max_concurrency analyses are in flight at once,
+        keeping bulk runs inside the Groq rate budget.
         
         Args:
-            response_text: Raw LLM response text
+            transcripts: Meeting transcripts
             
         Returns:
-            Parsed JSON dictionary
+            One aanalyze_meeting result per transcript, in input order
         """
-        # Handle empty or whitespace-only response
-        if not response_text or not response_text.strip():
-            logger.warning("LLM returned empty response, defaulting to empty tasks")
-            return {"tasks": []}
+        return await self.amap(self.aanalyze_meeting, transcripts)
+    
+    async def amap(
+        self,
+        func: Callable[[str], Awaitable[Any]],
+        transcripts: List[str],
+        concurrency: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Apply an async per-transcript method (e.g. aextract_tasks,
+        asummarize_meeting) to many transcripts concurrently.
+        A semaphore caps how many calls are in flight; the client-side
+        quotas still pace the requests inside that cap.
         
-        # Remove markdown code blocks if present
-        cleaned_text = response_text
+        Args:
+            func: Coroutine function taking one transcript
+            transcripts: Meeting transcripts
+            concurrency: Maximum calls in flight (default: settings.groq_max_concurrency)
+            
+        Returns:
+            One func result per transcript, in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency or settings.groq_max_concurrency)
         
-        if "```json" in cleaned_text:
-            cleaned_text = cleaned_text.split("```json")[1]
-            if "```" in cleaned_text:
-                cleaned_text = cleaned_text.split("```")[0]
-        elif "```" in cleaned_text:
-            parts = cleaned_text.split("```")
-            if len(parts) >= 2:
-                cleaned_text = parts[1]
+        async def one(transcript: str) -> Any:
+            async with semaphore:
+                return await func(transcript)
         
-        cleaned_text = cleaned_text.strip()
+        return list(await asyncio.gather(*(one(t) for t in transcripts)))
+    
+    def analyze_meetings_batched(
+        self, transcripts: List[str], rows_per_call: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze many meetings with several transcripts numbered into each prompt.
         
-        # Handle empty after cleanup
-        if not cleaned_text:
-            logger.warning("LLM response empty after cleanup, defaulting to empty tasks")
-            return {"tasks": []}
+        Packing rows trades a longer prompt for fewer requests, which is what
+        the Groq requests-per-minute limit counts. Chunks run concurrently
+        (bounded like abatch_analyze); any transcript missing from a chunk's
+        reply is analyzed on its own with aanalyze_meeting.
         
-        try:
-            return json.loads(cleaned_text)
-        except json.JSONDecodeError as e:
-            logger.warning(f"Failed to parse JSON response: {e}")
-            # Try to extract JSON object from text
-            start_idx = cleaned_text.find("{")
-            end_idx = cleaned_text.rfind("}") + 1
-            if start_idx >= 0 and end_idx > start_idx:
+        Args:
+            transcripts: Meeting transcripts
+            rows_per_call: Transcripts packed into each request
+            
+        Returns:
+            One analyze_meeting-shaped result per transcript, in input order
+        """
+        return _run(self.aanalyze_meetings_batched(transcripts, rows_per_call))
+    
+    async def aanalyze_meetings_batched(
+        self, transcripts: List[str], rows_per_call: int = 8
+    ) -> List[Dict[str, Any]]:
+        """Async variant of analyze_meetings_batched."""
+        if not self.is_configured:
+            raise RuntimeError("LLM client not configured")
+        
+        results: List[Optional[Dict[str, Any]]] = [
+            self._get_cached_analysis(self._analysis_key(t)) for t in transcripts
+        ]
+        pending = [i for i, result in enumerate(results) if result is None]
+        semaphore = asyncio.Semaphore(settings.groq_max_concurrency)
+        
+        async def analyze_chunk(indices: List[int]) -> None:
+            chunk = [transcripts[i] for i in indices]
+            rows: Dict[int, Dict[str, Any]] = {}
+            async with semaphore:
                 try:
-                    return json.loads(cleaned_text[start_idx:end_idx])
-                except json.JSONDecodeError:
-                    pass
-            return {"tasks": []}
+                    rows = self._finish_batched(
+                        await self._ainvoke(
+                            *self._batched_prompts(chunk),
+                            json_mode=True,
+                            limits={"max_tokens": ANALYZE_LIMITS["max_tokens"] * len(chunk)},
+                        )
+                    )
+                except _RETRYABLE_ERRORS:
+                    raise
+                except Exception as e:
+                    logger.warning("Batched meeting analysis failed for %d transcript(s): %s", len(chunk), e)
+                
+                # Rows the batch missed are analyzed one by one in this
+                # chunk's slot, so a bad batch can't exceed the concurrency cap
+                for row_id, i in enumerate(indices, start=1):
+                    row = rows.get(row_id)
+                    if row is None:
+                        results[i] = await self.aanalyze_meeting(transcripts[i])
+                    else:
+                        results[i] = self._store_analysis(self._analysis_key(transcripts[i]), row)
+        
+        # A rate-limited chunk doesn't cancel the others; their results are
+        # cached before its error is raised
+        outcomes = await asyncio.gather(
+            *(
+                analyze_chunk(pending[start:start + rows_per_call])
+                for start in range(0, len(pending), rows_per_call)
+            ),
+            return_exceptions=True
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        return results  # type: ignore[return-value]
+    
+    @staticmethod
+    def _batched_prompts(transcripts: List[str]) -> Tuple[str, str]:
+        """Build the (system, user) prompts for several numbered transcripts."""
+        numbered = "\n\n".join(f"[{n}] {t}" for n, t in enumerate(transcripts, start=1))
+        user_prompt = f"""TRANSCRIPTS:
+{numbered}"""
+        return BATCH_ANALYZE_SYSTEM_PROMPT, user_prompt
+    
+    def _finish_batched(self, response_text: str) -> Dict[int, Dict[str, Any]]:
+        """
+        Map a batched analysis response onto {row id: analysis result}.
+        Rows that are malformed or lack a summary are left out.
+        """
+        data = self._parse_json_response(response_text)
+        items = data.get("results") if isinstance(data, dict) else None
+        rows: Dict[int, Dict[str, Any]] = {}
+        for item in items if isinstance(items, list) else []:
+            try:
+                rows[int(item["id"])] = self._analysis_from_data(item)
+            except (KeyError, TypeError, ValueError):
+                continue
+        return rows
     
-    def _extract_tasks_fallback(self, transcript: str) -> Dict[str, Any]:
+    def queue_background_analyses(self, transcripts: List[str]) -> Optional[str]:
         """
-        Fallback task extraction using regex patterns when LLM returns non-JSON.
+        Queue meetings for analysis from a background job, without waiting
+        for the results.
+        With settings.use_batch_api_for_background on, transcripts that are
+        not already cached go to Groq's discounted Batch API, and
+        poll_background_batches later puts the results in the analysis
+        cache. Otherwise they are analyzed right away through abatch_analyze.
+        Not for user requests: results arrive minutes to hours later.
         
         Args:
-            transcript: Meeting transcript text
+            transcripts: Meeting transcripts
             
         Returns:
-            Dictionary with extracted tasks
+            The Groq batch ID, or None if no batch was submitted
         """
-        import re
+        with self._analysis_lock:
+            pending = [
+                t for t in dict.fromkeys(transcripts)
+                if self._analysis_key(t) not in self._analysis_cache
+            ]
+        if not pending or not self.is_configured:
+            return None
         
-        tasks = []
+        if settings.use_batch_api_for_background:
+            try:
+                batch_id = self.submit_batch_analyze(pending)
+            except Exception as e:
+                logger.warning("Groq batch submission failed, analyzing directly: %s", e)
+            else:
+                with self._batch_lock:
+                    self._batches[batch_id] = (pending, time.monotonic())
+                return batch_id
         
-        # Patterns that indicate task assignment
-        patterns = [
-            # "X will do Y" or "X should do Y"
-            r"(\b[A-Z][a-z]+(?:\s+[A-Z]\.?)?)\s+(?:will|should|needs?\s+to|is\s+going\s+to)\s+(.+?)(?:\.|$)",
-            # "assigned to X" or "X is assigned"
-            r"(.+?)\s+(?:is\s+)?assigned\s+to\s+(\b[A-Z][a-z]+(?:\s+[A-Z]\.?)?)",
-            # "X to start/begin/work on Y"
-            r"(\b[A-Z][a-z]+(?:\s+[A-Z]\.?)?)\s+to\s+(?:start|begin|work\s+on|handle)\s+(.+?)(?:\.|$)",
-        ]
+        _run(self.abatch_analyze(pending))
+        return None
+    
+    def poll_background_batches(self) -> int:
+        """
+        Check the queued Groq batches once, without blocking on them.
+        Call it periodically from a background loop; the batches are checked
+        at most every BATCH_POLL_INTERVAL seconds. Finished results go into
+        the analysis cache. A batch that failed, or is still running after
+        settings.groq_batch_wait_minutes, is dropped (and cancelled), and its
+        meetings are analyzed through abatch_analyze instead.
+        
+        Returns:
+            Number of batches resolved by this call
+        """
+        now = time.monotonic()
+        with self._batch_lock:
+            if not self._batches or now - self._batches_checked_at < self.BATCH_POLL_INTERVAL:
+                return 0
+            self._batches_checked_at = now
+            batches = list(self._batches.items())
         
-        for pattern in patterns:
-            matches = re.findall(pattern, transcript, re.IGNORECASE)
-            for match in matches:
-                if len(match) == 2:
-                    assignee, task_desc = match[0].strip(), match[1].strip()
-                    # Swap if pattern matched in reverse order
-                    if "assigned to" in pattern:
-                        task_desc, assignee = assignee, task_desc
-                    
-                    if task_desc and len(task_desc) > 5:  # Skip very short matches
-                        tasks.append({
-                            "title": task_desc[:200],
-                            "assignee": assignee,
-                            "due_date": None
-                        })
-        
-        if tasks:
-            logger.info(f"Fallback extraction found {len(tasks)} tasks")
-        
-        return {"tasks": tasks}
+        resolved = 0
+        for batch_id, (transcripts, submitted_at) in batches:
+            try:
+                results = self.poll_batch(batch_id)
+            except RuntimeError as e:
+                logger.warning("%s, analyzing its meetings directly", e)
+                results = []
+            except Exception as e:
+                logger.warning("Could not check Groq batch %s, will retry: %s", batch_id, e)
+                continue
+            
+            if results is None:
+                if now - submitted_at < settings.groq_batch_wait_minutes * 60:
+                    continue
+                logger.warning("Groq batch %s not done in time, cancelling", batch_id)
+                self._cancel_batch(batch_id)
+                results = []
+            
+            with self._batch_lock:
+                self._batches.pop(batch_id, None)
+            resolved += 1
+            
+            missing = []
+            for i, transcript in enumerate(transcripts):
+                result = results[i] if i < len(results) else None
+                if result is None:
+                    missing.append(transcript)
+                else:
+                    self._store_analysis(self._analysis_key(transcript), result)
+            if missing:
+                logger.info("Analyzing %d meetings from batch %s with the synchronous API", len(missing), batch_id)
+                _run(self.abatch_analyze(missing))
+        return resolved
     
-    def analyze_meeting(self, transcript: str) -> Dict[str, Any]:
+    def _groq_headers(self) -> Dict[str, str]:
+        """Auth header for direct Groq REST calls."""
+        return {"Authorization": f"Bearer {self.api_key}"}
+    
+    def submit_batch_analyze(self, transcripts: List[str]) -> str:
         """
-        Perform complete meeting analysis: title, summary, project, and tasks.
+        Submit a Groq batch job with one combined analysis per transcript.
+        
+        Args:
+            transcripts: Meeting transcripts
+            
+        Returns:
+            The Groq batch ID, for poll_batch
+        """
+        if not self.is_configured:
+            raise RuntimeError("LLM client not configured")
+        
+        lines = []
+        for i, transcript in enumerate(transcripts):
+            system_prompt, user_prompt = self._all_prompts(transcript)
+            lines.append(json_utils.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model_name,
+                    "messages": [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    "temperature": 0.2,
+                    "response_format": {"type": "json_object"},
+                    **ANALYZE_LIMITS
+                }
+            }))
+        
+        upload = self._http_client.post(  # type: ignore[union-attr]
+            f"{GROQ_API_BASE}/files",
+            headers=self._groq_headers(),
+            data={"purpose": "batch"},
+            files={"file": ("analyze_meetings.jsonl", b"\n".join(lines))},
+            timeout=60
+        )
+        upload.raise_for_status()
+        
+        response = self._http_client.post(  # type: ignore[union-attr]
+            f"{GROQ_API_BASE}/batches",
+            headers=self._groq_headers(),
+            json={
+                "input_file_id": upload.json()["id"],
+                "endpoint": "/v1/chat/completions",
+                "completion_window": "24h"
+            },
+            timeout=30
+        )
+        response.raise_for_status()
+        batch_id = response.json()["id"]
+        logger.info("Submitted Groq batch %s with %d meetings", batch_id, len(transcripts))
+        return batch_id
+    
+    def poll_batch(self, batch_id: str) -> Optional[List[Optional[Dict[str, Any]]]]:
+        """
+        Fetch the results of a Groq batch job if it has finished.
+        
+        Args:
+            batch_id: ID returned by submit_batch_analyze
+            
+        Returns:
+            None while the batch is still running; otherwise one result per
+            submitted transcript, in order, with None for failed items
+            
+        Raises:
+            RuntimeError: If the batch failed, expired, or was cancelled
+        """
+        response = self._http_client.get(  # type: ignore[union-attr]
+            f"{GROQ_API_BASE}/batches/{batch_id}",
+            headers=self._groq_headers(),
+            timeout=30
+        )
+        response.raise_for_status()
+        batch = response.json()
+        
+        status = batch.get("status")
+        if status in ("failed", "expired", "cancelled", "cancelling"):
+            raise RuntimeError(f"Groq batch {batch_id} {status}")
+        if status != "completed":
+            logger.debug("Groq batch %s status: %s", batch_id, status)
+            return None
+        
+        total = (batch.get("request_counts") or {}).get("total") or 0
+        results: List[Optional[Dict[str, Any]]] = [None] * total
+        if not batch.get("output_file_id"):
+            return results
+        
+        content = self._http_client.get(  # type: ignore[union-attr]
+            f"{GROQ_API_BASE}/files/{batch['output_file_id']}/content",
+            headers=self._groq_headers(),
+            timeout=60
+        )
+        content.raise_for_status()
+        
+        for line in content.text.splitlines():
+            if not line.strip():
+                continue
+            item = json_utils.loads(line)
+            index = int(item["custom_id"])
+            reply = item.get("response") or {}
+            if item.get("error") or reply.get("status_code") != 200:
+                continue
+            try:
+                text = reply["body"]["choices"][0]["message"]["content"]
+                result = self._finish_all(text)
+            except (KeyError, IndexError, ValueError) as e:
+                logger.warning("Unusable result for meeting %s in batch %s: %s", index, batch_id, e)
+                continue
+            if index >= len(results):
+                results.extend([None] * (index + 1 - len(results)))
+            results[index] = result
+        
+        logger.info("Groq batch %s completed", batch_id)
+        return results
+    
+    def _cancel_batch(self, batch_id: str) -> None:
+        """Best-effort cancel of a Groq batch we've stopped waiting for."""
+        try:
+            self._http_client.post(  # type: ignore[union-attr]
+                f"{GROQ_API_BASE}/batches/{batch_id}/cancel",
+                headers=self._groq_headers(),
+                timeout=30
+            )
+        except Exception as e:
+            logger.debug("Could not cancel Groq batch %s: %s", batch_id, e)
+    
+    @staticmethod
+    def _analysis_key(transcript: str) -> str:
+        """Cache key for a transcript: its blake2b hex digest."""
+        return hashlib.blake2b(transcript.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def _get_cached_analysis(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached analysis for key, if any."""
+        with self._analysis_lock:
+            cached = self._analysis_cache.get(key)
+        if cached is None:
+            return None
+        logger.info("Meeting analysis served from cache")
+        return copy.deepcopy(cached)
+    
+    def _store_analysis(self, key: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Cache a private copy of result and hand the original back."""
+        with self._analysis_lock:
+            self._analysis_cache[key] = copy.deepcopy(result)
+        return result
+    
+    async def _aanalyze_separately(self, transcript: str) -> Dict[str, Any]:
+        """
+        Meeting analysis with one LLM call per field, run concurrently.
+        Title and tasks are requested alongside the summary; only the project
+        name waits, since it is extracted with the summary as context.
         
         Args:
             transcript: Full meeting transcript
@@ -399,10 +1766,16 @@ Respond with JSON only:"""
         Returns:
             Dictionary with meeting_title, project_name, summary, and tasks
         """
-        meeting_title = self.extract_meeting_title(transcript)
-        summary = self.summarize_meeting(transcript)
-        project_name = self.extract_project_name(transcript, summary)
-        tasks = self.extract_tasks(transcript, summary)
+        title_task = asyncio.create_task(self.aextract_meeting_title(transcript))
+        tasks_task = asyncio.create_task(self.aextract_tasks(transcript))
+        try:
+            summary = await self.asummarize_meeting(transcript)
+            project_name = await self.aextract_project_name(transcript, summary)
+            meeting_title, tasks = await asyncio.gather(title_task, tasks_task)
+        except BaseException:
+            title_task.cancel()
+            tasks_task.cancel()
+            raise
         
         return {
             "meeting_title": meeting_title,
@@ -412,13 +1785,24 @@ Respond with JSON only:"""
         }
 
 
-# Singleton instance
+# Singleton instance; the lock keeps concurrent first calls from each
+# building a client (and its HTTP connections)
 _llm_client: Optional[LLMClient] = None
+_llm_client_lock = threading.Lock()
 
 
 def get_llm_client() -> LLMClient:
     """Get or create the singleton LLM client instance."""
     global _llm_client
     if _llm_client is None:
-        _llm_client = LLMClient()
+        with _llm_client_lock:
+            if _llm_client is None:
+                _llm_client = LLMClient()
+    return _llm_client
+
+
+async def get_llm_client_async() -> LLMClient:
+    """Async get_llm_client; a first-time build runs off the event loop."""
+    if _llm_client is None:
+        return await asyncio.to_thread(get_llm_client)
     return _llm_client
@@ -3,11 +3,16 @@ Custom logging configuration for workflow automation.
 Provides clear, presentable logs especially for LangGraph orchestration,
 showing node activations with visual formatting.
 """
+import atexit
+import inspect
 import logging
+import queue
 import sys
+import time
 from datetime import datetime
-from functools import wraps
-from typing import Any, Callable, Optional
+from functools import lru_cache, wraps
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Optional, Tuple
 
 
 # ANSI color codes for terminal output
@@ -60,11 +65,38 @@ NODE_ICONS = {
     "default": "▶️",
 }
 
+# Checked once: isatty() is a syscall, and stdout doesn't change under us
+_IS_TTY = sys.stdout.isatty()
+
+# Border rules for the node and pipeline banners, built once
+_NODE_RULE = "─" * 60
+_PIPELINE_RULE = "═" * 70
+_NODE_RULE_OK = f"{Colors.BRIGHT_GREEN}{_NODE_RULE}{Colors.RESET}"
+_NODE_RULE_FAIL = f"{Colors.BRIGHT_RED}{_NODE_RULE}{Colors.RESET}"
+_PIPELINE_RULE_START = f"{Colors.BOLD}{Colors.BRIGHT_CYAN}{_PIPELINE_RULE}{Colors.RESET}"
+_PIPELINE_RULE_OK = f"{Colors.BOLD}{Colors.BRIGHT_GREEN}{_PIPELINE_RULE}{Colors.RESET}"
+_PIPELINE_RULE_FAIL = f"{Colors.BOLD}{Colors.BRIGHT_RED}{_PIPELINE_RULE}{Colors.RESET}"
+
+
+@lru_cache(maxsize=256)
+def _module_columns(logger_name: str) -> Tuple[str, str]:
+    """Icon plus padded module name for a logger, as (plain, colorized)."""
+    module = logger_name.split(".")[-1] if logger_name else "root"
+    icon = NODE_ICONS.get(module, NODE_ICONS.get("default", ""))
+    return (
+        f"{icon} {module:20}",
+        f"{icon} {Colors.BRIGHT_BLUE}{module:20}{Colors.RESET}",
+    )
+
 
 class WorkflowFormatter(logging.Formatter):
     """
     Custom formatter that provides clean, presentable log output.
     Especially formatted for LangGraph orchestration visibility.
+    
+    This class writes plain text (files, pipes, CI); _TTYWorkflowFormatter
+    is the colorized variant. setup_logging picks one up front, so
+    neither format() checks for colors per record.
     """
     
     # Level-specific formatting
@@ -76,44 +108,47 @@ class WorkflowFormatter(logging.Formatter):
         logging.CRITICAL: (Colors.BOLD + Colors.BRIGHT_RED, "CRIT "),
     }
     
-    def __init__(self, use_colors: bool = True):
-        super().__init__()
-        self.use_colors = use_colors and sys.stdout.isatty()
-    
-    def format(self, record: logging.LogRecord) -> str:
-        # Get level formatting
-        color, level_text = self.LEVEL_FORMATS.get(
+    def _level(self, record: logging.LogRecord) -> Tuple[str, str]:
+        """(color, 5-char label) for the record's level."""
+        return self.LEVEL_FORMATS.get(
             record.levelno,
             (Colors.WHITE, record.levelname[:5])
         )
-        
-        # Format timestamp
-        timestamp = datetime.fromtimestamp(record.created).strftime("%H:%M:%S")
-        
-        # Determine component/module name
-        module = record.name.split(".")[-1] if record.name else "root"
-        
-        # Get icon for module
-        icon = NODE_ICONS.get(module, NODE_ICONS.get("default", ""))
-        
-        # Build the formatted message
-        if self.use_colors:
-            # Colorized output
-            level_str = f"{color}{level_text}{Colors.RESET}"
-            time_str = f"{Colors.DIM}{timestamp}{Colors.RESET}"
-            module_str = f"{Colors.BRIGHT_BLUE}{module:20}{Colors.RESET}"
-            msg = record.getMessage()
-            
-            formatted = f"{time_str} │ {level_str} │ {icon} {module_str} │ {msg}"
-        else:
-            # Plain text output (for file logging)
-            formatted = f"{timestamp} | {level_text} | {icon} {module:20} | {record.getMessage()}"
-        
-        # Add exception info if present
+    
+    @staticmethod
+    def _timestamp(record: logging.LogRecord) -> str:
+        """HH:MM:SS wall-clock time of the record."""
+        return datetime.fromtimestamp(record.created).strftime("%H:%M:%S")
+    
+    def _with_exception(self, formatted: str, record: logging.LogRecord) -> str:
+        """Append the formatted exception, if the record carries one."""
         if record.exc_info:
             formatted += "\n" + self.formatException(record.exc_info)
-        
         return formatted
+    
+    def format(self, record: logging.LogRecord) -> str:
+        _, level_text = self._level(record)
+        plain_module, _ = _module_columns(record.name)
+        formatted = f"{self._timestamp(record)} | {level_text} | {plain_module} | {record.getMessage()}"
+        return self._with_exception(formatted, record)
+
+
+class _TTYWorkflowFormatter(WorkflowFormatter):
+    """WorkflowFormatter with ANSI colors, for interactive terminals."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        color, level_text = self._level(record)
+        _, color_module = _module_columns(record.name)
+        formatted = (
+            f"{Colors.DIM}{self._timestamp(record)}{Colors.RESET} │ "
+            f"{color}{level_text}{Colors.RESET} │ {color_module} │ {record.getMessage()}"
+        )
+        return self._with_exception(formatted, record)
+
+
+def _workflow_formatter(use_colors: bool) -> WorkflowFormatter:
+    """Colorized formatter when asked for and stdout is a terminal, else plain."""
+    return _TTYWorkflowFormatter() if use_colors and _IS_TTY else WorkflowFormatter()
 
 
 class NodeLogFormatter(logging.Formatter):
@@ -124,7 +159,7 @@ class NodeLogFormatter(logging.Formatter):
     
     def __init__(self, use_colors: bool = True):
         super().__init__()
-        self.use_colors = use_colors and sys.stdout.isatty()
+        self.use_colors = use_colors and _IS_TTY
     
     def format(self, record: logging.LogRecord) -> str:
         timestamp = datetime.fromtimestamp(record.created).strftime("%H:%M:%S")
@@ -135,6 +170,21 @@ class NodeLogFormatter(logging.Formatter):
         return f"{timestamp} | {msg}"
 
 
+# Background thread that writes queued records to the console/file handlers
+_listener: Optional[QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the listener thread, if running."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
 def setup_logging(
     level: str = "INFO",
     log_file: Optional[str] = None,
@@ -143,11 +193,16 @@ def setup_logging(
     """
     Configure logging for the workflow automation system.
     
+    The root logger only enqueues records; a QueueListener thread formats
+    them and does the console/file writes, so logging calls don't block on I/O.
+    
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional path to log file
         use_colors: Whether to use ANSI colors in console output
     """
+    global _listener
+    
     # Get numeric level
     numeric_level = getattr(logging, level.upper(), logging.INFO)
     
@@ -155,21 +210,27 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
     
-    # Clear existing handlers
+    # Clear existing handlers (and the listener feeding them)
+    _stop_listener()
     root_logger.handlers.clear()
     
     # Console handler with colors
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(numeric_level)
-    console_handler.setFormatter(WorkflowFormatter(use_colors=use_colors))
-    root_logger.addHandler(console_handler)
+    console_handler.setFormatter(_workflow_formatter(use_colors))
+    handlers = [console_handler]
     
     # File handler (if specified)
     if log_file:
         file_handler = logging.FileHandler(log_file, encoding="utf-8")
         file_handler.setLevel(numeric_level)
-        file_handler.setFormatter(WorkflowFormatter(use_colors=False))
-        root_logger.addHandler(file_handler)
+        file_handler.setFormatter(WorkflowFormatter())
+        handlers.append(file_handler)
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
     
     # Reduce noise from third-party libraries
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -197,46 +258,56 @@ def get_logger(name: str) -> logging.Logger:
 # ============================================================================
 # LangGraph Node Logging Utilities
 # ============================================================================
+# Each helper returns before building its banner when INFO is disabled for
+# the logger, since a banner is several formatted records.
 
 def log_node_entry(node_name: str, logger: logging.Logger) -> None:
     """Log entry into a LangGraph node with visual formatting."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     icon = NODE_ICONS.get(node_name, NODE_ICONS["default"])
     
-    if sys.stdout.isatty():
-        border = f"{Colors.BRIGHT_GREEN}{'─' * 60}{Colors.RESET}"
+    if _IS_TTY:
         header = f"{Colors.BOLD}{Colors.BRIGHT_GREEN}▶ ENTERING NODE: {node_name.upper()}{Colors.RESET}"
-        logger.info(f"\n{border}")
+        logger.info(f"\n{_NODE_RULE_OK}")
         logger.info(f"{icon}  {header}")
-        logger.info(border)
+        logger.info(_NODE_RULE_OK)
     else:
-        logger.info(f"\n{'─' * 60}")
+        logger.info(f"\n{_NODE_RULE}")
         logger.info(f"{icon}  ▶ ENTERING NODE: {node_name.upper()}")
-        logger.info("─" * 60)
+        logger.info(_NODE_RULE)
 
 
 def log_node_exit(node_name: str, logger: logging.Logger, success: bool = True, duration_ms: Optional[float] = None) -> None:
     """Log exit from a LangGraph node with visual formatting."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     icon = NODE_ICONS.get(node_name, NODE_ICONS["default"])
     status = "✓ COMPLETED" if success else "✗ FAILED"
     duration_str = f" ({duration_ms:.0f}ms)" if duration_ms else ""
     
-    if sys.stdout.isatty():
+    if _IS_TTY:
         color = Colors.BRIGHT_GREEN if success else Colors.BRIGHT_RED
-        border = f"{color}{'─' * 60}{Colors.RESET}"
+        border = _NODE_RULE_OK if success else _NODE_RULE_FAIL
         footer = f"{Colors.BOLD}{color}◀ {status}: {node_name.upper()}{duration_str}{Colors.RESET}"
         logger.info(f"{icon}  {footer}")
         logger.info(f"{border}\n")
     else:
         logger.info(f"{icon}  ◀ {status}: {node_name.upper()}{duration_str}")
-        logger.info(f"{'─' * 60}\n")
+        logger.info(f"{_NODE_RULE}\n")
 
 
 def log_node_transition(from_node: str, to_node: str, logger: logging.Logger) -> None:
     """Log transition between LangGraph nodes."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     from_icon = NODE_ICONS.get(from_node, "")
     to_icon = NODE_ICONS.get(to_node, "")
     
-    if sys.stdout.isatty():
+    if _IS_TTY:
         arrow = f"{Colors.BRIGHT_MAGENTA}  ════▶  {Colors.RESET}"
         logger.info(f"{from_icon} {from_node}{arrow}{to_icon} {to_node}")
     else:
@@ -245,11 +316,13 @@ def log_node_transition(from_node: str, to_node: str, logger: logging.Logger) ->
 
 def log_pipeline_start(pipeline_name: str, logger: logging.Logger, context: Optional[dict] = None) -> None:
     """Log the start of a pipeline execution."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     icon = NODE_ICONS.get("pipeline", "🔄")
     
-    if sys.stdout.isatty():
-        border_char = "═"
-        top_border = f"{Colors.BOLD}{Colors.BRIGHT_CYAN}{border_char * 70}{Colors.RESET}"
+    if _IS_TTY:
+        top_border = _PIPELINE_RULE_START
         header = f"{Colors.BOLD}{Colors.BRIGHT_CYAN}║  {icon}  PIPELINE START: {pipeline_name.upper()}{Colors.RESET}"
         
         logger.info(f"\n{top_border}")
@@ -260,26 +333,28 @@ def log_pipeline_start(pipeline_name: str, logger: logging.Logger, context: Opti
                 logger.info(f"{Colors.CYAN}║    {key}: {value_str}{Colors.RESET}")
         logger.info(f"{top_border}\n")
     else:
-        logger.info(f"\n{'═' * 70}")
+        logger.info(f"\n{_PIPELINE_RULE}")
         logger.info(f"║  {icon}  PIPELINE START: {pipeline_name.upper()}")
         if context:
             for key, value in context.items():
                 value_str = str(value)[:50] + "..." if len(str(value)) > 50 else str(value)
                 logger.info(f"║    {key}: {value_str}")
-        logger.info(f"{'═' * 70}\n")
+        logger.info(f"{_PIPELINE_RULE}\n")
 
 
 def log_pipeline_end(pipeline_name: str, logger: logging.Logger, success: bool = True, duration_ms: Optional[float] = None, results: Optional[dict] = None) -> None:
     """Log the end of a pipeline execution."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     icon = NODE_ICONS.get("pipeline", "🔄")
     status = "✓ SUCCESS" if success else "✗ FAILED"
     status_icon = "✅" if success else "❌"
     duration_str = f" in {duration_ms:.0f}ms" if duration_ms else ""
     
-    if sys.stdout.isatty():
+    if _IS_TTY:
         color = Colors.BRIGHT_GREEN if success else Colors.BRIGHT_RED
-        border_char = "═"
-        border = f"{Colors.BOLD}{color}{border_char * 70}{Colors.RESET}"
+        border = _PIPELINE_RULE_OK if success else _PIPELINE_RULE_FAIL
         footer = f"{Colors.BOLD}{color}║  {status_icon}  PIPELINE {status}: {pipeline_name.upper()}{duration_str}{Colors.RESET}"
         
         logger.info(f"\n{border}")
@@ -290,23 +365,26 @@ def log_pipeline_end(pipeline_name: str, logger: logging.Logger, success: bool =
         logger.info(footer)
         logger.info(f"{border}\n")
     else:
-        logger.info(f"\n{'═' * 70}")
+        logger.info(f"\n{_PIPELINE_RULE}")
         if results:
             for key, value in results.items():
                 value_str = str(value)[:50] + "..." if len(str(value)) > 50 else str(value)
                 logger.info(f"║    {key}: {value_str}")
         logger.info(f"║  {status_icon}  PIPELINE {status}: {pipeline_name.upper()}{duration_str}")
-        logger.info(f"{'═' * 70}\n")
+        logger.info(f"{_PIPELINE_RULE}\n")
 
 
 def log_step_progress(step_num: int, total_steps: int, step_name: str, logger: logging.Logger) -> None:
     """Log progress through pipeline steps."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     progress_bar_len = 20
     filled = int((step_num / total_steps) * progress_bar_len)
     bar = "█" * filled + "░" * (progress_bar_len - filled)
     percentage = (step_num / total_steps) * 100
     
-    if sys.stdout.isatty():
+    if _IS_TTY:
         logger.info(
             f"{Colors.BRIGHT_YELLOW}[{bar}] {percentage:.0f}% │ "
             f"Step {step_num}/{total_steps}: {step_name}{Colors.RESET}"
@@ -322,6 +400,7 @@ def log_step_progress(step_num: int, total_steps: int, step_name: str, logger: l
 def langgraph_node(node_name: Optional[str] = None):
     """
     Decorator to automatically log LangGraph node entry and exit.
+    Works on both plain and async node functions.
     
     Usage:
         @langgraph_node("summarize_meeting")
@@ -332,20 +411,39 @@ def langgraph_node(node_name: Optional[str] = None):
         name = node_name or func.__name__
         node_logger = logging.getLogger(name)
         
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                start_time = time.perf_counter()
+                
+                log_node_entry(name, node_logger)
+                
+                try:
+                    result = await func(*args, **kwargs)
+                    duration_ms = (time.perf_counter() - start_time) * 1000
+                    log_node_exit(name, node_logger, success=True, duration_ms=duration_ms)
+                    return result
+                except Exception as e:
+                    duration_ms = (time.perf_counter() - start_time) * 1000
+                    node_logger.error(f"Node error: {e}")
+                    log_node_exit(name, node_logger, success=False, duration_ms=duration_ms)
+                    raise
+            
+            return async_wrapper
+        
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            import time
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             log_node_entry(name, node_logger)
             
             try:
                 result = func(*args, **kwargs)
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.perf_counter() - start_time) * 1000
                 log_node_exit(name, node_logger, success=True, duration_ms=duration_ms)
                 return result
             except Exception as e:
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.perf_counter() - start_time) * 1000
                 node_logger.error(f"Node error: {e}")
                 log_node_exit(name, node_logger, success=False, duration_ms=duration_ms)
                 raise
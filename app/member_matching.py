@@ -3,9 +3,10 @@ Member name matching utilities with fuzzy matching, alias support, and initials
 Handles variations like "V.S." → "Mukundan V S", "Kyla" → "Kailas S S".
 """
 import re
-from difflib import SequenceMatcher
 from typing import Optional, List, Dict, Tuple
 
+from rapidfuzz import fuzz, process
+
 from app.logger import get_logger
 
 logger = get_logger(__name__)
@@ -92,7 +93,7 @@ def expand_initials(name: str) -> List[str]:
 
 def calculate_similarity(name1: str, name2: str) -> float:
     """
-    Calculate similarity between two names using multiple strategies.
+    Calculate similarity between two normalized names with rapidfuzz's token_set_ratio.
     
     Args:
         name1: First name
@@ -111,36 +112,10 @@ def calculate_similarity(name1: str, name2: str) -> float:
     if n1 == n2:
         return 1.0
     
-    # Check if one is contained in the other
-    if n1 in n2 or n2 in n1:
-        return 0.85
-    
-    # Base similarity using SequenceMatcher
-    base_ratio = SequenceMatcher(None, n1, n2).ratio()
-    
-    # Part-by-part matching (for multi-word names)
-    parts1 = set(n1.split())
-    parts2 = set(n2.split())
-    
-    # Check for matching parts
-    common_parts = parts1 & parts2
-    if common_parts:
-        part_bonus = len(common_parts) / max(len(parts1), len(parts2)) * 0.3
-        base_ratio = max(base_ratio, 0.5 + part_bonus)
-    
-    # Individual part similarity
-    max_part_ratio = 0.0
-    for p1 in parts1:
-        for p2 in parts2:
-            if len(p1) > 1 and len(p2) > 1:  # Skip single letters
-                part_ratio = SequenceMatcher(None, p1, p2).ratio()
-                max_part_ratio = max(max_part_ratio, part_ratio)
-    
-    # Boost if a significant part matches
-    if max_part_ratio > 0.8:
-        base_ratio = max(base_ratio, max_part_ratio * 0.9)
-    
-    return base_ratio
+    # token_set_ratio scores the shared words and the leftovers separately,
+    # so "Prasad" or "Govind K" score high against the full name. WRatio's
+    # partial matching was too generous with short unrelated names here.
+    return fuzz.token_set_ratio(n1, n2, processor=None) / 100.0
 
 
 def match_member_name(
@@ -176,45 +151,39 @@ def match_member_name(
     # Strategy 1: Check alias dictionary first
     if normalized_input in _ALIAS_TO_MEMBER:
         matched = _ALIAS_TO_MEMBER[normalized_input]
-        logger.info(f"Alias match: '{llm_name}' -> '{matched}' (via alias)")
+        logger.info("Alias match: '%s' -> '%s' (via alias)", llm_name, matched)
         return (matched, 1.0)
     
-    best_match: Optional[str] = None
-    best_score: float = 0.0
-    
+    # Strategy 2: Exact normalized match against a member or one of its
+    # aliases; everything else is a fuzzy candidate keyed by (member, name)
+    choices: Dict[Tuple[str, str], str] = {}
     for member in members:
-        member_normalized = normalize_name(member)
-        
-        # Strategy 2: Exact normalized match
-        if normalized_input == member_normalized:
-            logger.info(f"Exact match: '{llm_name}' -> '{member}'")
-            return (member, 1.0)
-        
-        # Check aliases for this member
-        member_aliases = NAME_ALIASES.get(member, [])
-        for alias in member_aliases:
-            if normalized_input == normalize_name(alias):
-                logger.info(f"Alias match: '{llm_name}' -> '{member}' (alias: {alias})")
+        for candidate in [member, *NAME_ALIASES.get(member, [])]:
+            candidate_normalized = normalize_name(candidate)
+            if normalized_input == candidate_normalized:
+                if candidate == member:
+                    logger.info("Exact match: '%s' -> '%s'", llm_name, member)
+                else:
+                    logger.info("Alias match: '%s' -> '%s' (alias: %s)", llm_name, member, candidate)
                 return (member, 1.0)
-        
-        # Strategy 3: Calculate similarity
-        score = calculate_similarity(llm_name, member)
-        
-        # Also check against aliases
-        for alias in member_aliases:
-            alias_score = calculate_similarity(llm_name, alias)
-            score = max(score, alias_score)
-        
-        if score > best_score:
-            best_score = score
-            best_match = member
+            choices[(member, candidate)] = candidate_normalized
+    
+    # Strategy 3/4: Best fuzzy score over every member name and alias in one scan
+    result = process.extractOne(
+        normalized_input, choices, scorer=fuzz.token_set_ratio, processor=None
+    )
+    best_match: Optional[str] = None
+    best_score: float = 0.0
+    if result is not None:
+        _, score, (best_match, _) = result
+        best_score = score / 100.0
     
     # Check if best match meets threshold
     if best_match and best_score >= threshold:
-        logger.info(f"Fuzzy match: '{llm_name}' -> '{best_match}' (similarity: {best_score:.2f})")
+        logger.info("Fuzzy match: '%s' -> '%s' (similarity: %.2f)", llm_name, best_match, best_score)
         return (best_match, best_score)
     
-    logger.warning(f"No member match found for '{llm_name}' (best: {best_match}, score: {best_score:.2f})")
+    logger.warning("No member match found for '%s' (best: %s, score: %.2f)", llm_name, best_match, best_score)
     return None
 
 
@@ -248,7 +217,7 @@ def add_alias(member_name: str, alias: str) -> None:
     if normalized_alias not in NAME_ALIASES[member_name]:
         NAME_ALIASES[member_name].append(normalized_alias)
         _ALIAS_TO_MEMBER[normalized_alias] = member_name
-        logger.info(f"Added alias '{alias}' for '{member_name}'")
+        logger.info("Added alias '%s' for '%s'", alias, member_name)
 
 
 def update_team_members(members: List[str]) -> None:
@@ -260,4 +229,4 @@ def update_team_members(members: List[str]) -> None:
     """
     global DEFAULT_TEAM_MEMBERS
     DEFAULT_TEAM_MEMBERS = members.copy()
-    logger.info(f"Updated team members: {members}")
+    logger.info("Updated team members: %s", members)
@@ -28,7 +28,7 @@ class Member(Base):
     __tablename__ = "members"
     
     member_id = Column(Integer, primary_key=True, autoincrement=True)
-    member_name = Column(String(120), nullable=False)
+    member_name = Column(String(120), nullable=False, unique=True, index=True)
     designation = Column(String(100), nullable=False)
     password = Column(String(120), nullable=False)
     
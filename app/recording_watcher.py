@@ -55,7 +55,7 @@ def get_recordings_dir() -> Path:
     # Create directory if it doesn't exist
     if not path.exists():
         path.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Created recordings directory: {path}")
+        logger.info("Created recordings directory: %s", path)
     
     return path
 
@@ -120,16 +120,16 @@ def scan_for_new_recordings() -> List[Path]:
                 continue
             
             if is_file_processed(file_path.name):
-                logger.debug(f"File already processed: {file_path.name}")
+                logger.debug("File already processed: %s", file_path.name)
                 continue
             
             new_files.append(file_path)
-            logger.debug(f"Found new recording: {file_path.name}")
+            logger.debug("Found new recording: %s", file_path.name)
         
         return new_files
         
     except Exception as e:
-        logger.error(f"Error scanning recordings directory: {e}")
+        logger.error("Error scanning recordings directory: %s", e)
         return []
 
 
@@ -148,7 +148,7 @@ def process_recording_file(file_path: Path) -> Dict[str, Any]:
     
     # Prevent duplicate concurrent processing
     if filename in _currently_processing:
-        logger.info(f"⏭️ Skipping already-processing file: {filename}")
+        logger.info("⏭️ Skipping already-processing file: %s", filename)
         return {
             "filename": filename,
             "error": "Already being processed",
@@ -158,7 +158,7 @@ def process_recording_file(file_path: Path) -> Dict[str, Any]:
     # Add to processing set
     _currently_processing.add(filename)
     
-    logger.info(f"🎬 Processing recording: {filename}")
+    logger.info("🎬 Processing recording: %s", filename)
     
     result = {
         "filename": filename,
@@ -182,7 +182,7 @@ def process_recording_file(file_path: Path) -> Dict[str, Any]:
         
         # Step 1: Transcribe the recording
         try:
-            logger.info(f"📝 Step 1: Transcribing {filename}...")
+            logger.info("📝 Step 1: Transcribing %s...", filename)
             
             if not is_transcriber_ready():
                 raise RuntimeError("Transcriber not available (faster-whisper not installed)")
@@ -193,41 +193,39 @@ def process_recording_file(file_path: Path) -> Dict[str, Any]:
                 raise ValueError("Transcription returned empty result")
             
             result["transcript"] = transcript
-            logger.info(f"✅ Transcription complete: {len(transcript)} characters")
+            logger.info("✅ Transcription complete: %d characters", len(transcript))
             
         except Exception as e:
-            logger.error(f"❌ Transcription error: {e}")
+            logger.error("❌ Transcription error: %s", e)
             result["error"] = f"Transcription failed: {e}"
             _processed_files.add(filename)  # Mark as processed to avoid retry loop
             return result
         
         # Step 2: Extract tasks using LLM
         try:
-            logger.info(f"🤖 Step 2: Extracting tasks via LLM...")
+            logger.info("🤖 Step 2: Extracting tasks via LLM...")
             
             llm = get_llm_client()
             if not llm.is_configured:
                 logger.warning("LLM not configured, skipping task extraction")
             else:
+                # Summary and tasks are independent calls; run them together
+                summary, tasks_result = llm.summarize_and_extract_tasks(transcript)
+                
                 # Get summary
-                try:
-                    summary = llm.summarize_meeting(transcript)
-                    result["summary"] = summary
-                    logger.info(f"📋 Summary: {summary[:100]}...")
-                except Exception as sum_err:
-                    logger.error(f"❌ Summary error: {sum_err}")
+                if isinstance(summary, BaseException):
+                    logger.error("❌ Summary error: %s", summary)
                     summary = transcript[:500]
-                    result["summary"] = summary
+                else:
+                    logger.info("📋 Summary: %s...", summary[:100])
+                result["summary"] = summary
                 
                 # Extract tasks with safe extraction
                 try:
+                    # Get raw response for safe extraction
                     llm_response = None
-                    try:
-                        tasks_result = llm.extract_tasks(transcript, summary)
-                        # Get raw response for safe extraction
-                        llm_response = str(tasks_result) if tasks_result else None
-                    except Exception:
-                        llm_response = None
+                    if tasks_result and not isinstance(tasks_result, BaseException):
+                        llm_response = str(tasks_result)
                     
                     # Use safe extraction with fallbacks
                     extraction_result = safe_extract_tasks(
@@ -237,20 +235,20 @@ def process_recording_file(file_path: Path) -> Dict[str, Any]:
                     )
                     tasks = extraction_result.get("tasks", [])
                     result["tasks"] = tasks
-                    logger.info(f"📋 Extracted {len(tasks)} task(s) via {extraction_result.get('extraction_method', 'unknown')}")
+                    logger.info("📋 Extracted %d task(s) via %s", len(tasks), extraction_result.get('extraction_method', 'unknown'))
                     
                 except Exception as task_err:
-                    logger.error(f"❌ Task extraction error: {task_err}")
+                    logger.error("❌ Task extraction error: %s", task_err)
                     tasks = []
         
         except Exception as e:
-            logger.error(f"❌ LLM step error: {e}")
+            logger.error("❌ LLM step error: %s", e)
             # Continue with empty tasks
         
         # Step 3: Create Jira tickets
         action_items = []  # For Confluence
         try:
-            logger.info(f"🎫 Step 3: Creating Jira tickets...")
+            logger.info("🎫 Step 3: Creating Jira tickets...")
             
             jira = get_jira_client()
             
@@ -264,14 +262,14 @@ def process_recording_file(file_path: Path) -> Dict[str, Any]:
                 match_result = match_member_name(raw_assignee) if raw_assignee else None
                 if match_result:
                     matched_assignee = match_result[0]
-                    logger.info(f"👤 Mapped '{raw_assignee}' -> '{matched_assignee}' (score: {match_result[1]:.2f})")
+                    logger.info("👤 Mapped '%s' -> '%s' (score: %.2f)", raw_assignee, matched_assignee, match_result[1])
                 
                 # Parse due date with natural language support
                 parsed_due_date = parse_due_date(due_date_str) if due_date_str else None
                 due_date_iso = format_date_iso(parsed_due_date) if parsed_due_date else None
                 
                 if due_date_str and parsed_due_date:
-                    logger.info(f"📅 Parsed date '{due_date_str}' -> '{due_date_iso}'")
+                    logger.info("📅 Parsed date '%s' -> '%s'", due_date_str, due_date_iso)
                 
                 # Create Jira ticket
                 jira_key = None
@@ -289,10 +287,10 @@ def process_recording_file(file_path: Path) -> Dict[str, Any]:
                         
                         jira_key = jira_result.get("key") if isinstance(jira_result, dict) else jira_result
                         if jira_key:
-                            logger.info(f"✅ Created Jira ticket: {jira_key}")
+                            logger.info("✅ Created Jira ticket: %s", jira_key)
                             result["jira_tickets"].append(jira_key)
                     except Exception as jira_err:
-                        logger.error(f"❌ Jira error for task '{task_desc[:50]}': {jira_err}")
+                        logger.error("❌ Jira error for task '%s': %s", task_desc[:50], jira_err)
                 else:
                     logger.warning("Jira not configured, skipping ticket creation")
                 
@@ -331,20 +329,20 @@ def process_recording_file(file_path: Path) -> Dict[str, Any]:
                                 "task_id": db_task.task_id,
                                 "member": member.member_name
                             })
-                            logger.info(f"📊 Stored in DB: task_id={db_task.task_id}")
+                            logger.info("📊 Stored in DB: task_id=%s", db_task.task_id)
                         else:
                             if matched_assignee:
-                                logger.warning(f"⚠️ No DB member found for '{matched_assignee}'")
+                                logger.warning("⚠️ No DB member found for '%s'", matched_assignee)
                 except Exception as db_err:
-                    logger.error(f"❌ DB error storing task: {db_err}")
+                    logger.error("❌ DB error storing task: %s", db_err)
             
         except Exception as e:
-            logger.error(f"❌ Jira step error: {e}")
+            logger.error("❌ Jira step error: %s", e)
             # Continue to Confluence and DB
         
         # Step 4: Create/Update Confluence page
         try:
-            logger.info(f"📄 Step 4: Creating Confluence page...")
+            logger.info("📄 Step 4: Creating Confluence page...")
             
             confluence = get_confluence_client()
             
@@ -366,20 +364,20 @@ def process_recording_file(file_path: Path) -> Dict[str, Any]:
                         result["confluence_page_id"] = confluence_result.get("page_id")
                         result["confluence_url"] = confluence_result.get("page_url")
                         action = confluence_result.get("action", "created")
-                        logger.info(f"✅ Confluence page {action}: {result['confluence_url']}")
+                        logger.info("✅ Confluence page %s: %s", action, result['confluence_url'])
                     else:
                         logger.warning("⚠️ Confluence page creation returned None")
                 except Exception as conf_err:
-                    logger.error(f"❌ Confluence error: {conf_err}")
+                    logger.error("❌ Confluence error: %s", conf_err)
             else:
                 logger.warning("Confluence not configured, skipping page creation")
                 
         except Exception as e:
-            logger.error(f"❌ Confluence step error: {e}")
+            logger.error("❌ Confluence step error: %s", e)
         
         # Step 5: Store transcription and meeting record
         try:
-            logger.info(f"💾 Step 5: Storing meeting record...")
+            logger.info("💾 Step 5: Storing meeting record...")
             
             with get_db_session() as db:
                 # Create transcription
@@ -398,15 +396,15 @@ def process_recording_file(file_path: Path) -> Dict[str, Any]:
                 db.commit()
                 
                 result["meeting_id"] = meeting.meeting_id
-                logger.info(f"📊 Created meeting record: meeting_id={meeting.meeting_id}")
+                logger.info("📊 Created meeting record: meeting_id=%s", meeting.meeting_id)
                 
         except Exception as db_err:
-            logger.error(f"❌ Failed to store meeting record: {db_err}")
+            logger.error("❌ Failed to store meeting record: %s", db_err)
         
         # Mark as processed
         _processed_files.add(filename)
         result["processed"] = True
-        logger.info(f"✅ Successfully processed: {filename}")
+        logger.info("✅ Successfully processed: %s", filename)
         
         return result
         
@@ -450,7 +448,7 @@ def poll_and_process_recordings() -> Dict[str, Any]:
             logger.debug("No new recordings found")
             return results
         
-        logger.info(f"Found {len(new_files)} new recording(s)")
+        logger.info("Found %d new recording(s)", len(new_files))
         
         # Process each new file
         for file_path in new_files:
@@ -471,7 +469,7 @@ def poll_and_process_recordings() -> Dict[str, Any]:
                 })
                 
             except Exception as e:
-                logger.error(f"Failed to process {file_path.name}: {e}")
+                logger.error("Failed to process %s: %s", file_path.name, e)
                 results["errors"] += 1
                 results["files"].append({
                     "filename": file_path.name,
@@ -480,13 +478,13 @@ def poll_and_process_recordings() -> Dict[str, Any]:
                 })
         
         logger.info(
-            f"✅ Poll cycle complete. "
-            f"Processed: {results['processed']}, "
-            f"Errors: {results['errors']}"
+            "✅ Poll cycle complete. Processed: %d, Errors: %d",
+            results['processed'],
+            results['errors']
         )
         
     except Exception as e:
-        logger.error(f"Error during poll cycle: {e}")
+        logger.error("Error during poll cycle: %s", e)
     finally:
         _is_processing = False
         _processing_lock.release()
@@ -504,7 +502,7 @@ def clear_processed_cache() -> int:
     global _processed_files
     count = len(_processed_files)
     _processed_files = set()
-    logger.info(f"Cleared processed files cache ({count} entries)")
+    logger.info("Cleared processed files cache (%s entries)", count)
     return count
 
 
@@ -530,7 +528,7 @@ def get_recordings_status() -> Dict[str, Any]:
                 else:
                     pending_files += 1
     except Exception as e:
-        logger.error(f"Error getting recordings status: {e}")
+        logger.error("Error getting recordings status: %s", e)
     
     return {
         "recordings_dir": str(recordings_dir),
@@ -581,7 +579,7 @@ def list_recordings(include_processed: bool = True) -> List[Dict[str, Any]]:
         return recordings
         
     except Exception as e:
-        logger.error(f"Error listing recordings: {e}")
+        logger.error("Error listing recordings: %s", e)
         return []
 
 
@@ -598,8 +596,8 @@ def _watcher_loop(poll_interval: int = 5):
     """
     global _watcher_running
     
-    logger.info(f"🔍 Watcher started. Polling every {poll_interval} seconds...")
-    logger.info(f"📁 Watching directory: {get_recordings_dir()}")
+    logger.info("🔍 Watcher started. Polling every %s seconds...", poll_interval)
+    logger.info("📁 Watching directory: %s", get_recordings_dir())
     
     while _watcher_running:
         try:
@@ -607,28 +605,31 @@ def _watcher_loop(poll_interval: int = 5):
             new_files = scan_for_new_recordings()
             
             if new_files:
-                logger.info(f"🆕 Found {len(new_files)} new recording(s)")
+                logger.info("🆕 Found %d new recording(s)", len(new_files))
                 
                 for file_path in new_files:
-                    logger.info(f"\n{'='*60}")
-                    logger.info(f"🎬 NEW RECORDING DETECTED: {file_path.name}")
-                    logger.info(f"{'='*60}")
+                    logger.info("\n" + "=" * 60)
+                    logger.info("🎬 NEW RECORDING DETECTED: %s", file_path.name)
+                    logger.info("=" * 60)
                     
                     # Process the file
                     result = process_recording_file(file_path)
                     
                     if result.get("processed"):
-                        logger.info(f"✅ Processing complete for {file_path.name}")
+                        logger.info("✅ Processing complete for %s", file_path.name)
                         if result.get("jira_tickets"):
-                            logger.info(f"🎫 Created Jira tickets: {', '.join(result['jira_tickets'])}")
+                            logger.info("🎫 Created Jira tickets: %s", ', '.join(result['jira_tickets']))
                     else:
-                        logger.error(f"❌ Processing failed: {result.get('error', 'Unknown error')}")
+                        logger.error("❌ Processing failed: %s", result.get('error', 'Unknown error'))
+            
+            # Collect finished background Groq batches (rate-limited inside)
+            get_llm_client().poll_background_batches()
             
             # Wait before next poll
             time.sleep(poll_interval)
             
         except Exception as e:
-            logger.error(f"❌ Watcher error: {e}")
+            logger.error("❌ Watcher error: %s", e)
             time.sleep(poll_interval)
     
     logger.info("🛑 Watcher stopped")
@@ -654,7 +655,7 @@ def start_watcher(poll_interval: int = 5) -> bool:
     _watcher_thread = Thread(target=_watcher_loop, args=(poll_interval,), daemon=True)
     _watcher_thread.start()
     
-    logger.info(f"✅ File watcher started (poll interval: {poll_interval}s)")
+    logger.info("✅ File watcher started (poll interval: %ss)", poll_interval)
     return True
 
 
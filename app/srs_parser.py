@@ -6,7 +6,6 @@ Maps SRS sections to Confluence pages and generates Jira tasks.
 import re
 from typing import Dict, List, Optional, Any, TYPE_CHECKING
 from dataclasses import dataclass, field
-from io import BytesIO
 
 from docx import Document
 
@@ -124,20 +123,20 @@ class SRSParser:
         self.section_mapping = SRS_SECTION_MAPPING
         self.team_members = TEAM_MEMBERS
     
-    def parse_document(self, file_content: bytes) -> ParsedSRS:
+    def parse_document(self, file_path: str) -> ParsedSRS:
         """
         Parse a Word document and extract SRS sections.
         
         Args:
-            file_content: Raw bytes of the Word document
+            file_path: Path to the Word document on disk
             
         Returns:
             ParsedSRS object with extracted sections
         """
         logger.info("Starting SRS document parsing...")
         
-        # Load document from bytes
-        doc = Document(BytesIO(file_content))
+        # Load document straight from disk (no in-memory copy of the upload)
+        doc = Document(file_path)
         
         # Extract document title
         doc_title = self._extract_document_title(doc)
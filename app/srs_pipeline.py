@@ -28,7 +28,7 @@ class SRSState(TypedDict):
     """State object passed through the SRS processing workflow."""
     # Input data
     filename: str
-    file_content: bytes
+    file_path: str
     project_name: Optional[str]
     
     # Parsed data
@@ -69,13 +69,13 @@ def parse_srs_document(state: SRSState) -> SRSState:
     
     try:
         parser = get_srs_parser()
-        file_content = state.get("file_content")
+        file_path = state.get("file_path")
         
-        if not file_content:
-            raise ValueError("No file content provided")
+        if not file_path:
+            raise ValueError("No file path provided")
         
         # Parse the document
-        parsed = parser.parse_document(file_content)
+        parsed = parser.parse_document(file_path)
         
         state["document_title"] = parsed.document_title
         state["raw_text"] = parsed.raw_text
@@ -221,18 +221,20 @@ def create_confluence_pages(state: SRSState) -> SRSState:
         
         created_pages = []
         
-        for page_type, page_sections in page_groups.items():
-            # Build combined content for all sections of this type
-            html_content = _build_srs_page_html(page_type, page_sections, project_name)
-            
-            # Create page title
+        # Build combined content for all sections of each type
+        page_types = list(page_groups)
+        pages = []
+        for page_type in page_types:
             page_title = f"{project_name} - {page_type}"
-            
             logger.info(f"Creating Confluence page: {page_title}")
-            
-            # Use the confluence client to create/update page
-            result = confluence_client.create_or_update_page(page_title, html_content)
-            
+            pages.append(
+                (page_title, _build_srs_page_html(page_type, page_groups[page_type], project_name))
+            )
+        
+        # Publish all pages concurrently; results come back in input order
+        results = confluence_client.create_or_update_pages(pages)
+        
+        for page_type, result in zip(page_types, results):
             if result and not result.get("fallback"):
                 page_info = {
                     "page_type": page_type,
@@ -485,7 +487,7 @@ srs_workflow = build_srs_workflow().compile()
 
 
 async def process_srs_document(
-    file_content: bytes,
+    file_path: str,
     filename: str,
     project_name: Optional[str] = None
 ) -> Dict[str, Any]:
@@ -493,7 +495,7 @@ async def process_srs_document(
     Process an SRS document through the complete workflow.
     
     Args:
-        file_content: Raw bytes of the Word document
+        file_path: Path to the Word document on disk
         filename: Original filename
         project_name: Optional project name override
         
@@ -506,7 +508,7 @@ async def process_srs_document(
     # Initialize state
     initial_state: SRSState = {
         "filename": filename,
-        "file_content": file_content,
+        "file_path": file_path,
         "project_name": project_name,
         "document_title": None,
         "sections": [],
@@ -6,10 +6,19 @@ import re
 from typing import Optional, List, Dict, Any
 from datetime import date
 
+from app import json_utils
 from app.date_utils import parse_due_date, format_date_iso, get_default_deadline
 from app.member_matching import get_member_name
 from app.logger import get_logger
 
+# Optional: hyperscan lets the fallback find candidate patterns in one pass
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    hyperscan = None  # type: ignore
+    HYPERSCAN_AVAILABLE = False
+
 logger = get_logger(__name__)
 
 
@@ -34,6 +43,15 @@ TASK_SCHEMA = {
 }
 
 
+# Body of the first markdown code fence (```json or bare ```); an unclosed
+# fence runs to the end of the text
+_FENCE_RE = re.compile(r'```(?:json)?(.*?)(?:```|\Z)', re.DOTALL)
+
+# JSON repair patterns for parse_json_safely, compiled once at import
+_TRAILING_COMMA_RE = re.compile(r',\s*(?=[}\]])')
+_JSON_ARRAY_RE = re.compile(r'\[\s*\{.*?\}\s*\]', re.DOTALL)
+
+
 def clean_json_response(response_text: str) -> str:
     """
     Clean LLM response to extract valid JSON.
@@ -47,19 +65,9 @@ def clean_json_response(response_text: str) -> str:
     if not response_text:
         return '{"tasks": []}'
     
-    text = response_text.strip()
-    
     # Remove markdown code blocks
-    if '```json' in text:
-        text = text.split('```json', 1)[1]
-        if '```' in text:
-            text = text.split('```', 1)[0]
-    elif '```' in text:
-        parts = text.split('```')
-        if len(parts) >= 2:
-            text = parts[1]
-    
-    text = text.strip()
+    match = _FENCE_RE.search(response_text)
+    text = (match.group(1) if match else response_text).strip()
     
     # Find JSON object boundaries
     start_idx = text.find('{')
@@ -88,7 +96,7 @@ def parse_json_safely(json_text: str) -> Optional[Dict[str, Any]]:
     
     # Strategy 1: Direct parse
     try:
-        return json.loads(text)
+        return json_utils.loads(text)
     except json.JSONDecodeError:
         pass
     
@@ -96,85 +104,139 @@ def parse_json_safely(json_text: str) -> Optional[Dict[str, Any]]:
     # Replace single quotes with double quotes
     fixed = text.replace("'", '"')
     try:
-        return json.loads(fixed)
+        return json_utils.loads(fixed)
     except json.JSONDecodeError:
         pass
     
     # Strategy 3: Fix trailing commas
-    fixed = re.sub(r',\s*}', '}', text)
-    fixed = re.sub(r',\s*]', ']', fixed)
+    fixed = _TRAILING_COMMA_RE.sub('', text)
     try:
-        return json.loads(fixed)
+        return json_utils.loads(fixed)
     except json.JSONDecodeError:
         pass
     
     # Strategy 4: Extract array if tasks property missing
-    array_match = re.search(r'\[\s*\{.*?\}\s*\]', text, re.DOTALL)
+    array_match = _JSON_ARRAY_RE.search(text)
     if array_match:
         try:
-            tasks = json.loads(array_match.group())
+            tasks = json_utils.loads(array_match.group())
             return {"tasks": tasks}
         except json.JSONDecodeError:
             pass
     
-    logger.debug(f"All JSON parsing strategies failed for: {text[:100]}...")
+    logger.debug("All JSON parsing strategies failed for: %.100s...", text)
     return None
 
 
-def extract_tasks_from_text_fallback(text: str) -> List[Dict[str, Any]]:
-    """
-    Extract tasks using regex patterns when JSON parsing fails.
-    Looks for patterns like:
-    - "X will do Y by Z"
-    - "X is assigned to Y"
-    - "Task: Y - Assignee: X"
-    
-    Args:
-        text: Text to extract tasks from (transcript or summary)
-        
-    Returns:
-        List of extracted tasks
-    """
-    tasks = []
-    
-    # Pattern 1: "X will/should/needs to [do] Y [by Z]"
-    pattern1 = re.compile(
+# Regex fallback patterns, compiled once at import
+_TASK_PATTERNS = [
+    # "X will/should/needs to [do] Y [by Z]"
+    re.compile(
         r'(?P<assignee>\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+'
         r'(?:will|should|needs?\s+to|is\s+going\s+to|must)\s+'
         r'(?:do\s+)?(?P<task>[^.!?]+?)(?:\s+by\s+(?P<date>[^.!?]+))?[.!?]',
         re.IGNORECASE
-    )
-    
-    # Pattern 2: "Y is assigned to X"
-    pattern2 = re.compile(
+    ),
+    # "Y is assigned to X"
+    re.compile(
         r'(?P<task>[^.!?]+?)\s+is\s+assigned\s+to\s+'
         r'(?P<assignee>\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
         re.IGNORECASE
-    )
-    
-    # Pattern 3: "Action item: X to do Y"
-    pattern3 = re.compile(
+    ),
+    # "Action item: X to do Y"
+    re.compile(
         r'(?:action\s+item|task)[:\s]+(?P<assignee>[A-Za-z]+(?:\s+[A-Za-z]+)*)\s+'
         r'(?:to\s+)?(?P<task>[^.!?]+)',
         re.IGNORECASE
-    )
-    
-    # Pattern 4: Simple "X should work on Y"
-    pattern4 = re.compile(
+    ),
+    # Simple "X should work on Y"
+    re.compile(
         r'(?P<assignee>\b[A-Z][a-z]+)\s+'
         r'(?:should|could|can)\s+'
         r'(?:work\s+on|handle|complete|start|begin|finish)\s+'
         r'(?P<task>[^.!?,]+)',
         re.IGNORECASE
+    ),
+]
+
+# Trigger phrase for each entry in _TASK_PATTERNS. A pattern can only match
+# text containing its trigger; triggers may be looser than the pattern. Hyperscan
+# has no capture groups, so it picks which patterns to run rather than
+# extracting the fields.
+_TASK_TRIGGERS = [
+    rb'(?:will|should|needs?\s+to|is\s+going\s+to|must)\s',
+    rb'\sis\s+assigned\s+to\s',
+    rb'(?:action\s+item|task)[:\s]',
+    rb'(?:should|could|can)\s+(?:work\s+on|handle|complete|start|begin|finish)\s',
+]
+
+
+def _build_trigger_db():
+    """Compile the trigger phrases into a hyperscan block-mode database."""
+    db = hyperscan.Database()
+    db.compile(
+        expressions=_TASK_TRIGGERS,
+        ids=list(range(len(_TASK_TRIGGERS))),
+        flags=[
+            hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+            | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+        ] * len(_TASK_TRIGGERS),
     )
+    return db
+
+
+_TRIGGER_DB = _build_trigger_db() if HYPERSCAN_AVAILABLE else None
+
+
+def _candidate_patterns(text: str) -> List["re.Pattern[str]"]:
+    """
+    Return the fallback patterns worth running over text.
+    
+    With hyperscan installed, all trigger phrases are scanned in a single
+    pass and only patterns whose trigger occurs are returned, in order;
+    the scan stops as soon as every trigger has been seen. Without it,
+    every pattern is a candidate.
+    """
+    if _TRIGGER_DB is None:
+        return _TASK_PATTERNS
     
+    hits: set = set()
+    
+    def on_match(pattern_id, start, end, flags, context):
+        hits.add(pattern_id)
+        # A truthy return halts the scan; nothing more can change the result
+        return len(hits) == len(_TASK_TRIGGERS)
+    
+    try:
+        _TRIGGER_DB.scan(text.encode("utf-8"), match_event_handler=on_match)
+    except hyperscan.ScanTerminated:
+        pass
+    return [pattern for i, pattern in enumerate(_TASK_PATTERNS) if i in hits]
+
+
+def extract_tasks_from_text_fallback(text: str) -> List[Dict[str, Any]]:
+    """
+    Extract tasks using regex patterns when JSON parsing fails.
+    Looks for patterns like:
+    - "X will do Y by Z"
+    - "X is assigned to Y"
+    - "Task: Y - Assignee: X"
+    
+    Args:
+        text: Text to extract tasks from (transcript or summary)
+        
+    Returns:
+        List of extracted tasks
+    """
+    tasks = []
     seen_tasks = set()
     
-    for pattern in [pattern1, pattern2, pattern3, pattern4]:
+    for pattern in _candidate_patterns(text):
         for match in pattern.finditer(text):
-            task_desc = match.group('task').strip() if 'task' in match.groupdict() else ""
-            assignee = match.group('assignee').strip() if 'assignee' in match.groupdict() else None
-            due_date = match.group('date').strip() if 'date' in match.groupdict() and match.group('date') else None
+            groups = match.groupdict()
+            task_desc = (groups.get('task') or "").strip()
+            assignee = groups['assignee'].strip() if groups.get('assignee') else None
+            due_date = groups['date'].strip() if groups.get('date') else None
             
             if task_desc and task_desc not in seen_tasks:
                 # Avoid duplicate tasks
@@ -186,7 +248,7 @@ def extract_tasks_from_text_fallback(text: str) -> List[Dict[str, Any]]:
                     "due_date": due_date
                 }
                 tasks.append(task)
-                logger.debug(f"Regex extracted task: {task}")
+                logger.debug("Regex extracted task: %s", task)
     
     return tasks
 
@@ -260,7 +322,7 @@ def safe_extract_tasks(
             if isinstance(raw_tasks, list) and raw_tasks:
                 tasks = [validate_and_normalize_task(t) for t in raw_tasks if isinstance(t, dict)]
                 extraction_method = "json"
-                logger.info(f"Extracted {len(tasks)} tasks via JSON parsing")
+                logger.info("Extracted %d tasks via JSON parsing", len(tasks))
     
     # Strategy 2: Regex fallback on transcript/summary
     if not tasks:
@@ -278,13 +340,13 @@ def safe_extract_tasks(
         
         if tasks:
             tasks = [validate_and_normalize_task(t) for t in tasks]
-            logger.info(f"Extracted {len(tasks)} tasks via regex ({extraction_method})")
+            logger.info("Extracted %d tasks via regex (%s)", len(tasks), extraction_method)
     
     # Filter out invalid tasks
     valid_tasks = [t for t in tasks if t.get("description") and len(t["description"]) > 3]
     
     if len(valid_tasks) < len(tasks):
-        logger.debug(f"Filtered out {len(tasks) - len(valid_tasks)} invalid tasks")
+        logger.debug("Filtered out %d invalid tasks", len(tasks) - len(valid_tasks))
     
     return {
         "tasks": valid_tasks,
@@ -5,15 +5,26 @@ SECRET_KEY = "CHANGE_THIS_SECRET"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# Built once at import instead of on every decode
+ALGORITHMS = (ALGORITHM,)
+DECODE_OPTIONS = {"verify_signature": True, "require_exp": True, "require_sub": True}
+_SECRET_KEY_BYTES = SECRET_KEY.encode()
+
 def create_access_token(data: dict):
     payload = data.copy()
     expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     payload.update({"exp": expire})
-    return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
+    return jwt.encode(payload, _SECRET_KEY_BYTES, algorithm=ALGORITHM)
 
 def decode_access_token(token: str):
+    # A compact JWS always has three segments; skip the decode (and the
+    # exception it would raise) for anything else
+    if token.count(".") != 2:
+        return None
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(
+            token, _SECRET_KEY_BYTES, algorithms=ALGORITHMS, options=DECODE_OPTIONS
+        )
         return payload
     except JWTError:
         return None
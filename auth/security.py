@@ -1,10 +1,51 @@
+import time
+from typing import Optional
+
+from argon2 import PasswordHasher, Type
+from argon2.exceptions import InvalidHashError, VerificationError
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.config import settings
+
+ph = PasswordHasher(
+    time_cost=settings.argon2_time_cost,
+    memory_cost=settings.argon2_memory_kib,
+    parallelism=settings.argon2_parallelism,
+    type=Type.ID,
+)
+
+# Legacy bcrypt hashes are still verified so existing users can log in and be
+# migrated to Argon2id on their next successful login.
+legacy_pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# Verified against when the user does not exist, so unknown usernames cost
+# the same as a wrong password and can't be enumerated by timing.
+_DUMMY_HASH = ph.hash("dummy-password-for-timing")
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return ph.hash(password)
+
+def verify_password(plain_password: str, hashed_password: Optional[str]) -> bool:
+    if hashed_password is None:
+        try:
+            ph.verify(_DUMMY_HASH, plain_password)
+        except (VerificationError, InvalidHashError):
+            pass
+        return False
+    if not hashed_password.startswith("$argon2"):
+        return legacy_pwd_context.verify(plain_password, hashed_password)
+    try:
+        return ph.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+def needs_rehash(hashed_password: str) -> bool:
+    if not hashed_password.startswith("$argon2"):
+        return True
+    return ph.check_needs_rehash(hashed_password)
 
+def benchmark_hash() -> float:
+    """Hash a throwaway password once and return the elapsed time in ms."""
+    start = time.perf_counter()
+    ph.hash("benchmark")
+    return (time.perf_counter() - start) * 1000
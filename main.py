@@ -1,7 +1,11 @@
+import asyncio
 from contextlib import asynccontextmanager
 from datetime import date, datetime, timedelta
-from typing import List, Optional
+from typing import List, Optional, Set
 import json
+import os
+
+import anyio
 
 from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Query
 from fastapi.middleware.cors import CORSMiddleware
@@ -17,6 +21,7 @@ from db.session import engine
 print("imported engine")
 from models.user import User
 print("imported user model")
+from auth.security import benchmark_hash
 
 # Import recording processing modules
 from app.config import settings
@@ -39,7 +44,8 @@ from app.recording_watcher import (
     get_watcher_status
 )
 from app.transcriber import transcribe_file, is_transcriber_ready
-from app.jira_client import get_jira_client
+from app.confluence_client import get_confluence_client, close_confluence_client
+from app.jira_client import get_jira_client, close_jira_client
 from app.llm import get_llm_client
 from app.pipeline import process_meeting, process_recording
 from app.logger import setup_logging, get_logger
@@ -210,33 +216,79 @@ class NLTaskAssignResponse(BaseModel):
     raw_input: str
 
 
+# Startup warmups running in the default executor, kept referenced until done
+_warmup_futures: Set[asyncio.Future] = set()
+
+
+def _start_warmup(name: str, warmup) -> None:
+    """Run a client's warmup in the background, logging it if it fails."""
+    future = asyncio.get_running_loop().run_in_executor(None, warmup)
+    _warmup_futures.add(future)
+    
+    def _done(fut: asyncio.Future) -> None:
+        _warmup_futures.discard(fut)
+        if not fut.cancelled() and fut.exception() is not None:
+            logger.warning("%s warmup failed: %s", name, fut.exception())
+    
+    future.add_done_callback(_done)
+
+
 @asynccontextmanager
 async def app_lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown."""
     # Startup
     logger.info("Starting application...")
     
+    # Let password hashing (run via anyio.to_thread) use every CPU core
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = max(limiter.total_tokens, os.cpu_count() or 1)
+    
+    # Surface mis-tuned Argon2 parameters before they hit login latency
+    hash_ms = await anyio.to_thread.run_sync(benchmark_hash)
+    logger.info(
+        "Argon2id hash took %.0f ms (m=%d KiB, t=%d, p=%d)",
+        hash_ms,
+        settings.argon2_memory_kib,
+        settings.argon2_time_cost,
+        settings.argon2_parallelism
+    )
+    if hash_ms > 1000:
+        logger.warning("Argon2id hashing is slow (%.0f ms); consider lowering its cost", hash_ms)
+    
     try:
         # Initialize database tables (existing)
-        Base.metadata.create_all(bind=engine)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
         print("Database tables created successfully.")
         
         # Initialize recording processing tables
         init_db()
         logger.info("Recording processing database tables initialized")
         
+        # Build the Jira and Confluence clients now so the first request
+        # doesn't pay for them, and warm their connections (Jira project
+        # metadata, Confluence space access) without blocking startup
+        jira_client = get_jira_client()
+        confluence_client = get_confluence_client()
+        if settings.app_env != "test":
+            _start_warmup("Jira", jira_client.warmup)
+            _start_warmup("Confluence", confluence_client.warmup)
+        
         # Start the scheduler for recording folder polling
         if settings.app_env != "test":
             start_scheduler()
             logger.info("Recording polling scheduler started")
     except Exception as e:
-        logger.error(f"Error during startup: {e}")
+        logger.error("Error during startup: %s", e)
     
     yield
     
     # Shutdown
     logger.info("Shutting down application...")
     stop_scheduler()
+    close_confluence_client()
+    close_jira_client()
+    await engine.dispose()
     logger.info("Application shutdown complete")
 
 
@@ -477,7 +529,7 @@ def create_app() -> FastAPI:
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error processing recording: {e}")
+            logger.error("Error processing recording: %s", e)
             raise HTTPException(status_code=500, detail=str(e))
     
     @app.delete("/api/recordings/meetings/{meeting_id}", tags=["Recording Processing"])
@@ -604,7 +656,7 @@ def create_app() -> FastAPI:
                     f"- [{c['sha']}] {c['message']}" for c in dev_commits[:20]
                 ]
             except Exception as exc:
-                logger.warning(f"Could not fetch GitHub commits for developer: {exc}")
+                logger.warning("Could not fetch GitHub commits for developer: %s", exc)
 
         # Build LLM summary
         summary_text = f"{member.member_name} has {len(tasks)} task(s) and {github_commits_count} recent commit(s)."
@@ -620,9 +672,9 @@ def create_app() -> FastAPI:
                     f"Write a concise 2-3 sentence developer summary covering workload, "
                     f"recent contributions, and any observations."
                 )
-                summary_text = llm_client.summarize_meeting(prompt)
+                summary_text = await llm_client.asummarize_meeting(prompt)
             except Exception as exc:
-                logger.warning(f"LLM summary failed for developer: {exc}")
+                logger.warning("LLM summary failed for developer: %s", exc)
 
         return DeveloperSummaryResponse(
             developer_id=developer_id,
@@ -656,8 +708,6 @@ def create_app() -> FastAPI:
         member_names = [m.member_name for m in members]
 
         # Use LLM to parse the NL text
-        from langchain_core.messages import HumanMessage as HM, SystemMessage as SM
-
         today_str = date.today().isoformat()
         system_prompt = (
             "You are a task parser. Given a natural language instruction and a list of team members, "
@@ -671,10 +721,7 @@ def create_app() -> FastAPI:
         user_prompt = f"Instruction: {request.text}\n\nJSON:"
 
         try:
-            messages = [SM(content=system_prompt), HM(content=user_prompt)]
-            response = llm_client._llm.invoke(messages)
-            raw_text = response.content if isinstance(response.content, str) else str(response.content)
-            raw_text = raw_text.strip()
+            raw_text = await llm_client._ainvoke(system_prompt, user_prompt, json_mode=True)
 
             # Parse JSON
             parsed = llm_client._parse_json_response(raw_text)
@@ -684,7 +731,7 @@ def create_app() -> FastAPI:
             deadline_str = parsed.get("deadline", (date.today() + timedelta(days=7)).isoformat())
 
         except Exception as exc:
-            logger.warning(f"LLM parse failed, using fallback: {exc}")
+            logger.warning("LLM parse failed, using fallback: %s", exc)
             assignee_name = "Unassigned"
             description = request.text
             deadline_str = (date.today() + timedelta(days=7)).isoformat()
@@ -779,7 +826,7 @@ def create_app() -> FastAPI:
         try:
             return gh.get_commit_detail(sha)
         except Exception as exc:
-            logger.exception(f"Error fetching commit {sha}")
+            logger.exception("Error fetching commit %s", sha)
             raise HTTPException(status_code=502, detail=str(exc))
 
     @app.get("/api/github/commits/{sha}/summary", tags=["GitHub Commit Tracking"])
@@ -795,7 +842,7 @@ def create_app() -> FastAPI:
                 "summary": summary,
             }
         except Exception as exc:
-            logger.exception(f"Error summarizing commit {sha}")
+            logger.exception("Error summarizing commit %s", sha)
             raise HTTPException(status_code=502, detail=str(exc))
 
     @app.get("/api/github/commits-summary", tags=["GitHub Commit Tracking"])
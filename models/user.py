@@ -6,6 +6,6 @@ class User(Base):
     __tablename__ = "members"
 
     member_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    member_name = Column(String(120), nullable=False, index=True)
+    member_name = Column(String(120), nullable=False, unique=True, index=True)
     designation = Column(String(100), nullable=False)
     password = Column(String(120), nullable=False)
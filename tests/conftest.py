@@ -0,0 +1,9 @@
+"""Shared pytest configuration."""
+
+import os
+
+# test_recording.py is a manual end-to-end script, not a pytest module
+collect_ignore = ["test_recording.py"]
+
+# Use an in-memory database rather than the configured PostgreSQL server
+os.environ.setdefault("DATABASE_URL", "sqlite://")
@@ -0,0 +1,140 @@
+"""Tests for the /auth routes."""
+
+import hashlib
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from jose import jwt
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from api.routes import auth as auth_routes
+from auth.jwt_handler import ALGORITHM, SECRET_KEY, create_access_token
+from auth.security import hash_password, legacy_pwd_context
+from db.base import Base
+from db.deps import get_db
+from models.user import User
+
+
+@pytest.fixture
+def database_url(tmp_path):
+    path = tmp_path / "auth.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine, tables=[User.__table__])
+    engine.dispose()
+    return path
+
+
+def add_user(database_path, name, password_hash, designation="Developer"):
+    engine = create_engine(f"sqlite:///{database_path}")
+    with Session(engine) as db:
+        db.add(User(member_name=name, designation=designation, password=password_hash))
+        db.commit()
+    engine.dispose()
+
+
+def stored_password(database_path, name):
+    engine = create_engine(f"sqlite:///{database_path}")
+    with Session(engine) as db:
+        password = db.query(User.password).filter(User.member_name == name).scalar()
+    engine.dispose()
+    return password
+
+
+@pytest.fixture
+def client(database_url):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{database_url}", poolclass=NullPool)
+    sessions = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def override_get_db():
+        async with sessions() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(auth_routes.router)
+    app.dependency_overrides[get_db] = override_get_db
+    auth_routes._current_user_cache.clear()
+    with TestClient(app) as test_client:
+        yield test_client
+    auth_routes._current_user_cache.clear()
+
+
+def me(client, token):
+    return client.get("/auth/me", headers={"Authorization": f"Bearer {token}"})
+
+
+def test_me_caches_each_token_separately(client, database_url):
+    add_user(database_url, "alice", hash_password("pw-alice"), "Lead")
+    add_user(database_url, "bob", hash_password("pw-bob"))
+
+    alice = create_access_token({"sub": "alice"})
+    bob = create_access_token({"sub": "bob"})
+
+    assert me(client, alice).json()["member_name"] == "alice"
+    assert me(client, bob).json()["member_name"] == "bob"
+    assert len(auth_routes._current_user_cache) == 2
+    # Served from cache on the second call, still per token
+    assert me(client, alice).json()["member_name"] == "alice"
+    assert me(client, bob).json()["member_name"] == "bob"
+
+
+def test_me_does_not_serve_an_expired_token_from_cache(client, database_url):
+    add_user(database_url, "alice", hash_password("pw-alice"))
+    expired_at = int(time.time()) - 5
+    token = jwt.encode({"sub": "alice", "exp": expired_at}, SECRET_KEY, algorithm=ALGORITHM)
+
+    # An entry left over from before the token expired
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    auth_routes._current_user_cache[key] = (
+        expired_at,
+        {"member_id": 1, "member_name": "alice", "designation": "Developer"},
+    )
+
+    assert me(client, token).status_code == 401
+
+
+def login(client, username, password):
+    return client.post("/auth/token", data={"username": username, "password": password})
+
+
+def test_login_unknown_user_verifies_dummy_hash_and_returns_401(client, monkeypatch):
+    verified = []
+    verify_password = auth_routes.verify_password
+
+    def recording_verify(plain, hashed):
+        verified.append(hashed)
+        return verify_password(plain, hashed)
+
+    monkeypatch.setattr(auth_routes, "verify_password", recording_verify)
+
+    response = login(client, "nobody", "whatever")
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Invalid credentials"
+    # The password is still checked (against the dummy hash) for a missing user
+    assert verified == [None]
+
+
+def test_login_wrong_password_returns_same_401(client, database_url):
+    add_user(database_url, "alice", hash_password("pw-alice"))
+
+    response = login(client, "alice", "wrong")
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Invalid credentials"
+
+
+def test_login_migrates_legacy_bcrypt_hash_to_argon2(client, database_url):
+    add_user(database_url, "carol", legacy_pwd_context.hash("pw-carol"))
+
+    response = login(client, "carol", "pw-carol")
+
+    assert response.status_code == 200
+    assert response.json()["member_name"] == "carol"
+    assert stored_password(database_url, "carol").startswith("$argon2id$")
+    # The new hash still accepts the same password
+    assert login(client, "carol", "pw-carol").status_code == 200
@@ -0,0 +1,120 @@
+"""Tests for app.confluence_client."""
+
+from types import SimpleNamespace
+
+import requests
+from cachetools import TTLCache
+
+from app.confluence_client import ConfluenceClient, _safe_confluence_request
+
+
+class _Session:
+    """Stand-in session that answers every request with one canned response."""
+
+    def __init__(self, status, body, headers=None):
+        self.response = requests.Response()
+        self.response.status_code = status
+        self.response._content = body
+        self.response.headers.update({"Content-Type": "application/json", **(headers or {})})
+
+    def request(self, method, url, **kwargs):
+        return self.response
+
+
+def test_json_429_without_status_code_is_rate_limited():
+    session = _Session(429, b'{"message": "Too many requests"}', {"Retry-After": "7"})
+
+    data = _safe_confluence_request("GET", "https://example/wiki/rest/api/content", session=session)
+
+    assert data["fallback"] is True
+    assert data["status_code"] == 429
+    assert data["retry_after"] == 7.0
+
+
+def test_json_error_body_status_code_still_classified():
+    session = _Session(200, b'{"statusCode": 404, "message": "No space"}')
+
+    data = _safe_confluence_request("GET", "https://example/wiki/rest/api/space/X", session=session)
+
+    assert data["status_code"] == 404
+
+
+def test_successful_json_is_returned_as_is():
+    session = _Session(200, b'{"results": []}')
+
+    assert _safe_confluence_request("GET", "https://example", session=session) == {"results": []}
+
+
+def test_retry_after_is_capped():
+    def state(retry_after, attempt=1):
+        outcome = SimpleNamespace(result=lambda: {"status_code": 429, "retry_after": retry_after})
+        return SimpleNamespace(outcome=outcome, attempt_number=attempt)
+
+    assert ConfluenceClient._rate_limit_wait(state(3600.0)) == ConfluenceClient.MAX_RETRY_AFTER
+    assert ConfluenceClient._rate_limit_wait(state(5.0)) == 5.0
+    assert ConfluenceClient._rate_limit_wait(state(None, attempt=2)) == 4
+
+
+def _configured_client(monkeypatch, responses):
+    client = ConfluenceClient()
+    client.base_url, client.email, client.api_token, client.space_key = (
+        "https://example/wiki", "me@example.com", "token", "SPACE"
+    )
+    client.auth = (client.email, client.api_token)
+    calls = []
+
+    def safe_request(method, path, **kwargs):
+        calls.append((method, path, kwargs.get("headers")))
+        return responses.pop(0)
+
+    monkeypatch.setattr(client, "_safe_request", safe_request)
+    return client, calls
+
+
+def test_title_cache_is_bounded_and_expires(monkeypatch):
+    client, calls = _configured_client(monkeypatch, [{"results": [{"id": "1"}]}, {"results": [{"id": "2"}]}])
+    now = [0.0]
+    client._title_cache = TTLCache(maxsize=client.CACHE_SIZE, ttl=client.CACHE_TTL, timer=lambda: now[0])
+
+    assert client.find_page_by_title("Notes") == "1"
+    assert client.find_page_by_title("Notes") == "1"
+    assert len(calls) == 1
+
+    now[0] += client.CACHE_TTL + 1
+    assert client.find_page_by_title("Notes") == "2"
+    assert len(client._title_cache) == 1
+    assert client._title_cache.maxsize == client.CACHE_SIZE
+
+
+def test_stale_page_version_is_revalidated_with_its_etag(monkeypatch):
+    client, calls = _configured_client(monkeypatch, [
+        {"version": {"number": 4}, "title": "Notes", "_etag": '"v4"'},
+        {"not_modified": True, "status_code": 304},
+    ])
+
+    assert client._get_page_version("1") == 4
+    assert client._get_page_version("1") == 4
+    assert len(calls) == 1
+
+    # Past CACHE_TTL the entry is stale but still held for revalidation
+    version, title, _, etag = client._page_meta_cache["1"]
+    client._page_meta_cache["1"] = (version, title, -client.CACHE_TTL, etag)
+    assert client._get_page_version("1") == 4
+    assert calls[-1][2] == {"If-None-Match": '"v4"'}
+
+
+def test_warmup_verifies_space_before_first_publish(monkeypatch):
+    client, calls = _configured_client(monkeypatch, [{"name": "Space"}, {"id": "9"}])
+
+    client.warmup()
+    assert [path for _, path, _ in calls] == ["/space/SPACE"]
+    assert client.create_page("Notes", "<p>hi</p>")["page_id"] == "9"
+    assert [path for _, path, _ in calls] == ["/space/SPACE", "/content"]
+
+
+def test_create_page_verifies_space_lazily_without_warmup(monkeypatch):
+    client, calls = _configured_client(monkeypatch, [{"name": "Space"}, {"id": "9"}, {"id": "10"}])
+
+    client.create_page("Notes", "<p>hi</p>")
+    client.create_page("Other", "<p>hi</p>")
+    assert [path for _, path, _ in calls] == ["/space/SPACE", "/content", "/content"]
@@ -0,0 +1,63 @@
+"""Tests for app.date_utils."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.date_utils import parse_due_date
+
+# The strptime formats parse_due_date's regex fast path replaces, in order
+STRPTIME_FORMATS = [
+    '%Y-%m-%d',
+    '%d/%m/%Y',
+    '%m/%d/%Y',
+    '%d-%m-%Y',
+    '%B %d, %Y',
+    '%b %d, %Y',
+    '%d %B %Y',
+    '%d %b %Y',
+]
+
+
+def strptime_date(text):
+    for fmt in STRPTIME_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+@pytest.mark.parametrize("text", [
+    "2026-02-22",
+    "2026-2-5",
+    "2024-02-29",
+    "05/03/2026",
+    "5/3/2026",
+    "12/25/2026",
+    "31/12/2026",
+    "07-08-2026",
+    "March 5, 2026",
+    "Mar 5, 2026",
+    "5 March 2026",
+    "5 Mar 2026",
+    " 2026-02-22 ",
+])
+def test_fast_path_matches_strptime(text):
+    expected = strptime_date(text.strip())
+    assert expected is not None
+    assert parse_due_date(text) == expected
+
+
+@pytest.mark.parametrize("text, offset", [
+    ("today", 0),
+    ("Tomorrow", 1),
+    ("yesterday", -1),
+])
+def test_literal_days(text, offset):
+    assert parse_due_date(text) == date.today() + timedelta(days=offset)
+
+
+@pytest.mark.parametrize("text", [None, "", "null", "None", "N/A", "unspecified"])
+def test_empty_values(text):
+    assert parse_due_date(text) is None
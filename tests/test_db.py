@@ -0,0 +1,22 @@
+"""Tests for app.db."""
+
+import pytest
+
+from app.db import ScopedSession, get_db_session
+
+
+def test_nested_session_blocks_are_rejected():
+    with get_db_session() as outer:
+        with pytest.raises(RuntimeError):
+            with get_db_session():
+                pass
+        assert ScopedSession() is outer
+    assert not ScopedSession.registry.has()
+
+
+def test_sequential_session_blocks_get_fresh_sessions():
+    with get_db_session() as first:
+        pass
+    with get_db_session() as second:
+        pass
+    assert first is not second
@@ -0,0 +1,175 @@
+"""Tests for app.jira_client."""
+
+import threading
+
+import pytest
+from cachetools import TTLCache
+
+from app.jira_client import JiraClient, clear_team_member_cache, find_closest_team_member
+
+
+@pytest.fixture(autouse=True)
+def fresh_team_member_cache():
+    clear_team_member_cache()
+    yield
+    clear_team_member_cache()
+
+
+@pytest.mark.parametrize("name, member", [
+    ("Nikhil", "Nikhil J Prasad"),
+    ("  nikhil  ", "Nikhil J Prasad"),
+    ("Kailas S S", "Kailas S S"),
+    ("kailass", "Kailas S S"),
+    ("Govind", "S Govind Krishnan"),
+    ("Krishnan Govind", "S Govind Krishnan"),
+    ("Mukundhan", "Mukundan V S"),
+    ("prasad", "Nikhil J Prasad"),
+    ("nikil", "Nikhil J Prasad"),
+    ("Govnd", "S Govind Krishnan"),
+    ("Mukundn", "Mukundan V S"),
+    ("NJP", "Nikhil J Prasad"),
+    ("Kyla", "Kailas S S"),
+])
+def test_matches_team_members(name, member):
+    assert find_closest_team_member(name) == member
+
+
+@pytest.mark.parametrize("name", [
+    "Ravi", "Arjun", "Kumar", "Nair", "Sam", "Anand", "Bob", "Priya", "John Smith", "Nikita",
+])
+def test_non_members_do_not_match(name):
+    assert find_closest_team_member(name) is None
+
+
+@pytest.mark.parametrize("name", ["", "Unassigned", "none", "NULL"])
+def test_placeholders_do_not_match(name):
+    assert find_closest_team_member(name) is None
+
+
+def test_unknown_user_is_searched_again_after_miss_ttl(monkeypatch):
+    client = JiraClient()
+    now = [0.0]
+    client._user_misses = TTLCache(maxsize=8, ttl=client.USER_MISS_TTL, timer=lambda: now[0])
+    searches = []
+    directory = []
+
+    def search_users(query):
+        searches.append(query)
+        return list(directory)
+
+    monkeypatch.setattr(client, "search_users", search_users)
+
+    assert client.get_account_id_by_name("New Hire") is None
+    assert client.get_account_id_by_name("New Hire") is None
+    assert len(searches) == 1
+
+    directory.append({"displayName": "New Hire", "accountId": "acc-1"})
+    now[0] += client.USER_MISS_TTL + 1
+    assert client.get_account_id_by_name("New Hire") == "acc-1"
+    assert client.get_account_id_by_name("New Hire") == "acc-1"
+    assert len(searches) == 2
+
+
+def test_get_issue_returns_copies_of_the_cached_issue(monkeypatch):
+    client = JiraClient()
+    monkeypatch.setattr(client, "_configured", True)
+    calls = []
+
+    class Response:
+        content = b'{"key": "PROJ-1", "fields": {"labels": ["a"]}}'
+
+        def raise_for_status(self):
+            pass
+
+    def get(url, timeout):
+        calls.append(url)
+        return Response()
+
+    monkeypatch.setattr(client._session, "get", get)
+
+    first = client.get_issue("PROJ-1")
+    first["fields"]["labels"].append("mutated")
+    second = client.get_issue("PROJ-1")
+    second["fields"]["labels"].append("again")
+
+    assert client.get_issue("PROJ-1")["fields"]["labels"] == ["a"]
+    assert len(calls) == 1
+
+
+def _recording_client(monkeypatch, configured):
+    client = JiraClient()
+    monkeypatch.setattr(client, "_configured", configured)
+    lookups = []
+
+    def get_account_id_by_name(name):
+        lookups.append((name, threading.current_thread() is threading.main_thread()))
+        return None
+
+    def create_issue(summary, **kwargs):
+        return {"key": f"PROJ-{summary}"}
+
+    monkeypatch.setattr(client, "get_account_id_by_name", get_account_id_by_name)
+    monkeypatch.setattr(client, "create_issue", create_issue)
+    return client, lookups
+
+
+TASKS = [
+    {"title": "1", "assignee": "Nikhil J Prasad"},
+    {"title": "2", "assignee": "Kailas S S"},
+    {"title": "3", "assignee": "Nikhil J Prasad"},
+    {"title": "4"},
+]
+
+
+def test_assignees_are_prefetched_once_each_on_the_pool(monkeypatch):
+    client, lookups = _recording_client(monkeypatch, configured=True)
+
+    assert client.create_issues_from_tasks(TASKS) == ["PROJ-1", "PROJ-2", "PROJ-3", "PROJ-4"]
+    assert sorted(name for name, _ in lookups) == ["Kailas S S", "Nikhil J Prasad"]
+    assert not any(on_main for _, on_main in lookups)
+
+
+def test_unconfigured_client_skips_assignee_prefetch(monkeypatch):
+    client, lookups = _recording_client(monkeypatch, configured=False)
+
+    client.create_issues_from_tasks(TASKS)
+    assert lookups == []
+
+
+def _issue(key, summary, assignee=None):
+    fields = {"summary": summary}
+    if assignee:
+        fields["assignee"] = {"displayName": assignee}
+    return {"key": key, "fields": fields}
+
+
+@pytest.mark.parametrize("summary, expected", [
+    ("Update login page styling", "PROJ-1"),
+    ("Fix the authentication bug in the API", "PROJ-2"),
+    ("Deploy production server", None),
+    ("Create onboarding docs", None),
+])
+def test_find_similar_issue_threshold(monkeypatch, summary, expected):
+    client = JiraClient()
+    monkeypatch.setattr(client, "_configured", True)
+    monkeypatch.setattr(client, "search_issues", lambda jql, max_results=20: [
+        _issue("PROJ-1", "Update the login page styling"),
+        _issue("PROJ-2", "Fix authentication bug in API"),
+        _issue("PROJ-3", "Deploy staging server"),
+        _issue("PROJ-4", "Update API docs"),
+    ])
+
+    match, _ = client.find_similar_issue(summary)
+    assert (match["key"] if match else None) == expected
+
+
+def test_find_similar_issue_assignee_boost(monkeypatch):
+    client = JiraClient()
+    monkeypatch.setattr(client, "_configured", True)
+    monkeypatch.setattr(client, "search_issues", lambda jql, max_results=20: [
+        _issue("PROJ-3", "Deploy staging server", assignee="Kailas S S"),
+    ])
+
+    assert client.find_similar_issue("Deploy production server")[0] is None
+    match, score = client.find_similar_issue("Deploy production server", assignee_name="Kailas")
+    assert match["key"] == "PROJ-3" and score >= 0.8
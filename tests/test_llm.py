@@ -0,0 +1,230 @@
+"""Tests for app.llm.LLMClient."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from tenacity import wait_none
+
+import app.llm as llm_module
+from app.llm import LLMClient
+
+
+TRANSCRIPT = "Bob will update the deployment checklist before Friday. " * 20
+
+
+class _LoopRecordingModel:
+    """Stand-in chat model that records which event loop served each call."""
+
+    def __init__(self):
+        self.loops = []
+
+    def bind(self, **kwargs):
+        return self
+
+    async def ainvoke(self, messages):
+        self.loops.append(asyncio.get_running_loop())
+        return SimpleNamespace(content='{"summary": "Checklist update.", "tasks": []}')
+
+
+def _client(model, monkeypatch):
+    # The message classes come from langchain, which may not be installed
+    monkeypatch.setattr(llm_module, "SystemMessage", SimpleNamespace, raising=False)
+    monkeypatch.setattr(llm_module, "HumanMessage", SimpleNamespace, raising=False)
+    client = LLMClient()
+    client._llm = client._llm_fast = client._json_llm = model
+    return client
+
+
+def test_sync_then_async_calls_share_the_io_loop(monkeypatch):
+    model = _LoopRecordingModel()
+    client = _client(model, monkeypatch)
+
+    summary, tasks = client.summarize_and_extract_tasks(TRANSCRIPT)
+    assert summary == "Checklist update."
+    assert tasks == {"tasks": []}
+
+    async def caller():
+        return await client._ainvoke("system", "another prompt", json_mode=True)
+
+    assert "Checklist update." in asyncio.run(caller())
+
+    assert len(model.loops) == 2
+    assert model.loops[0] is model.loops[1] is llm_module._loop
+
+
+@pytest.mark.parametrize("text", [
+    '{"tasks": [{"title": "Ship it"}]}',
+    '```json\n{"tasks": [{"title": "Ship it"}]}\n```',
+    '```JSON {"tasks": [{"title": "Ship it"}]} ```',
+    '```\n{"tasks": [{"title": "Ship it"}]}\n```',
+    'Here you go:\n```json\n{"tasks": [{"title": "Ship it"}]}\n```\nAnything else?',
+    'Sure! {"tasks": [{"title": "Ship it"}]} Hope that helps.',
+])
+def test_parse_json_response_unwraps_fences_and_prose(text):
+    assert LLMClient()._parse_json_response(text) == {"tasks": [{"title": "Ship it"}]}
+
+
+@pytest.mark.parametrize("text", ["", None, "no json here", "```json\nnot json\n```"])
+def test_parse_json_response_falls_back_to_no_tasks(text):
+    assert LLMClient()._parse_json_response(text) == {"tasks": []}
+
+
+def _batch_client(monkeypatch, statuses):
+    """Client whose Groq batch calls are faked; statuses feed poll_batch in order."""
+    client = _client(_LoopRecordingModel(), monkeypatch)
+    client.BATCH_POLL_INTERVAL = 0.0
+    monkeypatch.setattr(llm_module.settings, "use_batch_api_for_background", True)
+    submitted = []
+
+    def submit(transcripts):
+        submitted.append(list(transcripts))
+        return "batch-1"
+
+    def poll(batch_id):
+        status = statuses.pop(0)
+        if isinstance(status, Exception):
+            raise status
+        return status
+
+    monkeypatch.setattr(client, "submit_batch_analyze", submit)
+    monkeypatch.setattr(client, "poll_batch", poll)
+    return client, submitted
+
+
+def test_background_batch_results_land_in_the_analysis_cache(monkeypatch):
+    done = {"summary": "From batch", "title": "T", "project": None, "tasks": []}
+    client, submitted = _batch_client(monkeypatch, [None, [done, None]])
+    fallback = []
+
+    async def abatch_analyze(transcripts):
+        fallback.extend(transcripts)
+        return []
+
+    monkeypatch.setattr(client, "abatch_analyze", abatch_analyze)
+
+    assert client.queue_background_analyses(["first meeting", "second meeting"]) == "batch-1"
+    assert submitted == [["first meeting", "second meeting"]]
+
+    # Still running: nothing resolved, nothing blocked
+    assert client.poll_background_batches() == 0
+    assert client.poll_background_batches() == 1
+
+    assert client._get_cached_analysis(client._analysis_key("first meeting")) == done
+    assert fallback == ["second meeting"]
+    assert client.poll_background_batches() == 0
+
+
+def test_failed_background_batch_falls_back_to_direct_analysis(monkeypatch):
+    client, _ = _batch_client(monkeypatch, [RuntimeError("Groq batch batch-1 failed")])
+    fallback = []
+
+    async def abatch_analyze(transcripts):
+        fallback.extend(transcripts)
+        return []
+
+    monkeypatch.setattr(client, "abatch_analyze", abatch_analyze)
+
+    client.queue_background_analyses(["a meeting"])
+    assert client.poll_background_batches() == 1
+    assert fallback == ["a meeting"]
+
+
+def test_batched_fallback_respects_the_concurrency_cap(monkeypatch):
+    client = _client(_LoopRecordingModel(), monkeypatch)
+    monkeypatch.setattr(llm_module.settings, "groq_max_concurrency", 2)
+    in_flight, peak = [0], [0]
+
+    async def failing_batch(*args, **kwargs):
+        raise ValueError("malformed batch")
+
+    async def analyze_one(transcript):
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        return {"summary": transcript}
+
+    monkeypatch.setattr(client, "_ainvoke", failing_batch)
+    monkeypatch.setattr(client, "aanalyze_meeting", analyze_one)
+
+    transcripts = [f"meeting {n}" for n in range(12)]
+    results = asyncio.run(client.aanalyze_meetings_batched(transcripts, rows_per_call=2))
+
+    assert [r["summary"] for r in results] == transcripts
+    assert peak[0] <= 2
+
+
+def test_rate_limited_chunk_does_not_cancel_the_others(monkeypatch):
+    client = _client(_LoopRecordingModel(), monkeypatch)
+    monkeypatch.setattr(llm_module, "_RETRYABLE_ERRORS", (TimeoutError,))
+
+    async def batch(system, user, **kwargs):
+        if "limited" in user:
+            raise TimeoutError("429")
+        await asyncio.sleep(0.01)
+        return '{"results": [{"id": 1, "summary": "ok", "tasks": []}]}'
+
+    monkeypatch.setattr(client, "_ainvoke", batch)
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(client.aanalyze_meetings_batched(["limited meeting", "fine meeting"], rows_per_call=1))
+
+    cached = client._get_cached_analysis(client._analysis_key("fine meeting"))
+    assert cached is not None and cached["summary"] == "ok"
+
+
+class _FlakyStreamingModel:
+    """Model whose first stream attempt is rate limited before any chunk."""
+
+    REPLY = ['{"tasks": [{"title": "Ship', ' it", "assignee": "Bob", "due_date": null}', ']}']
+
+    def __init__(self):
+        self.attempts = 0
+
+    def bind(self, **kwargs):
+        return self
+
+    def stream(self, messages):
+        self.attempts += 1
+        if self.attempts == 1:
+            raise TimeoutError("429")
+        for text in self.REPLY:
+            yield SimpleNamespace(content=text)
+
+    async def astream(self, messages):
+        for chunk in self.stream(messages):
+            yield chunk
+
+
+def _streaming_client(monkeypatch):
+    model = _FlakyStreamingModel()
+    client = _client(model, monkeypatch)
+    monkeypatch.setattr(llm_module, "_RETRYABLE_ERRORS", (TimeoutError,))
+    retrying_kwargs = client._retrying_kwargs
+    monkeypatch.setattr(client, "_retrying_kwargs", lambda: {**retrying_kwargs(), "wait": wait_none()})
+    noted = []
+    monkeypatch.setattr(client, "_note_rate_limit", noted.append)
+    return client, model, noted
+
+
+EXPECTED_TASKS = [{"title": "Ship it", "assignee": "Bob", "due_date": None}]
+
+
+def test_task_stream_retries_a_rate_limited_start(monkeypatch):
+    client, model, noted = _streaming_client(monkeypatch)
+
+    assert list(client.iter_extract_tasks(TRANSCRIPT)) == EXPECTED_TASKS
+    assert model.attempts == 2
+    assert len(noted) == 1
+
+
+def test_async_task_stream_retries_a_rate_limited_start(monkeypatch):
+    client, model, noted = _streaming_client(monkeypatch)
+
+    async def collect():
+        return [task async for task in client.aextract_tasks_stream(TRANSCRIPT)]
+
+    assert asyncio.run(collect()) == EXPECTED_TASKS
+    assert model.attempts == 2
+    assert len(noted) == 1
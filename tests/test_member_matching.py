@@ -0,0 +1,45 @@
+"""Tests for app.member_matching."""
+
+import pytest
+
+from app.member_matching import calculate_similarity, match_member_name
+
+
+@pytest.mark.parametrize("name, member", [
+    ("V.S.", "Mukundan V S"),
+    ("Kyla", "Kailas S S"),
+    ("Nikhil Prasad", "Nikhil J Prasad"),
+    ("Govind K", "S Govind Krishnan"),
+    ("Prasad", "Nikhil J Prasad"),
+    ("Kailas S", "Kailas S S"),
+    ("Mukundhan", "Mukundan V S"),
+])
+def test_matches_team_members(name, member):
+    result = match_member_name(name)
+    assert result is not None
+    assert result[0] == member
+
+
+def test_alias_match_scores_one():
+    assert match_member_name("kyla") == ("Kailas S S", 1.0)
+
+
+@pytest.mark.parametrize("name", [
+    "Ravi", "Arjun", "Kumar", "Nair", "Sam", "Anand", "Bob", "Priya", "John Smith",
+])
+def test_non_members_do_not_match(name):
+    assert match_member_name(name) is None
+
+
+@pytest.mark.parametrize("name", ["", "Unassigned", "none", "N/A"])
+def test_placeholders_do_not_match(name):
+    assert match_member_name(name) is None
+
+
+def test_custom_member_list():
+    assert match_member_name("Jane Doe", members=["Jane Doe", "John Roe"]) == ("Jane Doe", 1.0)
+
+
+def test_similarity_ignores_case_and_punctuation():
+    assert calculate_similarity("V.S. Mukundan", "mukundan v s") == 1.0
+    assert calculate_similarity("", "Kailas S S") == 0.0
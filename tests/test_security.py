@@ -0,0 +1,25 @@
+"""Tests for auth.security."""
+
+from auth.security import hash_password, legacy_pwd_context, needs_rehash, verify_password
+
+
+def test_verify_password_accepts_legacy_bcrypt_hash():
+    legacy = legacy_pwd_context.hash("s3cret")
+
+    assert legacy.startswith("$2")
+    assert verify_password("s3cret", legacy)
+    assert not verify_password("wrong", legacy)
+    assert needs_rehash(legacy)
+
+
+def test_verify_password_accepts_argon2_hash():
+    hashed = hash_password("s3cret")
+
+    assert hashed.startswith("$argon2id$")
+    assert verify_password("s3cret", hashed)
+    assert not verify_password("wrong", hashed)
+    assert not needs_rehash(hashed)
+
+
+def test_verify_password_without_hash_is_false():
+    assert not verify_password("s3cret", None)